@@ -1,10 +1,33 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel
 
 from domain.entities.prediction import FrostLevel, PredictionModel
 
 
+class HorizonPredictionDTO(BaseModel):
+    """Hybrid frost probability of the next `hours` hours"""
+    hours: int
+    probability: float
+    frost_level: FrostLevel
+
+    class Config:
+        use_enum_values = True
+
+
+class DevicePredictionDTO(BaseModel):
+    """Hybrid prediction of one sensor node from its own series"""
+    device_id: str
+    probability: float
+    frost_level: FrostLevel
+    sarima_probability: Optional[float] = None
+    lstm_probability: Optional[float] = None
+    horizons: List[HorizonPredictionDTO] = []
+
+    class Config:
+        use_enum_values = True
+
+
 class PredictionDTO(BaseModel):
     probability: float
     frost_level: FrostLevel
@@ -12,6 +35,8 @@ class PredictionDTO(BaseModel):
     created_at: datetime
     sarima_probability: Optional[float] = None
     lstm_probability: Optional[float] = None
+    horizons: List[HorizonPredictionDTO] = []  # 1, 3, 6 and 12 hours ahead
+    devices: List[DevicePredictionDTO] = []  # Per-node predictions behind the aggregate
 
     class Config:
         use_enum_values = True
@@ -19,7 +19,8 @@ class SensorDataDTO(BaseModel):
 class LatestSensorDataResponse(BaseModel):
     """Response model for latest sensor data endpoint"""
     status: str
-    data: SensorDataDTO
+    data: SensorDataDTO  # Most recent reading across all devices
+    devices: List[SensorDataDTO] = []  # Most recent reading of each device
     last_updated: datetime
 
     class Config:
@@ -31,8 +32,17 @@ class LatestSensorDataResponse(BaseModel):
                     "humidity": 78.3,
                     "wind_speed": 3.2,
                     "timestamp": "2025-10-29T17:30:00",
-                    "device_id": "tts-sensor-01"
+                    "device_id": "nodo-lora-ud-7"
                 },
+                "devices": [
+                    {
+                        "temperature": 12.5,
+                        "humidity": 78.3,
+                        "wind_speed": 3.2,
+                        "timestamp": "2025-10-29T17:30:00",
+                        "device_id": "nodo-lora-ud-7"
+                    }
+                ],
                 "last_updated": "2025-10-29T17:30:00"
             }
         }
@@ -43,6 +53,7 @@ class AllSensorDataResponse(BaseModel):
     status: str
     data: List[SensorDataDTO]
     total_records: int
+    next_cursor: Optional[str] = None  # Pass as ?cursor= to fetch the next (older) page
 
     class Config:
         json_schema_extra = {
@@ -57,6 +68,56 @@ class AllSensorDataResponse(BaseModel):
                         "device_id": "tts-sensor-01"
                     }
                 ],
+                "total_records": 1,
+                "next_cursor": "MjAyNS0xMC0yOVQxNzozMDowMHxhYmMxMjM"
+            }
+        }
+
+
+class SensorRollupDTO(BaseModel):
+    """Aggregated readings of one device over one time bucket"""
+    bucket_start: datetime
+    device_id: str
+    reading_count: int
+    temperature_min: float
+    temperature_max: float
+    temperature_mean: float
+    humidity_min: float
+    humidity_max: float
+    humidity_mean: float
+    wind_speed_min: float
+    wind_speed_max: float
+    wind_speed_mean: float
+
+
+class SensorRollupResponse(BaseModel):
+    """Response model for the sensor data rollups endpoint"""
+    status: str
+    resolution: str
+    data: List[SensorRollupDTO]
+    total_records: int
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "status": "success",
+                "resolution": "15min",
+                "data": [
+                    {
+                        "bucket_start": "2025-10-29T17:30:00+00:00",
+                        "device_id": "nodo-lora-ud-7",
+                        "reading_count": 3,
+                        "temperature_min": 12.1,
+                        "temperature_max": 12.9,
+                        "temperature_mean": 12.5,
+                        "humidity_min": 77.0,
+                        "humidity_max": 79.5,
+                        "humidity_mean": 78.3,
+                        "wind_speed_min": 2.8,
+                        "wind_speed_max": 3.6,
+                        "wind_speed_mean": 3.2
+                    }
+                ],
                 "total_records": 1
             }
-        }
\ No newline at end of file
+        }
@@ -0,0 +1,58 @@
+import threading
+from typing import Callable, Dict, Iterable, NamedTuple
+
+from domain.services.ml_model_service import MLModelService
+
+
+class DeviceModels(NamedTuple):
+    sarima: MLModelService
+    lstm: MLModelService
+
+
+class DeviceModelRegistry:
+    """
+    One SARIMA and one LSTM model per sensor node, created on first use.
+
+    Each node's models keep their own serving state and stored artifacts, so
+    a node's forecast follows its own microclimate. The factories are expected
+    to share one model executor, which spreads the nodes' fits across its
+    worker processes.
+    """
+
+    def __init__(
+        self,
+        sarima_factory: Callable[[str], MLModelService],
+        lstm_factory: Callable[[str], MLModelService],
+    ):
+        self.sarima_factory = sarima_factory
+        self.lstm_factory = lstm_factory
+        self._models: Dict[str, DeviceModels] = {}
+        self._lock = threading.Lock()
+
+    def get(self, device_id: str) -> DeviceModels:
+        """
+        The models of a node, creating them and restoring stored artifacts on first use
+
+        Blocking (restoring reads from disk); call it off the event loop.
+        """
+        with self._lock:
+            models = self._models.get(device_id)
+            if models is None:
+                models = DeviceModels(self.sarima_factory(device_id), self.lstm_factory(device_id))
+                for service in models:
+                    try:
+                        service.restore()
+                    except Exception as e:
+                        print(f"[MODELS] Warning: Could not restore {type(service).__name__} for {device_id}: {e}")
+                self._models[device_id] = models
+            return models
+
+    def load(self, device_ids: Iterable[str]) -> None:
+        """Create and restore the models of the given nodes ahead of their first prediction"""
+        for device_id in device_ids:
+            self.get(device_id)
+
+    def devices(self) -> Dict[str, DeviceModels]:
+        """Nodes with models so far"""
+        with self._lock:
+            return dict(self._models)
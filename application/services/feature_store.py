@@ -0,0 +1,58 @@
+import threading
+from typing import Dict, Tuple
+
+import pandas as pd
+
+from domain.entities.feature_frame import FeatureFrame, FeatureWatermark
+
+
+class FeatureStore:
+    """
+    Per-node feature frames, prepared once per data watermark.
+
+    The prediction pipeline hands the same prepared frames to every model at
+    their resolution. When a run sees the same data as the previous one
+    (same nodes, time span and reading count) its frames are returned as
+    they are; otherwise only the nodes whose data changed are prepared again.
+    """
+
+    def __init__(self):
+        # Per resolution: watermark of the whole input and the frames prepared from it
+        self._prepared: Dict[str, Tuple[FeatureWatermark, Dict[str, FeatureFrame]]] = {}
+        self._lock = threading.Lock()
+
+    def prepare(self, data: pd.DataFrame, resolution: str) -> Dict[str, FeatureFrame]:
+        """
+        Feature frames per node, reusing those prepared from unchanged data
+
+        Blocking (resampling is CPU work); call it off the event loop.
+
+        Args:
+            data: Columnar frame of one or more nodes with a device_id column (raw or rollup)
+            resolution: pandas offset alias the models work at, e.g. "15min"
+
+        Returns:
+            FeatureFrame per device_id
+        """
+        watermark = FeatureWatermark.of(data)
+        with self._lock:
+            cached = self._prepared.get(resolution)
+        if cached is not None and cached[0] == watermark:
+            print(f"[FEATURES] {resolution} features unchanged, reusing {len(cached[1])} prepared frame(s)")
+            return cached[1]
+
+        previous = cached[1] if cached is not None else {}
+        features: Dict[str, FeatureFrame] = {}
+        rebuilt = 0
+        for device_id, readings in data.groupby('device_id', observed=True):
+            device_id = str(device_id)
+            frame = previous.get(device_id)
+            if frame is None or frame.watermark != FeatureWatermark.of(readings):
+                frame = FeatureFrame.from_input(readings, resolution)
+                rebuilt += 1
+            features[device_id] = frame
+        print(f"[FEATURES] Prepared {resolution} features for {rebuilt} of {len(features)} node(s)")
+
+        with self._lock:
+            self._prepared[resolution] = (watermark, features)
+        return features
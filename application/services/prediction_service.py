@@ -1,8 +1,10 @@
-from typing import Optional, List
+from typing import Dict, Optional, List
 
+from domain.entities.prediction import Prediction
 from ..use_cases.generate_frost_prediction import GenerateFrostPredictionUseCase
+from ..use_cases.retrain_models import RetrainModelsUseCase
 from ..use_cases.send_frost_alert import SendFrostAlertUseCase
-from ..dtos.prediction_dto import PredictionDTO
+from ..dtos.prediction_dto import DevicePredictionDTO, HorizonPredictionDTO, PredictionDTO
 
 
 class PredictionService:
@@ -10,9 +12,11 @@ class PredictionService:
         self,
         generate_prediction_use_case: GenerateFrostPredictionUseCase,
         send_alert_use_case: SendFrostAlertUseCase,
+        retrain_models_use_case: Optional[RetrainModelsUseCase] = None,
     ):
         self.generate_prediction_use_case = generate_prediction_use_case
         self.send_alert_use_case = send_alert_use_case
+        self.retrain_models_use_case = retrain_models_use_case
         # Expose repository for test endpoint
         self.prediction_repository = generate_prediction_use_case.prediction_repository
 
@@ -26,7 +30,35 @@ class PredictionService:
             created_at=prediction.created_at,
             sarima_probability=prediction.sarima_probability,
             lstm_probability=prediction.lstm_probability,
+            horizons=self._horizons(prediction),
+            devices=[
+                DevicePredictionDTO(
+                    device_id=device.device_id,
+                    probability=device.probability,
+                    frost_level=device.frost_level,
+                    sarima_probability=device.sarima_probability,
+                    lstm_probability=device.lstm_probability,
+                    horizons=self._horizons(device),
+                )
+                for device in prediction.device_predictions
+            ],
         )
 
+    @staticmethod
+    def _horizons(prediction: Prediction) -> List[HorizonPredictionDTO]:
+        return [
+            HorizonPredictionDTO(
+                hours=hours,
+                probability=probability,
+                frost_level=Prediction.determine_frost_level(probability),
+            )
+            for hours, probability in sorted(prediction.horizon_probabilities.items())
+        ]
+
     async def send_daily_alert(self, phone_numbers: List[str]) -> None:
-        await self.send_alert_use_case.execute(phone_numbers)
\ No newline at end of file
+        await self.send_alert_use_case.execute(phone_numbers)
+
+    async def retrain_models(self, force: bool = False) -> Dict[str, str]:
+        if self.retrain_models_use_case is None:
+            return {}
+        return await self.retrain_models_use_case.execute(force=force)
@@ -1,94 +1,142 @@
-from datetime import datetime, timedelta
-from typing import Optional, List
+import asyncio
+import base64
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, Optional, List, Tuple
 
+from domain.entities.sensor_data import SensorData
 from domain.repositories.sensor_data_repository import SensorDataRepository
 from domain.value_objects.time_range import TimeRange
-from application.dtos.sensor_data_dto import SensorDataDTO, LatestSensorDataResponse, AllSensorDataResponse
+from application.dtos.sensor_data_dto import (
+    SensorDataDTO, LatestSensorDataResponse, AllSensorDataResponse, SensorRollupDTO, SensorRollupResponse
+)
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+    pass
 
 
 class SensorDataService:
-    """Service for managing and caching latest sensor data"""
+    """Service for serving sensor data and the latest reading of every device"""
+
+    DEFAULT_PAGE_SIZE = 1000
+    MAX_PAGE_SIZE = 10000
 
     def __init__(self, sensor_data_repository: SensorDataRepository):
         self.sensor_data_repository = sensor_data_repository
-        self._cached_sensor_data: Optional[SensorDataDTO] = None
+        # Latest reading per device, pushed by the ingestion path
+        self._latest_by_device: Dict[str, SensorData] = {}
         self._last_updated: Optional[datetime] = None
+        self._loaded = False
+        self._load_lock = asyncio.Lock()
 
-    async def update_cached_sensor_data(self) -> None:
+    def record_reading(self, sensor_data: SensorData) -> None:
         """
-        Fetch latest sensor data from TTS and cache it.
-        This is called periodically by the background job.
+        Update the latest-reading map with a newly received reading.
+        Called by the ingestion service for every webhook reading once it is saved.
         """
-        try:
-            print("[SENSOR SERVICE] Fetching latest sensor data from TTS...")
-
-            # Fetch sensor data from the past hour (for latest reading)
-            now = datetime.utcnow()
-            one_hour_ago = now - timedelta(hours=1)
-            time_range = TimeRange(start=one_hour_ago, end=now)
-
-            sensor_readings = await self.sensor_data_repository.get_sensor_data_in_range(time_range)
-
-            if not sensor_readings or len(sensor_readings) == 0:
-                print("[SENSOR SERVICE] No sensor data available")
-                return
-
-            # Get the most recent reading
-            latest_reading = sensor_readings[-1]
-
-            # Cache the latest sensor data
-            self._cached_sensor_data = SensorDataDTO(
-                temperature=latest_reading.temperature,
-                humidity=latest_reading.humidity,
-                wind_speed=latest_reading.wind_speed,
-                timestamp=latest_reading.timestamp,
-                device_id="tts-sensor-calera"
-            )
+        current = self._latest_by_device.get(sensor_data.device_id)
+        if current is None or self._utc(sensor_data.timestamp) >= self._utc(current.timestamp):
+            self._latest_by_device[sensor_data.device_id] = sensor_data
             self._last_updated = datetime.utcnow()
 
-            print(f"[SENSOR SERVICE] Cached latest reading: {latest_reading.temperature}C, {latest_reading.humidity}% humidity, {latest_reading.wind_speed} m/s wind")
+    async def load_latest_readings(self) -> None:
+        """
+        Fill the latest-reading map from the database (cold start).
+        One DISTINCT ON query returns the newest reading of every device.
+        """
+        async with self._load_lock:
+            if self._loaded:
+                return
 
-        except Exception as e:
-            print(f"[SENSOR SERVICE] Error updating sensor data: {e}")
+            print("[SENSOR SERVICE] Loading latest reading per device from the database...")
+            for sensor_data in await self.sensor_data_repository.get_latest_per_device():
+                self.record_reading(sensor_data)
+            self._loaded = True
+            print(f"[SENSOR SERVICE] Latest readings loaded for {len(self._latest_by_device)} devices")
+
+    @staticmethod
+    def _utc(timestamp: datetime) -> datetime:
+        return timestamp.replace(tzinfo=timezone.utc) if timestamp.tzinfo is None else timestamp
+
+    @staticmethod
+    def _to_dto(sensor_data: SensorData) -> SensorDataDTO:
+        return SensorDataDTO(
+            temperature=sensor_data.temperature,
+            humidity=sensor_data.humidity,
+            wind_speed=sensor_data.wind_speed,
+            timestamp=sensor_data.timestamp,
+            device_id=sensor_data.device_id
+        )
 
     async def get_latest_sensor_data(self) -> LatestSensorDataResponse:
         """
-        Get the cached latest sensor data.
-        Returns the most recent cached reading.
+        Get the latest sensor data overall and per device.
+        Served from memory; the database is only queried on a cold start.
         """
-        if self._cached_sensor_data is None:
-            # If no cached data, fetch it now
-            print("[SENSOR SERVICE] No cached data, fetching now...")
-            await self.update_cached_sensor_data()
+        if not self._loaded:
+            await self.load_latest_readings()
+
+        if not self._latest_by_device:
+            raise ValueError("No sensor data available. No readings have been received yet.")
 
-        if self._cached_sensor_data is None:
-            # If still no data after fetching, TTS/Mock might have an issue
-            # Return last known state or error
-            raise ValueError("No sensor data available. TTS may not be responding.")
+        readings = sorted(self._latest_by_device.values(), key=lambda data: data.device_id)
+        latest = max(readings, key=lambda data: self._utc(data.timestamp))
 
         return LatestSensorDataResponse(
             status="success",
-            data=self._cached_sensor_data,
+            data=self._to_dto(latest),
+            devices=[self._to_dto(data) for data in readings],
             last_updated=self._last_updated or datetime.utcnow()
         )
 
-    def get_all_sensor_data(self, device_id: Optional[str] = None, limit: Optional[int] = None) -> AllSensorDataResponse:
+    @staticmethod
+    def encode_cursor(reading) -> str:
+        """Encode the (timestamp, id) keyset position of a reading as an opaque token"""
+        raw = f"{reading.timestamp.isoformat()}|{reading.id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+        """Decode a token produced by encode_cursor"""
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            timestamp, reading_id = base64.urlsafe_b64decode(padded.encode()).decode().split("|", 1)
+            return datetime.fromisoformat(timestamp), reading_id
+        except Exception:
+            raise InvalidCursorError(f"Invalid cursor: {cursor}")
+
+    async def get_all_sensor_data(
+        self,
+        device_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None
+    ) -> AllSensorDataResponse:
         """
-        Get all sensor data from the database.
-        This fetches directly from Supabase without caching.
+        Get one page of sensor data from the database, newest first.
+        Pages are keyset-paginated on (timestamp, id); follow next_cursor for older records.
 
         Args:
             device_id: Optional device ID to filter by
-            limit: Optional limit on number of records to return
+            limit: Optional page size (defaults to DEFAULT_PAGE_SIZE, capped at MAX_PAGE_SIZE)
+            cursor: Optional next_cursor token from the previous page
 
         Returns:
-            AllSensorDataResponse with all sensor data from the database
+            AllSensorDataResponse with one page of sensor data and the cursor for the next page
         """
+        after = self.decode_cursor(cursor) if cursor else None
+        page_size = max(1, min(limit or self.DEFAULT_PAGE_SIZE, self.MAX_PAGE_SIZE))
+
         try:
-            print(f"[SENSOR SERVICE] Fetching all sensor data from database (device_id={device_id}, limit={limit})...")
+            print(f"[SENSOR SERVICE] Fetching sensor data page from database (device_id={device_id}, limit={page_size}, cursor={cursor})...")
 
-            # Fetch all sensor data from the repository (which gets it from Supabase)
-            sensor_readings = self.sensor_data_repository.get_all_sensor_data(device_id=device_id, limit=limit)
+            # Fetch one extra record to know whether another page exists
+            sensor_readings = await self.sensor_data_repository.get_sensor_data_page(
+                limit=page_size + 1, after=after, device_id=device_id
+            )
+            has_more = len(sensor_readings) > page_size
+            sensor_readings = sensor_readings[:page_size]
 
             # Convert SensorData entities to DTOs
             sensor_data_dtos = [
@@ -107,9 +155,82 @@ class SensorDataService:
             return AllSensorDataResponse(
                 status="success",
                 data=sensor_data_dtos,
-                total_records=len(sensor_data_dtos)
+                total_records=len(sensor_data_dtos),
+                next_cursor=self.encode_cursor(sensor_readings[-1]) if has_more else None
             )
 
         except Exception as e:
             print(f"[SENSOR SERVICE] Error fetching all sensor data: {e}")
             raise ValueError(f"Failed to retrieve sensor data from database: {str(e)}")
+
+    def stream_sensor_data_ndjson(self, device_id: Optional[str] = None) -> Iterator[str]:
+        """
+        Export all sensor data as newline-delimited JSON with constant memory.
+        Rows come from a server-side cursor and are serialized one at a time.
+
+        Args:
+            device_id: Optional device ID to filter by
+
+        Yields:
+            One JSON document per line
+        """
+        print(f"[SENSOR SERVICE] Streaming sensor data export (device_id={device_id})...")
+        count = 0
+        for _, reading_device_id, temperature, humidity, wind_speed, timestamp in \
+                self.sensor_data_repository.iter_sensor_data(device_id=device_id):
+            count += 1
+            yield json.dumps({
+                "temperature": temperature,
+                "humidity": humidity,
+                "wind_speed": wind_speed,
+                "timestamp": timestamp.isoformat(),
+                "device_id": reading_device_id
+            }) + "\n"
+        print(f"[SENSOR SERVICE] Streamed {count} sensor data records")
+
+    async def get_sensor_data_rollups(
+        self,
+        resolution: str = "15min",
+        hours: int = 24,
+        device_id: Optional[str] = None
+    ) -> SensorRollupResponse:
+        """
+        Get pre-bucketed sensor data (min/max/mean/count per device and bucket)
+        for charts, without pulling raw readings.
+
+        Args:
+            resolution: Bucket width ("5min", "15min" or "1h")
+            hours: How many hours back from now to return
+            device_id: Optional device ID to filter by
+
+        Returns:
+            SensorRollupResponse with one record per device and bucket, oldest first
+        """
+        now = datetime.utcnow()
+        time_range = TimeRange(start=now - timedelta(hours=hours), end=now)
+        frame = await self.sensor_data_repository.get_rollup_frame(time_range, resolution, device_id=device_id)
+
+        rollups = [
+            SensorRollupDTO(
+                bucket_start=row.timestamp,
+                device_id=row.device_id,
+                reading_count=row.reading_count,
+                temperature_min=row.temperature_min,
+                temperature_max=row.temperature_max,
+                temperature_mean=row.temperature,
+                humidity_min=row.humidity_min,
+                humidity_max=row.humidity_max,
+                humidity_mean=row.humidity,
+                wind_speed_min=row.wind_speed_min,
+                wind_speed_max=row.wind_speed_max,
+                wind_speed_mean=row.wind_speed
+            )
+            for row in frame.itertuples(index=False)
+        ]
+
+        return SensorRollupResponse(
+            status="success",
+            resolution=resolution,
+            data=rollups,
+            total_records=len(rollups)
+        )
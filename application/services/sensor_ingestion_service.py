@@ -0,0 +1,172 @@
+import asyncio
+import time
+from typing import Callable, List, Optional
+
+from domain.entities.sensor_data import SensorData
+
+
+class IngestionQueueFullError(Exception):
+    """Raised when the ingestion queue is at capacity and the reading cannot be accepted"""
+    pass
+
+
+class SensorIngestionService:
+    """
+    Write-behind buffer between the TTS webhook and the database.
+
+    The webhook enqueues validated readings and returns immediately; a
+    background flusher batch-inserts them into sensor_data whenever
+    batch_size readings are waiting or flush_interval seconds have passed.
+    A batch being written is shielded from cancellation, so stop() waits for
+    it and every reading ends up flushed, retried or counted as dropped.
+    """
+
+    def __init__(
+        self,
+        sensor_repository,
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        flush_interval: float = 2.0,
+        on_reading: Optional[Callable[[SensorData], None]] = None,
+    ):
+        self.sensor_repository = sensor_repository
+        # Notified of every reading once it is saved (e.g. to keep the latest-reading map current)
+        self.on_reading = on_reading
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        # Readings taken off the queue but not yet written
+        self._batch: List[SensorData] = []
+        self._flusher_task: Optional[asyncio.Task] = None
+        # Write of the batch taken off _batch, and its size, until it completes
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flushing = 0
+
+        # Counters
+        self._queued = 0
+        self._flushed = 0
+        self._dropped = 0
+        self._failed_flushes = 0
+        self._last_flush_at: Optional[float] = None
+
+    def enqueue(self, sensor_data: SensorData) -> None:
+        """
+        Accept a reading for asynchronous storage.
+
+        Raises:
+            IngestionQueueFullError: If the queue is full (callers should apply backpressure)
+        """
+        try:
+            self._queue.put_nowait(sensor_data)
+        except asyncio.QueueFull:
+            self._dropped += 1
+            raise IngestionQueueFullError(
+                f"Ingestion queue is full ({self.max_queue_size} readings pending)"
+            )
+        self._queued += 1
+
+    async def start(self) -> None:
+        """Start the background flusher"""
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._run_flusher())
+            print(f"[INGESTION] Flusher started (batch_size={self.batch_size}, "
+                  f"flush_interval={self.flush_interval}s, max_queue_size={self.max_queue_size})")
+
+    async def stop(self) -> None:
+        """Stop the flusher and write out everything still buffered"""
+        if self._flusher_task is not None:
+            self._flusher_task.cancel()
+            try:
+                await self._flusher_task
+            except asyncio.CancelledError:
+                pass
+            self._flusher_task = None
+        if self._flush_task is not None:
+            # A write still in flight completes; on failure it puts its batch back into _batch
+            await self._flush_task
+
+        batch = self._batch + self._drain()
+        self._batch = []
+        if batch:
+            print(f"[INGESTION] Flushing {len(batch)} buffered readings before shutdown...")
+            if not await self._flush(batch):
+                self._dropped += len(self._batch)
+                print(f"[INGESTION] ✗ Lost {len(self._batch)} readings that could not be saved on shutdown")
+                self._batch = []
+
+    def _drain(self, limit: Optional[int] = None) -> List[SensorData]:
+        """Take up to limit readings that are already waiting in the queue"""
+        batch = []
+        while not self._queue.empty() and (limit is None or len(batch) < limit):
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _run_flusher(self) -> None:
+        """Collect readings into batches by size or time and flush them"""
+        while True:
+            if not self._batch:
+                # Block until the first reading arrives, then give the batch flush_interval to fill up
+                self._batch.append(await self._queue.get())
+
+            deadline = time.monotonic() + self.flush_interval
+            while len(self._batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    self._batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+                except asyncio.TimeoutError:
+                    break
+                self._batch.extend(self._drain(self.batch_size - len(self._batch)))
+
+            batch, self._batch = self._batch, []
+            if not await self._flush_shielded(batch):
+                # Back off before retrying the failed batch
+                await asyncio.sleep(self.flush_interval)
+
+    async def _flush_shielded(self, batch: List[SensorData]) -> bool:
+        """Flush a batch in a task that cancelling the flusher does not interrupt (stop() awaits it)"""
+        self._flushing = len(batch)
+        self._flush_task = asyncio.create_task(self._flush(batch))
+        self._flush_task.add_done_callback(self._flush_done)
+        return await asyncio.shield(self._flush_task)
+
+    def _flush_done(self, task: asyncio.Task) -> None:
+        self._flush_task = None
+        self._flushing = 0
+
+    async def _flush(self, batch: List[SensorData]) -> bool:
+        """Write one batch; on failure keep it for the next cycle, bounded by max_queue_size"""
+        try:
+            saved = await self.sensor_repository.save_sensor_data_batch(batch)
+            self._flushed += len(batch)
+            self._last_flush_at = time.time()
+            print(f"[INGESTION] ✓ Flushed {len(batch)} readings ({saved} rows written)")
+            if self.on_reading is not None:
+                for sensor_data in batch:
+                    self.on_reading(sensor_data)
+            return True
+        except Exception as e:
+            self._failed_flushes += 1
+            keep = batch[-self.max_queue_size:]
+            self._dropped += len(batch) - len(keep)
+            self._batch = keep + self._batch
+            print(f"[INGESTION] ✗ Flush of {len(batch)} readings failed, will retry: {e}")
+            return False
+
+    def stats(self) -> dict:
+        """Counters for monitoring the write-behind buffer"""
+        return {
+            "queued": self._queued,
+            "flushed": self._flushed,
+            "dropped": self._dropped,
+            "failed_flushes": self._failed_flushes,
+            "pending": self._queue.qsize() + len(self._batch) + self._flushing,
+            "max_queue_size": self.max_queue_size,
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "last_flush_at": self._last_flush_at,
+            "running": self._flusher_task is not None and not self._flusher_task.done(),
+        }
@@ -1,26 +1,44 @@
+import asyncio
 from datetime import datetime
 from typing import List
 
-from domain.entities.prediction import Prediction, PredictionModel, FrostLevel
-from domain.entities.sensor_data import SensorData
+from domain.entities.feature_frame import FeatureFrame
+from domain.entities.prediction import FORECAST_HORIZONS, Prediction, PredictionModel, FrostLevel
 from domain.repositories.sensor_data_repository import SensorDataRepository
 from domain.repositories.prediction_repository import PredictionRepository
-from domain.services.ml_model_service import MLModelService
 from domain.value_objects.time_range import TimeRange
+from ..services.device_model_registry import DeviceModelRegistry
+from ..services.feature_store import FeatureStore
 
 
 class GenerateFrostPredictionUseCase:
+    """
+    Forecast frost for every sensor node on its own series, then aggregate.
+
+    Each node has its own SARIMA and LSTM models (see DeviceModelRegistry).
+    All nodes are predicted concurrently, so their fits spread across the
+    model executor's workers. The stored aggregate prediction averages the
+    nodes and carries the per-node predictions. Features are prepared once
+    per run by the FeatureStore and shared by both models. Every prediction
+    also covers FORECAST_HORIZONS (1 to 12 hours ahead), all from the same
+    SARIMA forecast and LSTM pass; past SARIMA's 6-hour season the LSTM
+    predicts alone.
+    """
+
+    SARIMA_WEIGHT = 0.4
+    LSTM_WEIGHT = 0.6
+
     def __init__(
         self,
         sensor_data_repository: SensorDataRepository,
         prediction_repository: PredictionRepository,
-        sarima_service: MLModelService,
-        lstm_service: MLModelService,
+        model_registry: DeviceModelRegistry,
+        feature_store: FeatureStore,
     ):
         self.sensor_data_repository = sensor_data_repository
         self.prediction_repository = prediction_repository
-        self.sarima_service = sarima_service
-        self.lstm_service = lstm_service
+        self.model_registry = model_registry
+        self.feature_store = feature_store
 
     async def execute(self) -> Prediction:
         print("\n" + "🌡️ " + "="*56 + " 🌡️")
@@ -29,25 +47,55 @@ class GenerateFrostPredictionUseCase:
 
         print("[PREDICTION] Step 1: Fetching sensor data from last 10 days...")
         time_range = TimeRange.last_n_days(10)
-        sensor_data = await self.sensor_data_repository.get_sensor_data_in_range(time_range)
+        # Pre-bucketed per-node rollups at each model's resolution (15-min SARIMA, 5-min LSTM),
+        # so a node's 10-day series is ~960 / ~2880 rows instead of every raw uplink
+        sarima_data = await self.sensor_data_repository.get_rollup_frame(time_range, "15min")
+        lstm_data = await self.sensor_data_repository.get_rollup_frame(time_range, "5min")
 
-        if not sensor_data:
+        if sarima_data.empty or lstm_data.empty:
             raise ValueError("No sensor data available for prediction")
 
-        print(f"[PREDICTION] ✓ Retrieved {len(sensor_data)} sensor readings\n")
+        # Resampled per-node frames, memoized: unchanged data since the last run skips preparation
+        sarima_by_device = await asyncio.to_thread(self.feature_store.prepare, sarima_data, "15min")
+        lstm_by_device = await asyncio.to_thread(self.feature_store.prepare, lstm_data, "5min")
+        devices = sorted(set(sarima_by_device) & set(lstm_by_device))
 
-        print("[PREDICTION] Step 2: Running SARIMA model prediction...")
-        sarima_probability = await self.sarima_service.predict_frost_probability(sensor_data)
-        print(f"[PREDICTION] ✓ SARIMA probability: {sarima_probability:.2%}\n")
+        print(f"[PREDICTION] ✓ Retrieved {int(lstm_data['reading_count'].sum())} sensor readings "
+              f"from {len(devices)} node(s): {', '.join(devices)}\n")
 
-        print("[PREDICTION] Step 3: Running LSTM model prediction...")
-        lstm_probability = await self.lstm_service.predict_frost_probability(sensor_data)
-        print(f"[PREDICTION] ✓ LSTM probability: {lstm_probability:.2%}\n")
+        # Every node's SARIMA and LSTM run concurrently on the model executor's worker processes
+        print(f"[PREDICTION] Steps 2-3: Running SARIMA and LSTM predictions for {len(devices)} node(s) concurrently...")
+        results = await asyncio.gather(
+            *(self._predict_device(device, sarima_by_device[device], lstm_by_device[device]) for device in devices),
+            return_exceptions=True
+        )
 
-        hybrid_probability = (sarima_probability * 0.4) + (lstm_probability * 0.6)
-        print("[PREDICTION] Step 4: Calculating hybrid prediction...")
-        print(f"[PREDICTION] Hybrid formula: (SARIMA * 0.4) + (LSTM * 0.6)")
-        print(f"[PREDICTION] ✓ Hybrid probability: {hybrid_probability:.2%}\n")
+        device_predictions: List[Prediction] = []
+        for device, result in zip(devices, results):
+            if isinstance(result, Exception):
+                print(f"[PREDICTION] ✗ {device}: {result}")
+                continue
+            device_predictions.append(result)
+            print(f"[PREDICTION] ✓ {device}: SARIMA {result.sarima_probability:.2%}, "
+                  f"LSTM {result.lstm_probability:.2%}, hybrid {result.probability:.2%}")
+
+        if not device_predictions:
+            raise ValueError("No sensor node had enough data for prediction")
+
+        print("\n[PREDICTION] Step 4: Aggregating node predictions...")
+        print(f"[PREDICTION] Hybrid formula per node: (SARIMA * {self.SARIMA_WEIGHT}) + (LSTM * {self.LSTM_WEIGHT})")
+        count = len(device_predictions)
+        sarima_probability = sum(p.sarima_probability for p in device_predictions) / count
+        lstm_probability = sum(p.lstm_probability for p in device_predictions) / count
+        hybrid_probability = sum(p.probability for p in device_predictions) / count
+        horizon_probabilities = {
+            hours: sum(p.horizon_probabilities[hours] for p in device_predictions) / count
+            for hours in FORECAST_HORIZONS
+        }
+        print(f"[PREDICTION] ✓ Mean over {count} node(s): {hybrid_probability:.2%}")
+        print("[PREDICTION]   By horizon: " + ", ".join(
+            f"{hours}h {probability:.2%}" for hours, probability in horizon_probabilities.items()
+        ) + "\n")
 
         frost_level = Prediction.determine_frost_level(hybrid_probability)
 
@@ -58,6 +106,8 @@ class GenerateFrostPredictionUseCase:
             created_at=datetime.utcnow(),
             sarima_probability=sarima_probability,
             lstm_probability=lstm_probability,
+            device_predictions=device_predictions,
+            horizon_probabilities=horizon_probabilities,
         )
 
         await self.prediction_repository.save_prediction(prediction)
@@ -68,4 +118,35 @@ class GenerateFrostPredictionUseCase:
         print(f"  Probability: {hybrid_probability:.2%}")
         print("="*60 + "\n")
 
-        return prediction
\ No newline at end of file
+        return prediction
+
+    async def _predict_device(self, device_id: str, sarima_data: FeatureFrame, lstm_data: FeatureFrame) -> Prediction:
+        """Hybrid prediction of one node from its own series, for every forecast horizon"""
+        models = await asyncio.to_thread(self.model_registry.get, device_id)
+        # One SARIMA forecast and one LSTM pass cover all horizons
+        sarima_horizons, lstm_horizons = await asyncio.gather(
+            models.sarima.predict_frost_horizons(sarima_data, FORECAST_HORIZONS),
+            models.lstm.predict_frost_horizons(lstm_data, FORECAST_HORIZONS),
+        )
+        # SARIMA forecasts no further than its 6-hour season; longer horizons are the LSTM's alone
+        horizon_probabilities = {
+            hours: (
+                sarima_horizons[hours] * self.SARIMA_WEIGHT + lstm_horizons[hours] * self.LSTM_WEIGHT
+                if hours in sarima_horizons else lstm_horizons[hours]
+            )
+            for hours in FORECAST_HORIZONS
+        }
+        # The headline blends each model's own horizon (SARIMA 3 hours, LSTM 1 hour), as before
+        sarima_probability = sarima_horizons[models.sarima.HEADLINE_HORIZON]
+        lstm_probability = lstm_horizons[models.lstm.HEADLINE_HORIZON]
+        probability = sarima_probability * self.SARIMA_WEIGHT + lstm_probability * self.LSTM_WEIGHT
+        return Prediction(
+            probability=probability,
+            frost_level=Prediction.determine_frost_level(probability),
+            model_type=PredictionModel.HYBRID,
+            created_at=datetime.utcnow(),
+            sarima_probability=sarima_probability,
+            lstm_probability=lstm_probability,
+            device_id=device_id,
+            horizon_probabilities=horizon_probabilities,
+        )
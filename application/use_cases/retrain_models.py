@@ -0,0 +1,134 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+from domain.repositories.sensor_data_repository import SensorDataRepository
+from domain.services.ml_model_service import MLModelService
+from domain.value_objects.time_range import TimeRange
+from ..services.device_model_registry import DeviceModelRegistry
+
+
+class RetrainModelsUseCase:
+    """
+    Refit every sensor node's forecasting models off the request path.
+
+    A model is retrained when it has never been trained, when it is older
+    than retrain_interval, when it reports drift, or (unless it folds new
+    readings into its state itself) when at least min_new_readings readings
+    arrived after its training data ended. Each service validates its candidate and
+    keeps serving the current model until the candidate is swapped in.
+
+    A rejected or failed attempt restarts the clock: the model is retried once
+    it is retrain_interval past that attempt or min_new_readings arrived since,
+    not on every run.
+    """
+
+    def __init__(
+        self,
+        sensor_data_repository: SensorDataRepository,
+        model_registry: DeviceModelRegistry,
+        retrain_interval: timedelta = timedelta(hours=24),
+        min_new_readings: int = 2000,
+    ):
+        self.sensor_data_repository = sensor_data_repository
+        self.model_registry = model_registry
+        self.retrain_interval = retrain_interval
+        self.min_new_readings = min_new_readings
+
+    async def execute(self, force: bool = False) -> Dict[str, str]:
+        """
+        Retrain the models that are due
+
+        Args:
+            force: Retrain every model regardless of age or new data
+
+        Returns:
+            Outcome per model and node ("sarima:<device>"): "fresh", "swapped", "rejected" or "failed"
+        """
+        # Nodes that already have models plus any node that reported recently
+        device_ids = set(self.model_registry.devices())
+        try:
+            device_ids.update(data.device_id for data in await self.sensor_data_repository.get_latest_per_device())
+        except Exception as e:
+            print(f"[RETRAIN] Warning: Could not list sensor nodes: {e}")
+
+        # Same data as GenerateFrostPredictionUseCase: each node's last 10 days at each model's resolution
+        time_range = TimeRange.last_n_days(10)
+        jobs = {}
+        for device_id in sorted(device_ids):
+            models = await asyncio.to_thread(self.model_registry.get, device_id)
+            jobs[f"sarima:{device_id}"] = (models.sarima, device_id, "15min")
+            jobs[f"lstm:{device_id}"] = (models.lstm, device_id, "5min")
+
+        # Models of all nodes retrain concurrently on the model executor's worker processes
+        results = await asyncio.gather(*(
+            self._retrain(name, service, device_id, time_range, resolution, force)
+            for name, (service, device_id, resolution) in jobs.items()
+        ))
+        outcomes = dict(zip(jobs, results))
+
+        print(f"[RETRAIN] Done: {outcomes}")
+        return outcomes
+
+    async def _retrain(
+        self,
+        name: str,
+        service: MLModelService,
+        device_id: str,
+        time_range: TimeRange,
+        resolution: str,
+        force: bool
+    ) -> str:
+        """Retrain one model if it is due and return its outcome"""
+        reason = "forced" if force else await self._retrain_reason(service, device_id)
+        if reason is None:
+            return "fresh"
+
+        print(f"[RETRAIN] Retraining {name} ({reason})...")
+        service.last_retrain_attempt = datetime.utcnow()
+        try:
+            data = await self.sensor_data_repository.get_rollup_frame(time_range, resolution, device_id=device_id)
+            if data.empty:
+                raise ValueError("No sensor data available for retraining")
+            swapped = await service.retrain(data)
+            return "swapped" if swapped else "rejected"
+        except Exception as e:
+            print(f"[RETRAIN] ✗ Retraining {name} failed: {e}")
+            return "failed"
+
+    async def _retrain_reason(self, service: MLModelService, device_id: str) -> Optional[str]:
+        """Why a model is due for retraining, or None if it is fresh"""
+        if not service.is_trained or service.trained_at is None or service.training_end is None:
+            return "no trained model"
+
+        now = datetime.utcnow()
+        trained_at = self._naive_utc(service.trained_at)
+        # After a candidate was rejected or failed, the next attempt waits as if the model were trained then
+        attempted_at = self._naive_utc(service.last_retrain_attempt) if service.last_retrain_attempt else None
+        backing_off = attempted_at is not None and attempted_at > trained_at
+        if now - (attempted_at if backing_off else trained_at) >= self.retrain_interval:
+            return f"older than {self.retrain_interval}"
+
+        if service.drift_detected and not backing_off:
+            return "forecast drift detected"
+        if service.updates_incrementally:
+            return None
+
+        since = self._naive_utc(service.training_end)
+        if backing_off:
+            since = max(since, attempted_at)
+        if since >= now:
+            return None
+        recent = await self.sensor_data_repository.get_rollup_frame(
+            TimeRange(start=since, end=now), "1h", device_id=device_id
+        )
+        new_readings = int(recent['reading_count'].sum()) if not recent.empty else 0
+        if new_readings >= self.min_new_readings:
+            return f"{new_readings} new readings"
+        return None
+
+    @staticmethod
+    def _naive_utc(value: datetime) -> datetime:
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
@@ -58,6 +58,7 @@ class SendFrostAlertUseCase:
             created_at=latest_prediction.created_at,
             sarima_probability=latest_prediction.sarima_probability,
             lstm_probability=latest_prediction.lstm_probability,
+            horizon_probabilities=latest_prediction.horizon_probabilities,
         )
 
         print(f"[ALERT] Step 3: Sending WhatsApp notifications to {len(phone_numbers)} recipient(s)...")
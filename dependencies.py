@@ -1,7 +1,15 @@
+from datetime import timedelta
+from functools import cached_property
+from typing import Optional
+
 from application.services.prediction_service import PredictionService
 from application.services.farmer_service import FarmerService
 from application.services.sensor_data_service import SensorDataService
+from application.services.sensor_ingestion_service import SensorIngestionService
+from application.services.device_model_registry import DeviceModelRegistry
+from application.services.feature_store import FeatureStore
 from application.use_cases.generate_frost_prediction import GenerateFrostPredictionUseCase
+from application.use_cases.retrain_models import RetrainModelsUseCase
 from application.use_cases.send_frost_alert import SendFrostAlertUseCase
 from application.use_cases.register_farmer import RegisterFarmerUseCase
 from application.use_cases.get_all_farmers import GetAllFarmersUseCase
@@ -13,10 +21,17 @@ from infrastructure.repositories.tts_sensor_data_repository import TTSSensorData
 from infrastructure.repositories.database_sensor_data_repository import DatabaseSensorDataRepository
 from infrastructure.repositories.memory_prediction_repository import MemoryPredictionRepository
 from infrastructure.repositories.database_farmer_repository import DatabaseFarmerRepository
+from infrastructure.cache.sensor_time_series_cache import SensorTimeSeriesCache
+from infrastructure.database.connection_pool import PostgresConnectionPool
+from infrastructure.database.database_executor import DatabaseExecutor
+from infrastructure.database.migrations import SchemaMigrator
 from infrastructure.database.postgres_database import PostgresSensorDatabase
 from infrastructure.database.postgres_farmer_database import PostgresFarmerDatabase
 from infrastructure.models.sarima_model import SARIMAModelService
 from infrastructure.models.lstm_model import LSTMModelService
+from infrastructure.models.model_executor import ModelExecutor
+from infrastructure.models.backtesting import FrostBacktester
+from infrastructure.models.model_store import ModelArtifactStore
 from infrastructure.config.settings import settings
 
 from interfaces.controllers.webhook_controller import WebhookController
@@ -25,83 +40,244 @@ from interfaces.controllers.farmer_controller import FarmerController
 
 
 class DependencyContainer:
-    def __init__(self):
-        # External services
+    """
+    Application object graph, built on demand.
+
+    Every component is a cached property constructed the first time it is
+    used, so importing this module (and starting uvicorn) does no I/O and
+    creates no clients. Heavy ML libraries are imported by the model
+    services on first use or by warm_up() in the background after startup.
+    """
+
+    # External services
+    @cached_property
+    def tts_client(self) -> TTSClient:
         # Using real TTS client with configured credentials
-        self.tts_client = TTSClient()
+        return TTSClient()
 
+    @cached_property
+    def twilio_client(self) -> TwilioWhatsAppClient:
         # Using real Twilio client for WhatsApp notifications
-        self.twilio_client = TwilioWhatsAppClient()
+        return TwilioWhatsAppClient()
 
-        # Database - Always use PostgreSQL (Supabase)
+    # Database - Always use PostgreSQL (Supabase)
+    @cached_property
+    def database_pool(self) -> PostgresConnectionPool:
         if not settings.database_url:
             raise ValueError("DATABASE_URL environment variable is required. Please set it to your PostgreSQL connection string.")
 
         print("[DATABASE] Using PostgreSQL database from DATABASE_URL")
-        self.sensor_database = PostgresSensorDatabase(database_url=settings.database_url)
-        self.farmer_database = PostgresFarmerDatabase(database_url=settings.database_url)
+        # One bounded pool shared by every database class
+        return PostgresConnectionPool(
+            database_url=settings.database_url,
+            min_size=settings.database_pool_min_size,
+            max_size=settings.database_pool_max_size,
+            checkout_timeout=settings.database_pool_timeout,
+            max_lifetime=settings.database_pool_max_lifetime,
+        )
+
+    @cached_property
+    def schema_migrator(self) -> SchemaMigrator:
+        # Versioned schema migrations, applied once at startup instead of per query
+        return SchemaMigrator(self.database_pool, months_ahead=settings.database_partition_months_ahead)
+
+    @cached_property
+    def sensor_database(self) -> PostgresSensorDatabase:
+        return PostgresSensorDatabase(
+            database_url=settings.database_url, pool=self.database_pool, migrator=self.schema_migrator
+        )
+
+    @cached_property
+    def farmer_database(self) -> PostgresFarmerDatabase:
+        return PostgresFarmerDatabase(
+            database_url=settings.database_url, pool=self.database_pool, migrator=self.schema_migrator
+        )
 
-        # Repositories
+    @cached_property
+    def database_executor(self) -> DatabaseExecutor:
+        # Blocking queries run on a bounded executor sized to the pool, off the event loop
+        return DatabaseExecutor(max_workers=settings.database_pool_max_size)
+
+    @cached_property
+    def sensor_cache(self) -> Optional[SensorTimeSeriesCache]:
+        # Recent rollups kept in memory so repeat predictions only query what is new
+        return SensorTimeSeriesCache(
+            retention=timedelta(days=settings.sensor_cache_retention_days)
+        ) if settings.sensor_cache_enabled else None
+
+    # Repositories
+    @cached_property
+    def sensor_data_repository(self) -> DatabaseSensorDataRepository:
         # Use database repository for sensor data storage
-        self.sensor_data_repository = DatabaseSensorDataRepository(self.sensor_database)
-        self.prediction_repository = MemoryPredictionRepository()
-        self.farmer_repository = DatabaseFarmerRepository(self.farmer_database)  # Stores farmers in Supabase
-        
-        # ML Models
-        self.sarima_service = SARIMAModelService()
-        self.lstm_service = LSTMModelService()
-        
-        # Services
-        self.notification_service = TwilioNotificationService(self.twilio_client)
-        
-        # Use cases
-        self.generate_prediction_use_case = GenerateFrostPredictionUseCase(
+        return DatabaseSensorDataRepository(
+            self.sensor_database,
+            self.database_executor,
+            cache=self.sensor_cache,
+            cache_lateness=timedelta(minutes=settings.sensor_cache_lateness_minutes),
+        )
+
+    @cached_property
+    def prediction_repository(self) -> MemoryPredictionRepository:
+        return MemoryPredictionRepository()
+
+    @cached_property
+    def farmer_repository(self) -> DatabaseFarmerRepository:
+        return DatabaseFarmerRepository(self.farmer_database, self.database_executor)  # Stores farmers in Supabase
+
+    # ML Models
+    @cached_property
+    def model_store(self) -> ModelArtifactStore:
+        # Trained models are persisted under model_data_path and restored at startup
+        return ModelArtifactStore(settings.model_data_path, versions_kept=settings.model_versions_kept)
+
+    @cached_property
+    def model_executor(self) -> ModelExecutor:
+        # Long-lived worker processes shared by both models, so SARIMA and LSTM fit in parallel
+        return ModelExecutor(max_workers=settings.model_worker_processes)
+
+    @cached_property
+    def feature_store(self) -> FeatureStore:
+        return FeatureStore()
+
+    @cached_property
+    def model_registry(self) -> DeviceModelRegistry:
+        # One SARIMA and one LSTM per sensor node, stored as sarima-<device>/ and lstm-<device>/
+        return DeviceModelRegistry(
+            sarima_factory=lambda device_id: SARIMAModelService(
+                store=self.model_store,
+                validation_tolerance=settings.model_retrain_tolerance,
+                executor=self.model_executor,
+                drift_threshold=settings.model_drift_threshold,
+                model_name=f"{SARIMAModelService.MODEL_NAME}-{device_id}",
+                order_search=settings.sarima_order_search,
+                order_search_timeout=settings.sarima_order_search_timeout,
+                order_search_interval=timedelta(days=settings.sarima_order_search_interval_days),
+            ),
+            lstm_factory=lambda device_id: LSTMModelService(
+                store=self.model_store,
+                validation_tolerance=settings.model_retrain_tolerance,
+                executor=self.model_executor,
+                model_name=f"{LSTMModelService.MODEL_NAME}-{device_id}",
+            ),
+        )
+
+    @cached_property
+    def frost_backtester(self) -> FrostBacktester:
+        # Replays the stored per-node models with the prediction use case's blend
+        return FrostBacktester(
+            store=self.model_store,
+            executor=self.model_executor,
+            sarima_weight=GenerateFrostPredictionUseCase.SARIMA_WEIGHT,
+            lstm_weight=GenerateFrostPredictionUseCase.LSTM_WEIGHT,
+        )
+
+    # Services
+    @cached_property
+    def notification_service(self) -> TwilioNotificationService:
+        return TwilioNotificationService(self.twilio_client)
+
+    # Use cases
+    @cached_property
+    def generate_prediction_use_case(self) -> GenerateFrostPredictionUseCase:
+        return GenerateFrostPredictionUseCase(
             self.sensor_data_repository,
             self.prediction_repository,
-            self.sarima_service,
-            self.lstm_service,
+            self.model_registry,
+            self.feature_store,
+        )
+
+    @cached_property
+    def retrain_models_use_case(self) -> RetrainModelsUseCase:
+        # Background retraining with validated hot swap (scheduled hourly, acts only when due)
+        return RetrainModelsUseCase(
+            self.sensor_data_repository,
+            self.model_registry,
+            retrain_interval=timedelta(hours=settings.model_retrain_interval_hours),
+            min_new_readings=settings.model_retrain_min_new_readings,
         )
 
-        self.send_alert_use_case = SendFrostAlertUseCase(
+    @cached_property
+    def send_alert_use_case(self) -> SendFrostAlertUseCase:
+        return SendFrostAlertUseCase(
             self.prediction_repository,
             self.notification_service,
             self.farmer_repository,  # Inject farmer repository for personalized messages
         )
 
-        self.register_farmer_use_case = RegisterFarmerUseCase(
+    @cached_property
+    def register_farmer_use_case(self) -> RegisterFarmerUseCase:
+        return RegisterFarmerUseCase(
             self.farmer_repository
         )
 
-        self.get_all_farmers_use_case = GetAllFarmersUseCase(
+    @cached_property
+    def get_all_farmers_use_case(self) -> GetAllFarmersUseCase:
+        return GetAllFarmersUseCase(
             self.farmer_repository
         )
-        
-        # Application services
-        self.prediction_service = PredictionService(
+
+    # Application services
+    @cached_property
+    def prediction_service(self) -> PredictionService:
+        return PredictionService(
             self.generate_prediction_use_case,
             self.send_alert_use_case,
+            self.retrain_models_use_case,
         )
 
-        self.farmer_service = FarmerService(
+    @cached_property
+    def farmer_service(self) -> FarmerService:
+        return FarmerService(
             self.register_farmer_use_case,
             self.get_all_farmers_use_case
         )
 
-        self.sensor_data_service = SensorDataService(
+    @cached_property
+    def sensor_data_service(self) -> SensorDataService:
+        return SensorDataService(
             self.sensor_data_repository
         )
 
-        # Controllers
-        self.webhook_controller = WebhookController(
-            sensor_repository=self.sensor_data_repository  # Inject database repository to save webhook data
+    @cached_property
+    def sensor_ingestion_service(self) -> SensorIngestionService:
+        return SensorIngestionService(
+            self.sensor_data_repository,
+            max_queue_size=settings.ingestion_max_queue_size,
+            batch_size=settings.ingestion_batch_size,
+            flush_interval=settings.ingestion_flush_interval,
+            on_reading=self.sensor_data_service.record_reading,  # Pushes webhook readings to /sensor-data
+        )
+
+    # Controllers
+    @cached_property
+    def webhook_controller(self) -> WebhookController:
+        return WebhookController(
+            ingestion_service=self.sensor_ingestion_service  # Buffers webhook data and batch-saves it to the database
         )
-        self.prediction_controller = PredictionController(
+
+    @cached_property
+    def prediction_controller(self) -> PredictionController:
+        return PredictionController(
             self.prediction_service,
             self.sensor_data_service,  # Inject sensor data service
             self.farmer_repository  # Inject farmer repository for auto-sending alerts
         )
-        self.farmer_controller = FarmerController(self.farmer_service)
+
+    @cached_property
+    def farmer_controller(self) -> FarmerController:
+        return FarmerController(self.farmer_service)
+
+    def build_all(self) -> None:
+        """Construct every component now (startup benchmark, eager boot)"""
+        for name, value in vars(type(self)).items():
+            if isinstance(value, cached_property):
+                getattr(self, name)
+
+    def warm_up(self) -> None:
+        """Import the model services' heavy libraries (statsmodels, scikit-learn); blocking"""
+        SARIMAModelService.warm_up()
+        LSTMModelService.warm_up()
 
 
-# Global dependency container
-dependencies = DependencyContainer()
\ No newline at end of file
+# Global dependency container (components are built on first use)
+dependencies = DependencyContainer()
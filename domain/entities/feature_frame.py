@@ -0,0 +1,98 @@
+from typing import FrozenSet, List, NamedTuple, Optional, Union
+
+import pandas as pd
+
+from .sensor_data import SensorData
+from .sensor_data_batch import SensorDataBatch
+
+FEATURE_COLUMNS = ['temperature', 'humidity', 'wind_speed']
+
+
+class FeatureWatermark(NamedTuple):
+    """
+    Identifies the data a feature frame was prepared from.
+
+    Rollup buckets keep their start time while they fill up and the window's
+    oldest buckets drop out as it slides, so besides the device set and the
+    newest timestamp the watermark covers the oldest timestamp and the
+    number of readings.
+    """
+    devices: FrozenSet[str]
+    first_timestamp: Optional[pd.Timestamp]
+    last_timestamp: Optional[pd.Timestamp]
+    readings: int
+
+    @classmethod
+    def of(cls, frame: pd.DataFrame) -> "FeatureWatermark":
+        """Watermark of a columnar frame (raw readings or rollups)"""
+        if frame.empty:
+            return cls(frozenset(), None, None, 0)
+        devices = frozenset(map(str, frame['device_id'].unique())) if 'device_id' in frame else frozenset()
+        readings = int(frame['reading_count'].sum()) if 'reading_count' in frame else len(frame)
+        timestamps = frame['timestamp']
+        return cls(devices, timestamps.min(), timestamps.max(), readings)
+
+
+class FeatureFrame:
+    """
+    Model features resampled onto a regular grid and interpolated.
+
+    Built once from a node's readings and handed to every model that works
+    at its resolution, which then skips its own sort/resample/interpolate.
+    The frame is shared, so models must not modify it.
+    """
+
+    __slots__ = ('frame', 'resolution', 'watermark')
+
+    def __init__(self, frame: pd.DataFrame, resolution: str, watermark: FeatureWatermark):
+        self.frame = frame  # DatetimeIndex, FEATURE_COLUMNS
+        self.resolution = resolution
+        self.watermark = watermark
+
+    @classmethod
+    def from_input(
+        cls,
+        sensor_data: Union[List[SensorData], SensorDataBatch, pd.DataFrame, "FeatureFrame"],
+        resolution: str
+    ) -> "FeatureFrame":
+        """
+        Resample readings to the resolution
+
+        Args:
+            sensor_data: Entities, a SensorDataBatch, a columnar frame (raw or rollup),
+                or a FeatureFrame (returned as is when it already has the resolution)
+            resolution: pandas offset alias of the grid, e.g. "5min" or "15min"
+        """
+        if isinstance(sensor_data, FeatureFrame):
+            if sensor_data.resolution == resolution:
+                return sensor_data
+            frame = sensor_data.frame.resample(resolution).mean().interpolate()
+            return cls(frame, resolution, sensor_data.watermark)
+
+        if isinstance(sensor_data, SensorDataBatch):
+            sensor_data = sensor_data.to_frame()
+
+        if isinstance(sensor_data, pd.DataFrame):
+            # Columnar frame from the database, no per-row objects to unpack
+            source = sensor_data
+        else:
+            source = pd.DataFrame([
+                {
+                    'timestamp': data.timestamp,
+                    'device_id': data.device_id,
+                    'temperature': data.temperature,
+                    'humidity': data.humidity,
+                    'wind_speed': data.wind_speed
+                }
+                for data in sensor_data
+            ])
+
+        df = source[['timestamp'] + FEATURE_COLUMNS]
+        df = df.sort_values('timestamp')
+        df = df.set_index('timestamp')
+        df = df.resample(resolution).mean().interpolate()
+
+        return cls(df, resolution, FeatureWatermark.of(source))
+
+    def __len__(self) -> int:
+        return len(self.frame)
@@ -1,9 +1,13 @@
 from datetime import datetime
 from enum import Enum
-from typing import Optional
+from typing import Dict, List, Optional
 from uuid import UUID, uuid4
 
 
+# Hours ahead every prediction covers; both models forecast all of them in one pass
+FORECAST_HORIZONS = (1, 3, 6, 12)
+
+
 class FrostLevel(Enum):
     NO_FROST = "no_frost"
     POSSIBLE_FROST = "possible_frost"
@@ -17,6 +21,9 @@ class PredictionModel(Enum):
 
 
 class Prediction:
+    POSSIBLE_FROST_THRESHOLD = 0.30  # Probabilities from here up are at least possible frost
+    FROST_EXPECTED_THRESHOLD = 0.70  # ...and above this frost is expected
+
     def __init__(
         self,
         probability: float,
@@ -26,6 +33,9 @@ class Prediction:
         sarima_probability: Optional[float] = None,
         lstm_probability: Optional[float] = None,
         id: Optional[UUID] = None,
+        device_id: Optional[str] = None,
+        device_predictions: Optional[List["Prediction"]] = None,
+        horizon_probabilities: Optional[Dict[int, float]] = None,
     ):
         self.id = id or uuid4()
         self.probability = probability
@@ -34,12 +44,16 @@ class Prediction:
         self.created_at = created_at
         self.sarima_probability = sarima_probability
         self.lstm_probability = lstm_probability
+        self.device_id = device_id  # Set on per-node predictions
+        self.device_predictions = device_predictions or []  # Per-node results behind an aggregate
+        # Hybrid frost probability of the next N hours, keyed by N (FORECAST_HORIZONS)
+        self.horizon_probabilities = horizon_probabilities or {}
 
     @classmethod
     def determine_frost_level(cls, probability: float) -> FrostLevel:
-        if probability > 0.70:
+        if probability > cls.FROST_EXPECTED_THRESHOLD:
             return FrostLevel.FROST_EXPECTED
-        elif probability < 0.30:
+        elif probability < cls.POSSIBLE_FROST_THRESHOLD:
             return FrostLevel.NO_FROST
         else:
             return FrostLevel.POSSIBLE_FROST
@@ -1,9 +1,30 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID, uuid5
+
+# Namespace for reading ids derived from the uplink that produced them
+READING_ID_NAMESPACE = UUID("5c1d3f6e-8a4b-4f2e-9d7a-3b6c0e1f2a90")
+
+
+def reading_id(device_id: str, received_at: datetime, f_cnt: Optional[int] = None) -> UUID:
+    """
+    Deterministic id of the reading a device sent at received_at.
+
+    The same uplink always maps to the same id, so webhook retries and
+    re-imports of a TTS export update the stored reading instead of adding
+    a new one. Naive timestamps are taken as UTC.
+    """
+    if received_at.tzinfo is None:
+        received_at = received_at.replace(tzinfo=timezone.utc)
+    received_at = received_at.astimezone(timezone.utc)
+    key = f"{device_id}|{received_at.isoformat()}|{'' if f_cnt is None else f_cnt}"
+    return uuid5(READING_ID_NAMESPACE, key)
 
 
 class SensorData:
+    # No per-instance __dict__; bulk paths should prefer SensorDataBatch
+    __slots__ = ('id', 'temperature', 'humidity', 'wind_speed', 'timestamp', 'device_id', 'f_cnt')
+
     def __init__(
         self,
         temperature: float,
@@ -12,13 +33,15 @@ class SensorData:
         timestamp: datetime,
         device_id: str,
         id: Optional[UUID] = None,
+        f_cnt: Optional[int] = None,
     ):
-        self.id = id or uuid4()
+        self.id = id or reading_id(device_id, timestamp, f_cnt)
         self.temperature = temperature
         self.humidity = humidity
         self.wind_speed = wind_speed
         self.timestamp = timestamp
         self.device_id = device_id
+        self.f_cnt = f_cnt  # LoRaWAN uplink frame counter, when known
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, SensorData):
@@ -26,4 +49,4 @@ class SensorData:
         return self.id == other.id
 
     def __hash__(self) -> int:
-        return hash(self.id)
\ No newline at end of file
+        return hash(self.id)
@@ -1,11 +1,77 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+import pandas as pd
 
 from ..entities.sensor_data import SensorData
+from ..entities.sensor_data_batch import SensorDataBatch
 from ..value_objects.time_range import TimeRange
 
 
 class SensorDataRepository(ABC):
     @abstractmethod
     async def get_sensor_data_in_range(self, time_range: TimeRange) -> List[SensorData]:
-        pass
\ No newline at end of file
+        pass
+
+    async def get_sensor_frame_in_range(self, time_range: TimeRange) -> pd.DataFrame:
+        """
+        Columnar variant of get_sensor_data_in_range used by the prediction pipeline.
+
+        The default builds the frame from entities; database-backed repositories
+        override it with a direct columnar fetch.
+        """
+        sensor_data = await self.get_sensor_data_in_range(time_range)
+        return SensorDataBatch.from_readings(sensor_data).sorted_by_time().to_frame()
+
+    async def get_sensor_batch_in_range(self, time_range: TimeRange) -> SensorDataBatch:
+        """
+        Array-backed variant of get_sensor_data_in_range for bulk consumers.
+
+        The default wraps the columnar frame without copying its columns.
+        """
+        frame = await self.get_sensor_frame_in_range(time_range)
+        return SensorDataBatch.from_frame(frame)
+
+    async def get_latest_per_device(self) -> List[SensorData]:
+        """
+        Most recent reading of every device.
+
+        The default scans the last day; database-backed repositories
+        override it with a single DISTINCT ON query.
+        """
+        now = datetime.utcnow()
+        latest: Dict[str, SensorData] = {}
+        for data in await self.get_sensor_data_in_range(TimeRange(start=now - timedelta(days=1), end=now)):
+            current = latest.get(data.device_id)
+            if current is None or data.timestamp > current.timestamp:
+                latest[data.device_id] = data
+        return list(latest.values())
+
+    async def get_rollup_frame(
+        self,
+        time_range: TimeRange,
+        resolution: str,
+        device_id: Optional[str] = None,
+        combine_devices: bool = False
+    ) -> pd.DataFrame:
+        """
+        Sensor data bucketed to resolution ("5min", "15min", "1h") with
+        min/max/mean/count per bucket and device (or across devices).
+
+        The default resamples the raw frame; database-backed repositories
+        override it by reading pre-computed rollups.
+        """
+        frame = await self.get_sensor_frame_in_range(time_range)
+        if device_id:
+            frame = frame[frame['device_id'] == device_id]
+
+        keys = [pd.Grouper(key='timestamp', freq=resolution)]
+        if not combine_devices:
+            keys.append('device_id')
+
+        grouped = frame.groupby(keys, observed=True)
+        rollup = grouped[['temperature', 'humidity', 'wind_speed']].agg(['min', 'max', 'mean'])
+        rollup.columns = [m if stat == 'mean' else f"{m}_{stat}" for m, stat in rollup.columns]
+        rollup.insert(0, 'reading_count', grouped.size())
+        return rollup.reset_index()
@@ -1,14 +1,67 @@
 from abc import ABC, abstractmethod
-from typing import List
+from datetime import datetime
+from typing import Dict, List, Optional, Sequence, Union
 
+import pandas as pd
+
+from ..entities.feature_frame import FeatureFrame
+from ..entities.prediction import FORECAST_HORIZONS
 from ..entities.sensor_data import SensorData
+from ..entities.sensor_data_batch import SensorDataBatch
+
+# Models accept entities, a SensorDataBatch, a columnar frame (raw or rollup),
+# or a FeatureFrame already prepared at their resolution
+SensorInput = Union[List[SensorData], SensorDataBatch, pd.DataFrame, FeatureFrame]
 
 
 class MLModelService(ABC):
+    is_trained: bool = False
+    trained_at: Optional[datetime] = None  # When the serving model was installed
+    training_end: Optional[datetime] = None  # Newest data point the serving model was fitted on
+    last_retrain_attempt: Optional[datetime] = None  # When a replacement was last fitted, swapped in or not
+    # Models that fold new readings into their state between refits only need
+    # refitting on schedule or when their recent errors show drift
+    updates_incrementally: bool = False
+    drift_detected: bool = False
+    HEADLINE_HORIZON: int = 1  # Hours ahead predict_frost_probability covers
+
     @abstractmethod
-    async def predict_frost_probability(self, sensor_data: List[SensorData]) -> float:
+    async def predict_frost_horizons(
+        self,
+        sensor_data: SensorInput,
+        horizons: Sequence[int] = FORECAST_HORIZONS
+    ) -> Dict[int, float]:
+        """
+        Frost probability of the next N hours for every N in horizons, from a single model pass
+
+        Horizons the model cannot forecast meaningfully are left out of the result;
+        the headline horizon is always included.
+        """
         pass
 
+    async def predict_frost_probability(self, sensor_data: SensorInput) -> float:
+        """Frost probability of the model's headline horizon"""
+        return (await self.predict_frost_horizons(sensor_data, (self.HEADLINE_HORIZON,)))[self.HEADLINE_HORIZON]
+
     @abstractmethod
-    async def train_model(self, sensor_data: List[SensorData]) -> None:
-        pass
\ No newline at end of file
+    async def train_model(self, sensor_data: SensorInput) -> None:
+        pass
+
+    def warm_up(self) -> None:
+        """Load heavy libraries ahead of the first prediction; imports are otherwise deferred"""
+        pass
+
+    def restore(self) -> bool:
+        """Restore previously trained state (e.g. from disk); returns True if a model is ready"""
+        return False
+
+    @abstractmethod
+    async def retrain(self, sensor_data: SensorInput) -> bool:
+        """
+        Fit a replacement model without interrupting the serving one, validate it
+        on recent data and swap it in if it passes.
+
+        Returns:
+            True if the replacement is now serving
+        """
+        pass
@@ -0,0 +1,3 @@
+from .sensor_time_series_cache import SensorTimeSeriesCache
+
+__all__ = ['SensorTimeSeriesCache']
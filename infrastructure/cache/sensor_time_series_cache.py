@@ -0,0 +1,146 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+import pandas as pd
+
+
+def _utc(value: datetime) -> pd.Timestamp:
+    """Timezone-aware UTC timestamp (naive values are taken as UTC)"""
+    value = pd.Timestamp(value)
+    if value.tzinfo is None:
+        return value.tz_localize(timezone.utc)
+    return value.tz_convert(timezone.utc)
+
+
+class SensorTimeSeriesCache:
+    """
+    Process-local sliding window of recent rollup buckets, one frame per resolution.
+
+    The prediction pipeline and retraining read every node's last 10 days of
+    rollups at each model's resolution. Each resolution's window is seeded
+    once from sensor_data_rollups and then kept current by "since the
+    watermark" delta queries, which return every bucket from the watermark's
+    bucket on; those replace the cached tail, so buckets still filling up are
+    always the database's latest. Buckets older than the retention window are
+    evicted from the left.
+
+    Frames have the columns of PostgresSensorDatabase.get_rollup_frame (not
+    combined) and are ordered by timestamp, then device_id. Cached frames are
+    replaced, never modified in place, and reads return new frames. The cache
+    is not thread-safe: it is owned by the repository and used from the event
+    loop.
+    """
+
+    def __init__(self, retention: timedelta = timedelta(days=11)):
+        self.retention = retention
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._covered_from: Dict[str, pd.Timestamp] = {}  # Cache holds every bucket from here on
+        self._watermarks: Dict[str, pd.Timestamp] = {}  # When each resolution last caught up with the database
+        self.hits = 0
+        self.misses = 0
+
+    def is_seeded(self, resolution: str) -> bool:
+        return resolution in self._frames
+
+    def watermark(self, resolution: str) -> Optional[datetime]:
+        watermark = self._watermarks.get(resolution)
+        return watermark.to_pydatetime() if watermark is not None else None
+
+    def can_serve(self, resolution: str, start: datetime, now: Optional[datetime] = None) -> bool:
+        """Whether a range starting at start lies inside the window (seeded or not yet)"""
+        start = _utc(start)
+        if self.is_seeded(resolution):
+            return start >= self._covered_from[resolution]
+        now = _utc(now) if now else pd.Timestamp.now(tz=timezone.utc)
+        return start >= now - self.retention
+
+    def seed(self, resolution: str, frame: pd.DataFrame, covered_from: datetime, synced_at: datetime) -> None:
+        """Replace a resolution's window with a full load"""
+        self._frames[resolution] = frame.reset_index(drop=True)
+        self._covered_from[resolution] = _utc(covered_from)
+        self._watermarks[resolution] = _utc(synced_at)
+
+    def merge(self, resolution: str, frame: pd.DataFrame, since: datetime, synced_at: datetime) -> int:
+        """
+        Replace every cached bucket from since's bucket on with a delta query's result
+
+        Args:
+            resolution: Bucket width of frame
+            frame: Every bucket starting at or after since's bucket, all devices
+            since: Start of the delta query
+            synced_at: When the delta query was issued
+
+        Returns:
+            Number of buckets fetched
+        """
+        cached = self._frames[resolution]
+        cut = int(cached['timestamp'].searchsorted(_utc(since).floor(resolution), side='left'))
+        # The delta starts at that same bucket, so the merged frame stays ordered
+        merged = pd.concat([cached.iloc[:cut], frame], ignore_index=True)
+        merged['device_id'] = merged['device_id'].astype('category')
+        self._frames[resolution] = merged
+        self._watermarks[resolution] = _utc(synced_at)
+        return len(frame)
+
+    def evict(self, now: Optional[datetime] = None) -> int:
+        """Drop buckets older than the retention window and return how many were dropped"""
+        cutoff = (_utc(now) if now else pd.Timestamp.now(tz=timezone.utc)) - self.retention
+        evicted = 0
+        for resolution, frame in self._frames.items():
+            first = int(frame['timestamp'].searchsorted(cutoff, side='left'))
+            if first:
+                self._frames[resolution] = frame.iloc[first:].reset_index(drop=True)
+                evicted += first
+            self._covered_from[resolution] = max(self._covered_from[resolution], cutoff)
+        return evicted
+
+    def get_frame(
+        self,
+        resolution: str,
+        start: datetime,
+        end: datetime,
+        device_id: Optional[str] = None
+    ) -> pd.DataFrame:
+        """
+        Buckets of the range, as PostgresSensorDatabase.get_rollup_frame returns them
+
+        Args:
+            resolution: Bucket width
+            start: Start of the time range (its bucket is included)
+            end: End of the time range
+            device_id: Optional device ID to filter by
+
+        Returns:
+            DataFrame with one row per bucket and device, oldest first
+        """
+        frame = self._frames[resolution]
+        timestamps = frame['timestamp']
+        lower = int(timestamps.searchsorted(_utc(start).floor(resolution), side='left'))
+        upper = int(timestamps.searchsorted(_utc(end), side='right'))
+        frame = frame.iloc[lower:upper]
+        if device_id:
+            frame = frame[frame['device_id'] == device_id]
+        return frame.reset_index(drop=True)
+
+    def clear(self) -> None:
+        self._frames.clear()
+        self._covered_from.clear()
+        self._watermarks.clear()
+
+    def stats(self) -> dict:
+        """Window bounds, per-device bucket counts and hit counters for the health endpoint"""
+        return {
+            "resolutions": {
+                resolution: {
+                    "covered_from": self._covered_from[resolution].isoformat(),
+                    "watermark": self._watermarks[resolution].isoformat(),
+                    "buckets": {
+                        str(device): int(count)
+                        for device, count in frame['device_id'].value_counts(sort=False).items() if count
+                    },
+                }
+                for resolution, frame in self._frames.items()
+            },
+            "hits": self.hits,
+            "misses": self.misses,
+        }
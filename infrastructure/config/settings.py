@@ -5,6 +5,21 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     # Database Configuration
     database_url: Optional[str] = None
+    database_pool_min_size: int = 1
+    database_pool_max_size: int = 10
+    database_pool_timeout: float = 30.0  # Seconds to wait for a free connection
+    database_pool_max_lifetime: float = 1800.0  # Recycle connections older than this (seconds)
+    database_partition_months_ahead: int = 3  # Monthly sensor_data partitions created in advance
+
+    # Webhook Ingestion Configuration
+    ingestion_max_queue_size: int = 10000  # Readings buffered before the webhook answers 429
+    ingestion_batch_size: int = 500
+    ingestion_flush_interval: float = 2.0  # Seconds
+
+    # Sensor Time-Series Cache Configuration
+    sensor_cache_enabled: bool = True
+    sensor_cache_retention_days: int = 11  # Must exceed the 10-day prediction window
+    sensor_cache_lateness_minutes: int = 60  # Overlap re-read by each delta query
 
     # The Things Stack Configuration
     tts_application_id: str
@@ -23,7 +38,17 @@ class Settings(BaseSettings):
     debug: bool = False
 
     # Model Configuration
-    model_data_path: str = "./models"
+    model_data_path: str = "./models"  # Versioned model artifacts, loaded at startup
+    model_versions_kept: int = 3
+    model_retrain_interval_hours: float = 24.0  # Retrain when the serving model is this old...
+    model_retrain_min_new_readings: int = 2000  # ...or when this many readings arrived since its training data
+    model_retrain_tolerance: float = 0.1  # Candidate may be at most 10% worse on the holdout
+    model_drift_threshold: float = 2.0  # Refit SARIMA when recent one-step errors exceed this multiple of in-sample
+    model_worker_processes: int = 2  # Processes fitting models in parallel; 0 fits on a thread in the API process
+    startup_warm_up: bool = True  # Import ML libraries in the background once the app is serving
+    sarima_order_search: bool = False  # Select SARIMA orders from a candidate grid when retraining
+    sarima_order_search_timeout: float = 300.0  # Seconds before a candidate fit is abandoned
+    sarima_order_search_interval_days: float = 7.0  # Search again once the selection is this old
     
     class Config:
         env_file = ".env"
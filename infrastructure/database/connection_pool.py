@@ -0,0 +1,253 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Optional, Tuple
+
+import psycopg2
+from psycopg2 import extensions
+
+
+class PoolTimeoutError(Exception):
+    """Raised when no connection becomes available within the checkout timeout"""
+    pass
+
+
+class PostgresConnectionPool:
+    """
+    Bounded, thread-safe pool of PostgreSQL connections.
+
+    A single instance is owned by the DependencyContainer and shared by
+    PostgresSensorDatabase and PostgresFarmerDatabase, so queries reuse open
+    connections instead of paying a TCP/TLS handshake to Supabase every time.
+
+    Connections are opened lazily (the app must start without a reachable
+    database), health-checked on checkout and recycled when broken or too old.
+    """
+
+    def __init__(
+        self,
+        database_url: str,
+        min_size: int = 1,
+        max_size: int = 10,
+        checkout_timeout: float = 30.0,
+        max_lifetime: float = 1800.0,
+        health_check_interval: float = 30.0,
+        connect_timeout: int = 10,
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Pool size must satisfy 0 <= min_size <= max_size and max_size >= 1")
+
+        self.database_url = database_url
+        # Add connection timeout to prevent hanging
+        if 'connect_timeout=' not in self.database_url:
+            separator = '&' if '?' in self.database_url else '?'
+            self.database_url += f'{separator}connect_timeout={connect_timeout}'
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.checkout_timeout = checkout_timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+
+        # Idle connections as (connection, created_at, last_used_at)
+        self._idle: Deque[Tuple[extensions.connection, float, float]] = deque()
+        self._created_at: Dict[int, float] = {}
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_size)
+        self._closed = False
+        self._warmed_up = False
+
+        # Usage statistics
+        self._checkouts = 0
+        self._connections_created = 0
+        self._connections_recycled = 0
+        self._failed_health_checks = 0
+        self._timeouts = 0
+        self._total_wait_time = 0.0
+        self._max_wait_time = 0.0
+
+    def _connect(self) -> extensions.connection:
+        """Open a new physical connection"""
+        conn = psycopg2.connect(self.database_url)
+        with self._lock:
+            self._created_at[id(conn)] = time.monotonic()
+            self._connections_created += 1
+        return conn
+
+    def _discard(self, conn: extensions.connection) -> None:
+        """Close a connection and forget about it"""
+        with self._lock:
+            self._created_at.pop(id(conn), None)
+            self._connections_recycled += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+
+    def _warm_up(self) -> None:
+        """Open min_size connections the first time the pool is used"""
+        with self._lock:
+            if self._warmed_up:
+                return
+            self._warmed_up = True
+            missing = self.min_size - len(self._created_at)
+
+        for _ in range(max(0, missing)):
+            try:
+                conn = self._connect()
+            except Exception as e:
+                print(f"[DB POOL] Warning: Could not pre-open connection: {e}")
+                break
+            now = time.monotonic()
+            with self._lock:
+                self._idle.append((conn, now, now))
+
+    def _is_healthy(self, conn: extensions.connection, created_at: float, last_used_at: float) -> bool:
+        """Check a pooled connection before handing it out"""
+        now = time.monotonic()
+        if conn.closed:
+            return False
+        if self.max_lifetime and now - created_at > self.max_lifetime:
+            return False
+        if conn.info.transaction_status != extensions.TRANSACTION_STATUS_IDLE:
+            return False
+
+        # Connections that sat idle for a while may have been dropped by the server or pooler
+        if now - last_used_at >= self.health_check_interval:
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                conn.rollback()
+            except Exception:
+                with self._lock:
+                    self._failed_health_checks += 1
+                return False
+
+        return True
+
+    def getconn(self) -> extensions.connection:
+        """Check out a healthy connection, blocking up to checkout_timeout when the pool is exhausted"""
+        if self._closed:
+            raise RuntimeError("Connection pool is closed")
+
+        self._warm_up()
+
+        wait_start = time.monotonic()
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            with self._lock:
+                self._timeouts += 1
+            raise PoolTimeoutError(
+                f"No database connection available after {self.checkout_timeout:.1f}s "
+                f"(max_size={self.max_size})"
+            )
+        wait_time = time.monotonic() - wait_start
+
+        try:
+            conn = None
+            while conn is None:
+                with self._lock:
+                    entry = self._idle.pop() if self._idle else None
+
+                if entry is None:
+                    conn = self._connect()
+                elif self._is_healthy(*entry):
+                    conn = entry[0]
+                else:
+                    self._discard(entry[0])
+        except Exception:
+            self._slots.release()
+            raise
+
+        with self._lock:
+            self._checkouts += 1
+            self._total_wait_time += wait_time
+            self._max_wait_time = max(self._max_wait_time, wait_time)
+
+        return conn
+
+    def putconn(self, conn: extensions.connection) -> None:
+        """Return a connection to the pool, recycling it if it is no longer usable"""
+        try:
+            if self._closed or conn.closed:
+                self._discard(conn)
+                return
+
+            status = conn.info.transaction_status
+            if status == extensions.TRANSACTION_STATUS_UNKNOWN:
+                self._discard(conn)
+                return
+            if status != extensions.TRANSACTION_STATUS_IDLE:
+                try:
+                    conn.rollback()
+                except Exception:
+                    self._discard(conn)
+                    return
+
+            with self._lock:
+                created_at = self._created_at.get(id(conn), time.monotonic())
+                self._idle.append((conn, created_at, time.monotonic()))
+        finally:
+            self._slots.release()
+
+    @contextmanager
+    def connection(self):
+        """Context manager that commits on success, rolls back on error and returns the connection"""
+        conn = self.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+            raise
+        finally:
+            self.putconn(conn)
+
+    def close(self) -> None:
+        """Close all idle connections and refuse new checkouts"""
+        self._closed = True
+        with self._lock:
+            idle = list(self._idle)
+            self._idle.clear()
+        for conn, _, _ in idle:
+            self._discard(conn)
+        print("[DB POOL] Connection pool closed")
+
+    def stats(self) -> dict:
+        """Snapshot of pool usage for monitoring"""
+        with self._lock:
+            size = len(self._created_at)
+            idle = len(self._idle)
+            return {
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                "size": size,
+                "idle": idle,
+                "in_use": size - idle,
+                "checkouts": self._checkouts,
+                "connections_created": self._connections_created,
+                "connections_recycled": self._connections_recycled,
+                "failed_health_checks": self._failed_health_checks,
+                "checkout_timeouts": self._timeouts,
+                "avg_wait_ms": round(self._total_wait_time / self._checkouts * 1000, 2) if self._checkouts else 0.0,
+                "max_wait_ms": round(self._max_wait_time * 1000, 2),
+                "closed": self._closed,
+            }
+
+
+_default_pools: Dict[str, PostgresConnectionPool] = {}
+_default_pools_lock = threading.Lock()
+
+
+def get_default_pool(database_url: str) -> PostgresConnectionPool:
+    """Process-wide pool for callers (e.g. scripts) that do not receive one from the container"""
+    with _default_pools_lock:
+        pool: Optional[PostgresConnectionPool] = _default_pools.get(database_url)
+        if pool is None or pool.stats()["closed"]:
+            pool = PostgresConnectionPool(database_url, min_size=0, max_size=4)
+            _default_pools[database_url] = pool
+        return pool
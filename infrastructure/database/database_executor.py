@@ -0,0 +1,28 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+
+class DatabaseExecutor:
+    """
+    Dedicated, bounded thread pool for blocking psycopg2 calls.
+
+    Async repositories await their database calls through this executor so a
+    slow Supabase query never runs on the event loop. It is sized to the
+    connection pool, so a worker thread never has to wait for a connection.
+    """
+
+    def __init__(self, max_workers: int = 10):
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="db-worker")
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a blocking database call in the executor and await its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and wait for in-flight queries"""
+        self._executor.shutdown(wait=wait)
+        print("[DB EXECUTOR] Database executor stopped")
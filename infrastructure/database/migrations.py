@@ -0,0 +1,222 @@
+import threading
+from datetime import datetime, timezone
+from typing import Callable, List, NamedTuple
+
+from .connection_pool import PostgresConnectionPool
+from .partitions import add_months, create_month_partitions, month_start
+from .rollups import create_rollup_table, refresh_rollups
+
+
+class Migration(NamedTuple):
+    version: int
+    name: str
+    apply: Callable  # Receives an open cursor; runs inside the migration transaction
+
+
+def _baseline_schema(cursor) -> None:
+    """Tables as originally created by the database classes"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sensor_data (
+            id TEXT PRIMARY KEY,
+            device_id TEXT NOT NULL,
+            temperature REAL NOT NULL,
+            humidity REAL NOT NULL,
+            wind_speed REAL NOT NULL,
+            timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_timestamp ON sensor_data(timestamp)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_device_id ON sensor_data(device_id)")
+
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS farmers (
+            phone_number TEXT PRIMARY KEY,
+            first_name TEXT NOT NULL,
+            last_name TEXT NOT NULL,
+            lot_address TEXT NOT NULL,
+            registered_at TIMESTAMP WITH TIME ZONE NOT NULL
+        )
+    """)
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_farmers_registered_at ON farmers(registered_at)")
+
+
+def _partition_sensor_data(cursor) -> None:
+    """
+    Move sensor_data to monthly range partitions on timestamp.
+
+    The primary key must include the partition key, so it becomes
+    (id, timestamp). Every query filters on device and time, which the
+    composite (device_id, timestamp) index serves; (timestamp, id) backs
+    time-ordered scans and keyset pagination.
+    """
+    cursor.execute("SELECT relkind FROM pg_class WHERE oid = to_regclass('sensor_data')")
+    row = cursor.fetchone()
+    if row and row[0] == 'p':
+        return  # Already partitioned
+
+    cursor.execute("ALTER TABLE sensor_data RENAME TO sensor_data_legacy")
+    cursor.execute("ALTER TABLE sensor_data_legacy RENAME CONSTRAINT sensor_data_pkey TO sensor_data_legacy_pkey")
+
+    cursor.execute("""
+        CREATE TABLE sensor_data (
+            id TEXT NOT NULL,
+            device_id TEXT NOT NULL,
+            temperature REAL NOT NULL,
+            humidity REAL NOT NULL,
+            wind_speed REAL NOT NULL,
+            timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL,
+            PRIMARY KEY (id, timestamp)
+        ) PARTITION BY RANGE (timestamp)
+    """)
+    cursor.execute("CREATE INDEX idx_sensor_data_device_timestamp ON sensor_data (device_id, timestamp)")
+    cursor.execute("CREATE INDEX idx_sensor_data_timestamp_id ON sensor_data (timestamp, id)")
+
+    # One partition per month of existing history
+    cursor.execute("SELECT MIN(timestamp), MAX(timestamp) FROM sensor_data_legacy")
+    first, last = cursor.fetchone()
+    if first is not None:
+        month, last_month = month_start(first), month_start(last)
+        months = []
+        while month <= last_month:
+            months.append(month)
+            month = add_months(month, 1)
+        create_month_partitions(cursor, months)
+
+    cursor.execute("""
+        INSERT INTO sensor_data (id, device_id, temperature, humidity, wind_speed, timestamp, created_at)
+        SELECT id, device_id, temperature, humidity, wind_speed, timestamp, created_at
+        FROM sensor_data_legacy
+    """)
+    print(f"[MIGRATIONS] Moved {cursor.rowcount} rows into partitioned sensor_data")
+    cursor.execute("DROP TABLE sensor_data_legacy")
+
+
+def _sensor_data_rollups(cursor) -> None:
+    """Per-device 5-min / 15-min / hourly rollups, backfilled from existing history"""
+    create_rollup_table(cursor)
+    written = refresh_rollups(cursor)
+    print(f"[MIGRATIONS] Backfilled {written} rollup buckets")
+
+
+def _deduplicate_sensor_data(cursor) -> None:
+    """
+    Remove duplicate readings and make (device_id, timestamp) unique.
+
+    Readings used to get a random id, so webhook retries and re-imports
+    stored the same uplink several times. The earliest stored copy is kept.
+    The unique constraint includes the partition key, as partitioned tables
+    require, and replaces the plain (device_id, timestamp) index.
+    """
+    cursor.execute("ALTER TABLE sensor_data ADD COLUMN IF NOT EXISTS f_cnt INTEGER")
+
+    cursor.execute("""
+        DELETE FROM sensor_data d
+        USING (
+            SELECT id, timestamp,
+                   ROW_NUMBER() OVER (PARTITION BY device_id, timestamp ORDER BY created_at, id) AS copy
+            FROM sensor_data
+        ) duplicate
+        WHERE duplicate.copy > 1
+          AND d.id = duplicate.id
+          AND d.timestamp = duplicate.timestamp
+    """)
+    removed = cursor.rowcount
+    print(f"[MIGRATIONS] Removed {removed} duplicate sensor readings")
+
+    cursor.execute("""
+        ALTER TABLE sensor_data
+        ADD CONSTRAINT sensor_data_device_timestamp_key UNIQUE (device_id, timestamp)
+    """)
+    cursor.execute("DROP INDEX IF EXISTS idx_sensor_data_device_timestamp")
+
+    if removed:
+        refresh_rollups(cursor)
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "baseline_schema", _baseline_schema),
+    Migration(2, "partition_sensor_data_by_month", _partition_sensor_data),
+    Migration(3, "sensor_data_rollups", _sensor_data_rollups),
+    Migration(4, "deduplicate_sensor_data", _deduplicate_sensor_data),
+]
+
+
+class SchemaMigrator:
+    """
+    Applies versioned schema migrations recorded in schema_migrations.
+
+    Migrations run once per database, inside one transaction guarded by an
+    advisory lock so concurrent workers cannot race. After migrating, the
+    current and next months_ahead monthly partitions are created.
+    """
+
+    ADVISORY_LOCK_ID = 7273001
+
+    def __init__(self, pool: PostgresConnectionPool, months_ahead: int = 3):
+        self.pool = pool
+        self.months_ahead = months_ahead
+        self._up_to_date = False
+        self._lock = threading.Lock()
+
+    def migrate(self) -> List[int]:
+        """Apply pending migrations and return the versions applied"""
+        if self._up_to_date:
+            return []
+
+        with self._lock:
+            if self._up_to_date:
+                return []
+
+            applied_now = []
+            with self.pool.connection() as conn:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT pg_advisory_xact_lock(%s)", (self.ADVISORY_LOCK_ID,))
+                    cursor.execute("""
+                        CREATE TABLE IF NOT EXISTS schema_migrations (
+                            version INTEGER PRIMARY KEY,
+                            name TEXT NOT NULL,
+                            applied_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW()
+                        )
+                    """)
+                    cursor.execute("SELECT version FROM schema_migrations")
+                    applied = {row[0] for row in cursor.fetchall()}
+
+                    for migration in MIGRATIONS:
+                        if migration.version in applied:
+                            continue
+                        print(f"[MIGRATIONS] Applying {migration.version:03d}_{migration.name}...")
+                        migration.apply(cursor)
+                        cursor.execute(
+                            "INSERT INTO schema_migrations (version, name) VALUES (%s, %s)",
+                            (migration.version, migration.name)
+                        )
+                        applied_now.append(migration.version)
+
+                    self._create_future_partitions(cursor)
+
+            self._up_to_date = True
+            if applied_now:
+                print(f"[MIGRATIONS] ✓ Schema migrated to version {MIGRATIONS[-1].version}")
+            return applied_now
+
+    def ensure_future_partitions(self) -> None:
+        """Create partitions for the current and upcoming months"""
+        with self.pool.connection() as conn:
+            with conn.cursor() as cursor:
+                self._create_future_partitions(cursor)
+
+    def _create_future_partitions(self, cursor) -> None:
+        this_month = month_start(datetime.now(timezone.utc))
+        create_month_partitions(cursor, [add_months(this_month, i) for i in range(self.months_ahead + 1)])
+
+    def current_version(self) -> int:
+        """Highest applied migration version (0 if none)"""
+        with self.pool.connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT to_regclass('schema_migrations')")
+                if cursor.fetchone()[0] is None:
+                    return 0
+                cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+                return cursor.fetchone()[0]
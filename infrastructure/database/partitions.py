@@ -0,0 +1,75 @@
+from datetime import date, datetime, timezone
+from typing import Iterable, List, Set
+
+from psycopg2 import sql
+
+# sensor_data is range-partitioned by month on timestamp; partitions are named sensor_data_yYYYYmMM
+PARTITION_PREFIX = "sensor_data_y"
+
+
+def month_start(value) -> date:
+    """First day of the (UTC) month containing a date or datetime"""
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        value = value.date()
+    return value.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    """Shift a first-of-month date by a number of months"""
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month.year}m{month.month:02d}"
+
+
+def create_month_partition(cursor, month: date) -> None:
+    """Create the partition holding one UTC month of readings, if missing"""
+    lower = datetime(month.year, month.month, 1, tzinfo=timezone.utc)
+    upper_month = add_months(month, 1)
+    upper = datetime(upper_month.year, upper_month.month, 1, tzinfo=timezone.utc)
+    cursor.execute(
+        sql.SQL("CREATE TABLE IF NOT EXISTS {} PARTITION OF sensor_data FOR VALUES FROM (%s) TO (%s)")
+        .format(sql.Identifier(partition_name(month))),
+        (lower, upper)
+    )
+
+
+def create_month_partitions(cursor, months: Iterable[date]) -> Set[date]:
+    """Create partitions for several months and return the months covered"""
+    created = set()
+    for month in sorted({month_start(m) for m in months}):
+        create_month_partition(cursor, month)
+        created.add(month)
+    return created
+
+
+def list_month_partitions(cursor) -> List[date]:
+    """Months that currently have a sensor_data partition, oldest first"""
+    cursor.execute("""
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = 'sensor_data'
+    """)
+    months = []
+    for (name,) in cursor.fetchall():
+        if name.startswith(PARTITION_PREFIX):
+            year, month = name[len(PARTITION_PREFIX):].split("m")
+            months.append(date(int(year), int(month), 1))
+    return sorted(months)
+
+
+def drop_month_partitions_before(cursor, cutoff: date) -> List[str]:
+    """Drop whole partitions whose month ends on or before cutoff; far cheaper than DELETE"""
+    dropped = []
+    for month in list_month_partitions(cursor):
+        if add_months(month, 1) <= cutoff:
+            name = partition_name(month)
+            cursor.execute(sql.SQL("DROP TABLE IF EXISTS {}").format(sql.Identifier(name)))
+            dropped.append(name)
+    return dropped
@@ -1,87 +1,99 @@
-import psycopg2
+import csv
+import io
+import pandas as pd
 from psycopg2.extras import RealDictCursor
-from datetime import datetime
-from typing import List, Optional
-from contextlib import contextmanager
+from datetime import date, datetime
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 
 from domain.entities.sensor_data import SensorData
+from domain.entities.sensor_data_batch import SensorDataBatch
+from .connection_pool import PostgresConnectionPool, get_default_pool
+from .migrations import SchemaMigrator
+from .partitions import create_month_partitions, drop_month_partitions_before, month_start
+from .rollups import MEASUREMENTS, ROLLUP_ORIGIN, ROLLUP_RESOLUTIONS, refresh_rollups
 
 
 class PostgresSensorDatabase:
-    def __init__(self, database_url: str):
-        self.database_url = database_url
+    def __init__(
+        self,
+        database_url: str,
+        pool: Optional[PostgresConnectionPool] = None,
+        migrator: Optional[SchemaMigrator] = None
+    ):
+        # Connections come from a shared pool instead of one psycopg2.connect per query
+        self.pool = pool or get_default_pool(database_url)
+        self.database_url = self.pool.database_url
+        self.migrator = migrator or SchemaMigrator(self.pool)
         self._initialized = False
-        # Add connection timeout to prevent hanging
-        if '?' in self.database_url:
-            self.database_url += '&connect_timeout=10'
-        else:
-            self.database_url += '?connect_timeout=10'
+        # Months known to have a sensor_data partition
+        self._partition_months: Set[date] = set()
 
-    @contextmanager
     def _get_connection(self):
-        """Context manager for database connections"""
-        conn = psycopg2.connect(self.database_url)
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Context manager for pooled database connections"""
+        return self.pool.connection()
 
     def _initialize_database(self):
-        """Create the sensor_data table if it doesn't exist"""
+        """Apply pending schema migrations (normally already done at startup)"""
         if self._initialized:
             return
 
         try:
-            with self._get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS sensor_data (
-                            id TEXT PRIMARY KEY,
-                            device_id TEXT NOT NULL,
-                            temperature REAL NOT NULL,
-                            humidity REAL NOT NULL,
-                            wind_speed REAL NOT NULL,
-                            timestamp TIMESTAMP WITH TIME ZONE NOT NULL,
-                            created_at TIMESTAMP WITH TIME ZONE NOT NULL
-                        )
-                    """)
-
-                    # Create index on timestamp for faster queries
-                    cursor.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_timestamp
-                        ON sensor_data(timestamp)
-                    """)
-
-                    # Create index on device_id for filtering
-                    cursor.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_device_id
-                        ON sensor_data(device_id)
-                    """)
-
-                    self._initialized = True
-                    print("[DATABASE] PostgreSQL tables initialized successfully")
+            self.migrator.migrate()
+            self._initialized = True
         except Exception as e:
             print(f"[DATABASE] Warning: Could not initialize database: {e}")
             print("[DATABASE] Will retry on first database operation")
 
+    def _ensure_partitions(self, cursor, timestamps: Iterable) -> Set[date]:
+        """
+        Make sure a monthly partition exists for every timestamp about to be written.
+        Runs in the caller's transaction; the caller records the returned months once committed.
+        """
+        months = {month_start(timestamp) for timestamp in timestamps} - self._partition_months
+        if months:
+            create_month_partitions(cursor, months)
+        return months
+
+    def ensure_future_partitions(self) -> None:
+        """Create partitions for the current and upcoming months ahead of time"""
+        self.migrator.ensure_future_partitions()
+        print("[DATABASE] ✓ Future sensor_data partitions ensured")
+
+    def drop_partitions_before(self, cutoff: date) -> List[str]:
+        """
+        Drop whole monthly partitions that end on or before cutoff
+
+        Args:
+            cutoff: First day of the oldest month to keep
+
+        Returns:
+            Names of the dropped partitions
+        """
+        with self._get_connection() as conn:
+            with conn.cursor() as cursor:
+                dropped = drop_month_partitions_before(cursor, cutoff)
+        self._partition_months = {m for m in self._partition_months if m >= cutoff}
+        print(f"[DATABASE] Dropped {len(dropped)} sensor_data partitions older than {cutoff}")
+        return dropped
+
     def save_sensor_data(self, sensor_data: SensorData) -> None:
         """Save a single sensor data point to the database"""
         self._initialize_database()  # Ensure DB is initialized
         with self._get_connection() as conn:
             with conn.cursor() as cursor:
+                new_months = self._ensure_partitions(cursor, [sensor_data.timestamp])
                 cursor.execute("""
                     INSERT INTO sensor_data
-                    (id, device_id, temperature, humidity, wind_speed, timestamp, created_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (id) DO UPDATE SET
+                    (id, device_id, temperature, humidity, wind_speed, timestamp, created_at, f_cnt)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                    ON CONFLICT (device_id, timestamp) DO UPDATE SET
                         temperature = EXCLUDED.temperature,
                         humidity = EXCLUDED.humidity,
                         wind_speed = EXCLUDED.wind_speed,
-                        timestamp = EXCLUDED.timestamp
+                        f_cnt = COALESCE(EXCLUDED.f_cnt, sensor_data.f_cnt)
+                    WHERE (sensor_data.temperature, sensor_data.humidity, sensor_data.wind_speed, sensor_data.f_cnt)
+                        IS DISTINCT FROM (EXCLUDED.temperature, EXCLUDED.humidity, EXCLUDED.wind_speed,
+                                          COALESCE(EXCLUDED.f_cnt, sensor_data.f_cnt))
                 """, (
                     str(sensor_data.id),
                     sensor_data.device_id,
@@ -89,8 +101,115 @@ class PostgresSensorDatabase:
                     sensor_data.humidity,
                     sensor_data.wind_speed,
                     sensor_data.timestamp,
-                    datetime.utcnow()
+                    datetime.utcnow(),
+                    sensor_data.f_cnt
                 ))
+                refresh_rollups(cursor, sensor_data.timestamp, sensor_data.timestamp, [sensor_data.device_id])
+        self._partition_months |= new_months
+
+    def save_sensor_data_batch(self, sensor_data_list: Iterable[SensorData], chunk_size: int = 10000) -> int:
+        """
+        Bulk save sensor data points in a single transaction
+
+        Rows are streamed with COPY FROM STDIN into a temporary staging table
+        and merged into sensor_data with ON CONFLICT, so one round trip per
+        chunk replaces one INSERT per reading.
+
+        Args:
+            sensor_data_list: SensorData objects to save
+            chunk_size: Number of rows buffered per COPY
+
+        Readings already stored with the same values are left untouched, so
+        re-importing an export is idempotent.
+
+        Returns:
+            Number of rows inserted or changed
+        """
+        self._initialize_database()  # Ensure DB is initialized
+        created_at = datetime.utcnow()
+        total = 0
+
+        with self._get_connection() as conn:
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    CREATE TEMP TABLE sensor_data_staging
+                    (LIKE sensor_data INCLUDING DEFAULTS)
+                    ON COMMIT DROP
+                """)
+
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                buffered = 0
+                months = set()
+                new_months = set()
+
+                for sensor_data in sensor_data_list:
+                    writer.writerow([
+                        str(sensor_data.id),
+                        sensor_data.device_id,
+                        sensor_data.temperature,
+                        sensor_data.humidity,
+                        sensor_data.wind_speed,
+                        sensor_data.timestamp.isoformat(),
+                        created_at.isoformat(),
+                        sensor_data.f_cnt
+                    ])
+                    months.add(month_start(sensor_data.timestamp))
+                    buffered += 1
+
+                    if buffered >= chunk_size:
+                        new_months |= self._ensure_partitions(cursor, months)
+                        total += self._merge_staging_chunk(cursor, buffer)
+                        buffer = io.StringIO()
+                        writer = csv.writer(buffer)
+                        buffered = 0
+                        months = set()
+
+                if buffered:
+                    new_months |= self._ensure_partitions(cursor, months)
+                    total += self._merge_staging_chunk(cursor, buffer)
+
+        self._partition_months |= new_months
+        print(f"[DATABASE] Bulk saved {total} sensor readings")
+        return total
+
+    def _merge_staging_chunk(self, cursor, buffer: io.StringIO) -> int:
+        """COPY one buffered chunk into the staging table and merge it into sensor_data"""
+        buffer.seek(0)
+        cursor.copy_expert("""
+            COPY sensor_data_staging
+            (id, device_id, temperature, humidity, wind_speed, timestamp, created_at, f_cnt)
+            FROM STDIN WITH (FORMAT csv)
+        """, buffer)
+
+        # DISTINCT ON keeps one row per key; ON CONFLICT cannot touch a row twice per statement
+        cursor.execute("""
+            INSERT INTO sensor_data
+            (id, device_id, temperature, humidity, wind_speed, timestamp, created_at, f_cnt)
+            SELECT DISTINCT ON (device_id, timestamp)
+                id, device_id, temperature, humidity, wind_speed, timestamp, created_at, f_cnt
+            FROM sensor_data_staging
+            ON CONFLICT (device_id, timestamp) DO UPDATE SET
+                temperature = EXCLUDED.temperature,
+                humidity = EXCLUDED.humidity,
+                wind_speed = EXCLUDED.wind_speed,
+                f_cnt = COALESCE(EXCLUDED.f_cnt, sensor_data.f_cnt)
+            WHERE (sensor_data.temperature, sensor_data.humidity, sensor_data.wind_speed, sensor_data.f_cnt)
+                IS DISTINCT FROM (EXCLUDED.temperature, EXCLUDED.humidity, EXCLUDED.wind_speed,
+                                  COALESCE(EXCLUDED.f_cnt, sensor_data.f_cnt))
+        """)
+        merged = cursor.rowcount
+
+        # Keep rollups current: recompute only the buckets this chunk touched
+        cursor.execute("""
+            SELECT MIN(timestamp), MAX(timestamp), ARRAY_AGG(DISTINCT device_id)
+            FROM sensor_data_staging
+        """)
+        first, last, device_ids = cursor.fetchone()
+        refresh_rollups(cursor, first, last, device_ids)
+
+        cursor.execute("TRUNCATE sensor_data_staging")
+        return merged
 
     def get_sensor_data_in_range(
         self,
@@ -152,6 +271,170 @@ class PostgresSensorDatabase:
             traceback.print_exc()
             raise
 
+    def get_sensor_frame_in_range(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        device_id: Optional[str] = None,
+        with_f_cnt: bool = False
+    ) -> pd.DataFrame:
+        """
+        Retrieve sensor data within a time range as a columnar DataFrame
+
+        Only the columns the models need are selected and streamed with
+        COPY TO STDOUT straight into pandas, so no per-row Python objects
+        (dicts, SensorData, UUIDs) are created.
+
+        Args:
+            start_time: Start of the time range
+            end_time: End of the time range
+            device_id: Optional device ID to filter by
+            with_f_cnt: Also select the uplink frame counter (nullable Int64 column f_cnt)
+
+        Returns:
+            DataFrame with columns timestamp (UTC), device_id (categorical),
+            temperature, humidity and wind_speed (float32), ordered by timestamp
+        """
+        import time
+        query_start = time.time()
+        print(f"[DATABASE] Fetching columnar sensor data from {start_time} to {end_time}...")
+
+        where = "timestamp >= %s AND timestamp <= %s"
+        params = [start_time, end_time]
+        if device_id:
+            where += " AND device_id = %s"
+            params.append(device_id)
+
+        names = ['timestamp', 'device_id', 'temperature', 'humidity', 'wind_speed']
+        if with_f_cnt:
+            names.append('f_cnt')
+
+        # Epoch microseconds avoid parsing timestamp text on the client
+        frame = self._copy_to_frame(f"""
+            SELECT (EXTRACT(EPOCH FROM timestamp) * 1000000)::BIGINT,
+                   device_id, temperature, humidity, wind_speed{', f_cnt' if with_f_cnt else ''}
+            FROM sensor_data
+            WHERE {where}
+            ORDER BY timestamp ASC
+        """, params, names)
+
+        print(f"[DATABASE] ✓ Fetched {len(frame)} rows "
+              f"({frame.memory_usage(deep=True).sum() / 1024:.0f} KiB) in {time.time() - query_start:.2f}s")
+        return frame
+
+    def get_sensor_batch_in_range(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        device_id: Optional[str] = None
+    ) -> SensorDataBatch:
+        """
+        Retrieve sensor data within a time range as a SensorDataBatch
+
+        Same columnar fetch as get_sensor_frame_in_range plus the frame
+        counters, so readings materialized from the batch keep their ids.
+        """
+        return SensorDataBatch.from_frame(
+            self.get_sensor_frame_in_range(start_time, end_time, device_id=device_id, with_f_cnt=True)
+        )
+
+    def get_rollup_frame(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        resolution: str = "15min",
+        device_id: Optional[str] = None,
+        combine_devices: bool = False
+    ) -> pd.DataFrame:
+        """
+        Retrieve pre-bucketed sensor data from sensor_data_rollups
+
+        Args:
+            start_time: Start of the time range
+            end_time: End of the time range
+            resolution: Bucket width, one of ROLLUP_RESOLUTIONS ("5min", "15min", "1h")
+            device_id: Optional device ID to filter by
+            combine_devices: Merge devices into one series (count-weighted means)
+
+        Returns:
+            DataFrame with timestamp (bucket start, UTC), device_id (unless combined),
+            reading_count and <measurement>_min / _max columns, with the bucket means
+            named temperature, humidity and wind_speed so the models can use it directly
+        """
+        if resolution not in ROLLUP_RESOLUTIONS:
+            raise ValueError(f"Unknown rollup resolution '{resolution}', expected one of {list(ROLLUP_RESOLUTIONS)}")
+
+        where = "resolution = %s AND bucket_start >= date_bin(%s::interval, %s::timestamptz, %s::timestamptz) AND bucket_start <= %s"
+        params = [resolution, ROLLUP_RESOLUTIONS[resolution], start_time, ROLLUP_ORIGIN, end_time]
+        if device_id:
+            where += " AND device_id = %s"
+            params.append(device_id)
+
+        stats = [f"{m}_{stat}" for m in MEASUREMENTS for stat in ("min", "max")]
+        if combine_devices:
+            columns = ",\n".join(
+                f"MIN({m}_min), MAX({m}_max), SUM({m}_mean * reading_count) / SUM(reading_count)"
+                for m in MEASUREMENTS
+            )
+            query = f"""
+                SELECT (EXTRACT(EPOCH FROM bucket_start) * 1000000)::BIGINT, SUM(reading_count), {columns}
+                FROM sensor_data_rollups
+                WHERE {where}
+                GROUP BY bucket_start
+                ORDER BY bucket_start ASC
+            """
+            names = ['timestamp', 'reading_count']
+        else:
+            columns = ", ".join(f"{m}_min, {m}_max, {m}_mean" for m in MEASUREMENTS)
+            query = f"""
+                SELECT (EXTRACT(EPOCH FROM bucket_start) * 1000000)::BIGINT, device_id, reading_count, {columns}
+                FROM sensor_data_rollups
+                WHERE {where}
+                ORDER BY bucket_start ASC, device_id ASC
+            """
+            names = ['timestamp', 'device_id', 'reading_count']
+        for m in MEASUREMENTS:
+            names += [f"{m}_min", f"{m}_max", m]
+
+        return self._copy_to_frame(query, params, names)
+
+    def refresh_rollups(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        device_id: Optional[str] = None
+    ) -> int:
+        """
+        Recompute rollup buckets from raw readings (backfill or repair)
+
+        Args:
+            start_time: Optional start of the range to recompute (default: all history)
+            end_time: Optional end of the range to recompute
+            device_id: Optional device ID to restrict the refresh to
+
+        Returns:
+            Number of bucket rows written
+        """
+        self._initialize_database()
+        with self._get_connection() as conn:
+            with conn.cursor() as cursor:
+                return refresh_rollups(cursor, start_time, end_time, [device_id] if device_id else None)
+
+    def _copy_to_frame(self, query: str, params: list, names: List[str]) -> pd.DataFrame:
+        """Stream a query with COPY TO STDOUT into a DataFrame whose first column is epoch microseconds"""
+        with self._get_connection() as conn:
+            with conn.cursor() as cursor:
+                query = cursor.mogrify(query, params).decode()
+                buffer = io.StringIO()
+                cursor.copy_expert(f"COPY ({query}) TO STDOUT WITH (FORMAT csv)", buffer)
+
+        buffer.seek(0)
+        dtype = {name: 'float32' for name in names}
+        dtype.update({'timestamp': 'int64', 'device_id': 'category', 'reading_count': 'int32', 'f_cnt': 'Int64'})
+        frame = pd.read_csv(buffer, names=names, dtype={name: dtype[name] for name in names})
+        frame['timestamp'] = pd.to_datetime(frame['timestamp'], unit='us', utc=True)
+        return frame
+
     def get_latest_sensor_data(self, device_id: Optional[str] = None) -> Optional[SensorData]:
         """Get the most recent sensor data point"""
         with self._get_connection() as conn:
@@ -173,6 +456,18 @@ class PostgresSensorDatabase:
                 row = cursor.fetchone()
                 return self._row_to_sensor_data(dict(row)) if row else None
 
+    def get_latest_sensor_data_per_device(self) -> List[SensorData]:
+        """Get the most recent sensor data point of every device in one query"""
+        with self._get_connection() as conn:
+            with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+                # Served by the (device_id, timestamp) unique index
+                cursor.execute("""
+                    SELECT DISTINCT ON (device_id) *
+                    FROM sensor_data
+                    ORDER BY device_id, timestamp DESC
+                """)
+                return [self._row_to_sensor_data(dict(row)) for row in cursor.fetchall()]
+
     def get_data_count(self, device_id: Optional[str] = None) -> int:
         """Get the total count of sensor data points"""
         with self._get_connection() as conn:
@@ -187,55 +482,92 @@ class PostgresSensorDatabase:
 
                 return cursor.fetchone()[0]
 
-    def get_all_sensor_data(self, device_id: Optional[str] = None, limit: Optional[int] = None) -> List[SensorData]:
+    def get_sensor_data_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, str]] = None,
+        device_id: Optional[str] = None
+    ) -> List[SensorData]:
         """
-        Get all sensor data from the database
+        Get one page of sensor data, newest first, using keyset pagination
 
         Args:
+            limit: Maximum number of records to return
+            after: (timestamp, id) of the last record of the previous page
             device_id: Optional device ID to filter by
-            limit: Optional limit on number of records to return
 
         Returns:
-            List of all SensorData objects ordered by timestamp descending (newest first)
+            List of SensorData objects ordered by (timestamp, id) descending
         """
+        conditions = []
+        params = []
+        if device_id:
+            conditions.append("device_id = %s")
+            params.append(device_id)
+        if after:
+            # Row comparison lets the (timestamp, id) ordering be resumed without OFFSET
+            conditions.append("(timestamp, id) < (%s, %s)")
+            params.extend(after)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        params.append(limit)
+
         with self._get_connection() as conn:
             with conn.cursor(cursor_factory=RealDictCursor) as cursor:
-                if device_id:
-                    if limit:
-                        cursor.execute("""
-                            SELECT * FROM sensor_data
-                            WHERE device_id = %s
-                            ORDER BY timestamp DESC
-                            LIMIT %s
-                        """, (device_id, limit))
-                    else:
-                        cursor.execute("""
-                            SELECT * FROM sensor_data
-                            WHERE device_id = %s
-                            ORDER BY timestamp DESC
-                        """, (device_id,))
-                else:
-                    if limit:
-                        cursor.execute("""
-                            SELECT * FROM sensor_data
-                            ORDER BY timestamp DESC
-                            LIMIT %s
-                        """, (limit,))
-                    else:
-                        cursor.execute("""
-                            SELECT * FROM sensor_data
-                            ORDER BY timestamp DESC
-                        """)
+                cursor.execute(f"""
+                    SELECT id, device_id, temperature, humidity, wind_speed, timestamp
+                    FROM sensor_data
+                    {where}
+                    ORDER BY timestamp DESC, id DESC
+                    LIMIT %s
+                """, params)
 
                 rows = cursor.fetchall()
                 return [self._row_to_sensor_data(dict(row)) for row in rows]
 
+    def iter_sensor_data(
+        self,
+        device_id: Optional[str] = None,
+        batch_size: int = 2000
+    ) -> Iterator[tuple]:
+        """
+        Stream all sensor data, newest first, through a server-side named cursor
+
+        Only batch_size rows are held in memory at a time, so any table size can
+        be exported. The pooled connection stays checked out until the
+        iterator is exhausted or closed.
+
+        Yields:
+            (id, device_id, temperature, humidity, wind_speed, timestamp) tuples
+        """
+        with self._get_connection() as conn:
+            with conn.cursor(name="sensor_data_export") as cursor:
+                cursor.itersize = batch_size
+                if device_id:
+                    cursor.execute("""
+                        SELECT id, device_id, temperature, humidity, wind_speed, timestamp
+                        FROM sensor_data
+                        WHERE device_id = %s
+                        ORDER BY timestamp DESC, id DESC
+                    """, (device_id,))
+                else:
+                    cursor.execute("""
+                        SELECT id, device_id, temperature, humidity, wind_speed, timestamp
+                        FROM sensor_data
+                        ORDER BY timestamp DESC, id DESC
+                    """)
+
+                for row in cursor:
+                    yield row
+
     def _row_to_sensor_data(self, row) -> SensorData:
         """Convert a database row to a SensorData entity"""
         return SensorData(
+            id=row.get('id'),
             temperature=row['temperature'],
             humidity=row['humidity'],
             wind_speed=row['wind_speed'],
             timestamp=row['timestamp'] if isinstance(row['timestamp'], datetime) else datetime.fromisoformat(str(row['timestamp'])),
-            device_id=row['device_id']
+            device_id=row['device_id'],
+            f_cnt=row.get('f_cnt')
         )
@@ -1,58 +1,39 @@
-import psycopg2
 from psycopg2.extras import RealDictCursor
 from datetime import datetime
 from typing import List, Optional
-from contextlib import contextmanager
 
 from domain.entities.farmer import Farmer
+from .connection_pool import PostgresConnectionPool, get_default_pool
+from .migrations import SchemaMigrator
 
 
 class PostgresFarmerDatabase:
     """PostgreSQL database for storing farmer registrations"""
 
-    def __init__(self, database_url: str):
-        self.database_url = database_url
+    def __init__(
+        self,
+        database_url: str,
+        pool: Optional[PostgresConnectionPool] = None,
+        migrator: Optional[SchemaMigrator] = None
+    ):
+        # Connections come from a shared pool instead of one psycopg2.connect per query
+        self.pool = pool or get_default_pool(database_url)
+        self.database_url = self.pool.database_url
+        self.migrator = migrator or SchemaMigrator(self.pool)
         self._initialized = False
 
-    @contextmanager
     def _get_connection(self):
-        """Context manager for database connections"""
-        conn = psycopg2.connect(self.database_url)
-        try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        """Context manager for pooled database connections"""
+        return self.pool.connection()
 
     def _initialize_database(self):
-        """Create the farmers table if it doesn't exist"""
+        """Apply pending schema migrations (normally already done at startup)"""
         if self._initialized:
             return
 
         try:
-            with self._get_connection() as conn:
-                with conn.cursor() as cursor:
-                    cursor.execute("""
-                        CREATE TABLE IF NOT EXISTS farmers (
-                            phone_number TEXT PRIMARY KEY,
-                            first_name TEXT NOT NULL,
-                            last_name TEXT NOT NULL,
-                            lot_address TEXT NOT NULL,
-                            registered_at TIMESTAMP WITH TIME ZONE NOT NULL
-                        )
-                    """)
-
-                    # Create index on registered_at for sorting
-                    cursor.execute("""
-                        CREATE INDEX IF NOT EXISTS idx_farmers_registered_at
-                        ON farmers(registered_at)
-                    """)
-
-                    self._initialized = True
-                    print("[FARMER DATABASE] PostgreSQL farmers table initialized successfully")
+            self.migrator.migrate()
+            self._initialized = True
         except Exception as e:
             print(f"[FARMER DATABASE] Warning: Could not initialize database: {e}")
             print("[FARMER DATABASE] Will retry on first database operation")
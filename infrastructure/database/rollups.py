@@ -0,0 +1,119 @@
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+# Bucket widths maintained in sensor_data_rollups; names double as pandas offset aliases
+ROLLUP_RESOLUTIONS: Dict[str, str] = {
+    "5min": "5 minutes",
+    "15min": "15 minutes",
+    "1h": "1 hour",
+}
+
+# Buckets are aligned to this origin, which matches pandas' default resample bins
+ROLLUP_ORIGIN = "2000-01-01 00:00:00+00"
+
+ROLLUP_LOCK_ID = 7273002
+
+MEASUREMENTS = ("temperature", "humidity", "wind_speed")
+
+
+def create_rollup_table(cursor) -> None:
+    """Per-device, per-bucket min/max/mean/count of every measurement"""
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS sensor_data_rollups (
+            resolution TEXT NOT NULL,
+            device_id TEXT NOT NULL,
+            bucket_start TIMESTAMP WITH TIME ZONE NOT NULL,
+            reading_count INTEGER NOT NULL,
+            temperature_min REAL NOT NULL,
+            temperature_max REAL NOT NULL,
+            temperature_mean REAL NOT NULL,
+            humidity_min REAL NOT NULL,
+            humidity_max REAL NOT NULL,
+            humidity_mean REAL NOT NULL,
+            wind_speed_min REAL NOT NULL,
+            wind_speed_max REAL NOT NULL,
+            wind_speed_mean REAL NOT NULL,
+            PRIMARY KEY (resolution, device_id, bucket_start)
+        )
+    """)
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_sensor_data_rollups_bucket
+        ON sensor_data_rollups (resolution, bucket_start)
+    """)
+
+
+def refresh_rollups(
+    cursor,
+    start_time: Optional[datetime] = None,
+    end_time: Optional[datetime] = None,
+    device_ids: Optional[Iterable[str]] = None
+) -> int:
+    """
+    Recompute every rollup bucket overlapping [start_time, end_time] from sensor_data.
+
+    Buckets are recomputed rather than incremented, so re-imported or updated
+    readings never double count. Advisory locks serialize refreshes of the
+    same device so a concurrent writer's rows are always visible to the later
+    refresh; writers of different devices do not wait for each other. A refresh
+    of every device takes ROLLUP_LOCK_ID exclusively, the others share it.
+
+    Returns:
+        Number of bucket rows written across all resolutions
+    """
+    if device_ids is None:
+        cursor.execute("SELECT pg_advisory_xact_lock(%s)", (ROLLUP_LOCK_ID,))
+    else:
+        device_ids = sorted(set(device_ids))
+        cursor.execute("SELECT pg_advisory_xact_lock_shared(%s)", (ROLLUP_LOCK_ID,))
+        # One lock per device, taken in key order so concurrent batches cannot deadlock
+        cursor.execute("""
+            SELECT pg_advisory_xact_lock(%s, device_key)
+            FROM (SELECT DISTINCT hashtext(device_id) AS device_key FROM unnest(%s::text[]) AS device_id
+                  ORDER BY device_key) AS device_keys
+        """, (ROLLUP_LOCK_ID, device_ids))
+
+    aggregates = ",\n".join(
+        f"MIN({m}), MAX({m}), AVG({m})" for m in MEASUREMENTS
+    )
+    updates = ",\n".join(
+        f"{m}_{stat} = EXCLUDED.{m}_{stat}" for m in MEASUREMENTS for stat in ("min", "max", "mean")
+    )
+
+    written = 0
+    for resolution, width in ROLLUP_RESOLUTIONS.items():
+        conditions = []
+        params = {"resolution": resolution, "width": width, "origin": ROLLUP_ORIGIN}
+        if start_time is not None:
+            conditions.append("timestamp >= date_bin(%(width)s::interval, %(start)s::timestamptz, %(origin)s::timestamptz)")
+            params["start"] = start_time
+        if end_time is not None:
+            conditions.append("timestamp < date_bin(%(width)s::interval, %(end)s::timestamptz, %(origin)s::timestamptz) + %(width)s::interval")
+            params["end"] = end_time
+        if device_ids is not None:
+            conditions.append("device_id = ANY(%(devices)s)")
+            params["devices"] = list(device_ids)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+        cursor.execute(f"""
+            INSERT INTO sensor_data_rollups (
+                resolution, device_id, bucket_start, reading_count,
+                temperature_min, temperature_max, temperature_mean,
+                humidity_min, humidity_max, humidity_mean,
+                wind_speed_min, wind_speed_max, wind_speed_mean
+            )
+            SELECT
+                %(resolution)s,
+                device_id,
+                date_bin(%(width)s::interval, timestamp, %(origin)s::timestamptz) AS bucket_start,
+                COUNT(*),
+                {aggregates}
+            FROM sensor_data
+            {where}
+            GROUP BY device_id, bucket_start
+            ON CONFLICT (resolution, device_id, bucket_start) DO UPDATE SET
+                reading_count = EXCLUDED.reading_count,
+                {updates}
+        """, params)
+        written += cursor.rowcount
+
+    return written
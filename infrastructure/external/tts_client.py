@@ -5,6 +5,7 @@ from typing import List, Dict, Any
 import httpx
 
 from domain.entities.sensor_data import SensorData
+from domain.entities.sensor_data_batch import SensorDataBatch
 from domain.value_objects.time_range import TimeRange
 from ..config.settings import settings
 
@@ -17,6 +18,11 @@ class TTSClient:
         self.storage_integration_id = settings.tts_storage_integration_id
 
     async def get_sensor_data_in_range(self, time_range: TimeRange) -> List[SensorData]:
+        batch = await self.get_sensor_batch_in_range(time_range)
+        return batch.to_readings()
+
+    async def get_sensor_batch_in_range(self, time_range: TimeRange) -> SensorDataBatch:
+        """Fetch stored uplinks from TTS, parsed straight into columns"""
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Accept": "text/event-stream",
@@ -41,8 +47,8 @@ class TTSClient:
                 response = await client.get(url, headers=headers, params=params)
                 response.raise_for_status()
 
-                # Parse event-stream response (each line is a JSON object)
-                sensor_data_list = []
+                # Parse event-stream response (each line is a JSON object) into columns
+                timestamps, device_ids, temperatures, humidities, wind_speeds, f_cnts = [], [], [], [], [], []
                 response_text = response.text
 
                 # Split by lines and parse each JSON event
@@ -60,6 +66,7 @@ class TTSClient:
 
                         payload = uplink_message.get("decoded_payload", {})
                         received_at = uplink_message.get("received_at")
+                        f_cnt = uplink_message.get("f_cnt")
                         end_device_ids = result.get("end_device_ids", {})
                         device_id = end_device_ids.get("device_id")
 
@@ -74,40 +81,43 @@ class TTSClient:
                         timestamp = datetime.fromisoformat(received_at.replace("Z", "+00:00"))
 
                         # Handle both Spanish and English field names
-                        temperature = payload.get("temperatura_c", payload.get("temperature", 0.0))
-                        humidity = payload.get("humedad_pct", payload.get("humidity", 0.0))
-                        wind_speed = payload.get("viento_ms", payload.get("wind_speed", 0.0))
-
-                        sensor_data = SensorData(
-                            temperature=temperature,
-                            humidity=humidity,
-                            wind_speed=wind_speed,
-                            timestamp=timestamp,
-                            device_id=device_id,
-                        )
-                        sensor_data_list.append(sensor_data)
+                        temperature = float(payload.get("temperatura_c", payload.get("temperature", 0.0)))
+                        humidity = float(payload.get("humedad_pct", payload.get("humidity", 0.0)))
+                        wind_speed = float(payload.get("viento_ms", payload.get("wind_speed", 0.0)))
+
+                        timestamps.append(timestamp)
+                        device_ids.append(device_id)
+                        temperatures.append(temperature)
+                        humidities.append(humidity)
+                        wind_speeds.append(wind_speed)
+                        f_cnts.append(int(f_cnt) if f_cnt is not None else None)
 
                     except Exception as e:
                         print(f"Error parsing sensor data: {e}")
                         continue
 
+                batch = SensorDataBatch.from_columns(
+                    timestamps, device_ids, temperatures, humidities, wind_speeds, f_cnt=f_cnts
+                )
+
                 # Log all fetched data
                 print(f"\n{'='*80}")
-                print(f"[TTS] Fetched {len(sensor_data_list)} data points from Nodes 1, 6, and 7")
+                print(f"[TTS] Fetched {len(batch)} data points from Nodes 1, 6, and 7")
                 print(f"{'='*80}")
-                if sensor_data_list:
-                    print(f"First data point: {sensor_data_list[0].timestamp} - Temp: {sensor_data_list[0].temperature}°C - Device: {sensor_data_list[0].device_id}")
-                    print(f"Last data point:  {sensor_data_list[-1].timestamp} - Temp: {sensor_data_list[-1].temperature}°C - Device: {sensor_data_list[-1].device_id}")
+                if len(batch):
+                    print(f"First data point: {timestamps[0]} - Temp: {temperatures[0]}°C - Device: {device_ids[0]}")
+                    print(f"Last data point:  {timestamps[-1]} - Temp: {temperatures[-1]}°C - Device: {device_ids[-1]}")
                     print(f"\nAll temperature readings:")
-                    for i, data in enumerate(sensor_data_list, 1):
-                        print(f"  {i:3d}. {data.timestamp} | Device: {data.device_id:16s} | Temp: {data.temperature:5.1f}°C | Humidity: {data.humidity:5.1f}% | Wind: {data.wind_speed:5.1f} m/s")
+                    for i, row in enumerate(zip(timestamps, device_ids, temperatures, humidities, wind_speeds), 1):
+                        timestamp, device_id, temperature, humidity, wind_speed = row
+                        print(f"  {i:3d}. {timestamp} | Device: {device_id:16s} | Temp: {temperature:5.1f}°C | Humidity: {humidity:5.1f}% | Wind: {wind_speed:5.1f} m/s")
                 print(f"{'='*80}\n")
 
-                return sensor_data_list
-                
+                return batch
+
             except httpx.HTTPStatusError as e:
                 print(f"HTTP error occurred: {e}")
-                return []
+                return SensorDataBatch.empty()
             except Exception as e:
                 print(f"Error fetching data from TTS: {e}")
-                return []
\ No newline at end of file
+                return SensorDataBatch.empty()
\ No newline at end of file
@@ -1,4 +1,4 @@
-from twilio.rest import Client
+from functools import cached_property
 
 from domain.entities.prediction import Prediction, FrostLevel
 from ..config.settings import settings
@@ -6,10 +6,15 @@ from ..config.settings import settings
 
 class TwilioWhatsAppClient:
     def __init__(self):
-        self.client = Client(settings.twilio_account_sid, settings.twilio_auth_token)
         self.from_number = f"whatsapp:{settings.twilio_whatsapp_number}"
         self.to_number = f"whatsapp:{settings.recipient_whatsapp_number}"
 
+    @cached_property
+    def client(self):
+        """Twilio REST client, created on the first message rather than at startup"""
+        from twilio.rest import Client
+        return Client(settings.twilio_account_sid, settings.twilio_auth_token)
+
     def _get_message_for_frost_level(self, prediction: Prediction, farmer_name: str = None) -> str:
         # Add personalized greeting if farmer name is provided
         greeting = f"¡Hola! {farmer_name}\n\n" if farmer_name else ""
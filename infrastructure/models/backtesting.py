@@ -0,0 +1,322 @@
+import asyncio
+import time
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+from domain.entities.feature_frame import FEATURE_COLUMNS, FeatureFrame
+from domain.entities.prediction import FORECAST_HORIZONS, Prediction
+from .lstm_inference import NumpyLSTM
+from .lstm_model import LSTMModelService
+from .model_executor import ModelExecutor
+from .model_store import ModelArtifactStore
+from .sarima_model import SARIMAModelService, forecast_paths, frost_probability
+
+FROST_TEMPERATURE = 0.0  # An observed minimum at or below this (°C) is a frost event
+CACHE_COLUMNS = ('sarima_min_forecast', 'lstm_probability')
+
+
+class SarimaSpec(NamedTuple):
+    """What a worker needs to re-filter history with a fitted SARIMA model"""
+    order: Tuple[int, int, int]
+    seasonal_order: Tuple[int, int, int, int]
+    params: np.ndarray
+
+
+class BacktestModels(NamedTuple):
+    sarima: SarimaSpec
+    lstm: NumpyLSTM
+    scaler: object  # Fitted MinMaxScaler
+    sequence_length: int
+    version: str  # "<sarima version>-<lstm version>", the cache key
+    training_start: pd.Timestamp  # Cut-offs from here on are in-sample
+
+
+def backtest_chunk(
+    temperature: pd.Series,
+    features: pd.DataFrame,
+    cutoffs: np.ndarray,
+    sarima: SarimaSpec,
+    lstm: NumpyLSTM,
+    scaler,
+    sequence_length: int,
+    forecast_steps: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Forecast every cut-off of a chunk as the serving models would have at that time
+
+    SARIMA filters the chunk's history once with the fitted parameters (as
+    apply(refit=False) does at prediction time) and then projects the
+    predicted state of every cut-off forecast_steps ahead in one matrix
+    recursion. The LSTM scores the window before every cut-off in batches.
+    Module-level so chunks run in parallel on the ModelExecutor.
+
+    Args:
+        temperature: Prepared 15-minute series covering the chunk and its history
+        features: Prepared 5-minute features over the same span
+        cutoffs: Cut-off times (datetime64[ns], UTC); only buckets starting before
+            a cut-off are visible to its forecast
+
+    Returns:
+        (minimum SARIMA forecast temperature, LSTM frost probability) per cut-off
+    """
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    filtered = SARIMAX(
+        temperature,
+        order=sarima.order,
+        seasonal_order=sarima.seasonal_order,
+        enforce_stationarity=False,
+        enforce_invertibility=False
+    ).filter(sarima.params)
+    # predicted_state[:, i + 1] is the state after observing bucket i, the last one before the cut-off
+    last_observed = temperature.index.values.searchsorted(cutoffs, side='left') - 1
+    state = filtered.predicted_state[:, last_observed + 1]
+    min_forecast = forecast_paths(filtered, state, forecast_steps).min(axis=0)
+
+    scaled = scaler.transform(features[FEATURE_COLUMNS].values)
+    windows = sliding_window_view(scaled, sequence_length, axis=0).transpose(0, 2, 1)
+    visible = features.index.values.searchsorted(cutoffs, side='left')
+    # The network outputs every forecast horizon; the pipeline's hybrid uses the LSTM's headline one
+    headline = FORECAST_HORIZONS.index(LSTMModelService.HEADLINE_HORIZON)
+    lstm_probability = np.clip(lstm.predict(windows[visible - sequence_length])[:, headline], 0.0, 1.0)
+
+    return min_forecast, lstm_probability
+
+
+def observed_minimum(
+    temperature_min: pd.Series,
+    cutoffs: pd.DatetimeIndex,
+    horizon: pd.Timedelta,
+    resolution: str
+) -> np.ndarray:
+    """
+    Lowest measured temperature in [cut-off, cut-off + horizon) for every cut-off
+
+    Args:
+        temperature_min: Per-bucket minimum temperatures indexed by bucket start
+        resolution: Bucket width of temperature_min
+
+    Returns:
+        Minimum per cut-off; NaN where fewer than half of the horizon's buckets were
+        reported, so outages are left out of the scores instead of counting as frost-free
+    """
+    grid = temperature_min.resample(resolution).min()  # Missing buckets become NaN
+    steps = int(horizon / pd.Timedelta(resolution))
+    values = np.concatenate([grid.to_numpy(dtype=float), np.full(steps, np.nan)])
+    windows = sliding_window_view(values, steps)[grid.index.searchsorted(cutoffs, side='left')]
+
+    minimum = np.where(np.isnan(windows), np.inf, windows).min(axis=1)
+    reported = np.sum(~np.isnan(windows), axis=1)
+    return np.where(reported * 2 >= steps, minimum, np.nan)
+
+
+def score(results: pd.DataFrame) -> Dict[str, float]:
+    """
+    Scores of backtest results with an observed outcome
+
+    Brier score per model (lower is better), and for the hybrid the hit rate
+    (frost events rated at least possible frost) and false alarm rate (frost-free
+    cut-offs rated at least possible frost).
+    """
+    scored = results.dropna(subset=['observed_min'])
+    frost = scored['frost'].to_numpy(dtype=float)
+    alerted = scored['hybrid_probability'].to_numpy() >= Prediction.POSSIBLE_FROST_THRESHOLD
+    events = int(frost.sum())
+    return {
+        'cutoffs': len(scored),
+        'frost_events': events,
+        **{
+            f'brier_{model}': float(np.mean((scored[f'{model}_probability'].to_numpy() - frost) ** 2))
+            if len(scored) else float('nan')
+            for model in ('sarima', 'lstm', 'hybrid')
+        },
+        'hit_rate': float(alerted[frost == 1].mean()) if events else float('nan'),
+        'false_alarm_rate': float(alerted[frost == 0].mean()) if len(scored) > events else float('nan'),
+    }
+
+
+def weight_sweep(results: pd.DataFrame, weights: Sequence[float] = np.linspace(0, 1, 11)) -> pd.Series:
+    """Hybrid Brier score for every SARIMA weight (the LSTM gets the rest), all at once"""
+    scored = results.dropna(subset=['observed_min'])
+    weights = np.asarray(weights)[:, np.newaxis]
+    blended = weights * scored['sarima_probability'].to_numpy() + (1 - weights) * scored['lstm_probability'].to_numpy()
+    brier = np.mean((blended - scored['frost'].to_numpy(dtype=float)) ** 2, axis=1)
+    return pd.Series(brier, index=pd.Index(weights[:, 0].round(2), name='sarima_weight'), name='brier')
+
+
+class FrostBacktester:
+    """
+    Replays stored sensor history through a node's stored models at many cut-off times.
+
+    Each cut-off gets the SARIMA, LSTM and hybrid frost probabilities the
+    pipeline would have produced from the data before it, and the lowest
+    temperature actually measured over the forecast horizon after it. Cut-offs
+    are split into chunks that run in parallel on the model executor. Each
+    chunk filters the history_days before it and then its own day, like a
+    serving model fitted on 10 days and extended until its daily refit (the
+    forecasts depend on how much history the state has seen). The
+    per-cut-off forecasts are cached per model version, so re-running (e.g.
+    with other blend weights or a longer season) only forecasts new cut-offs.
+    """
+
+    def __init__(
+        self,
+        store: ModelArtifactStore,
+        executor: Optional[ModelExecutor] = None,
+        sarima_weight: float = 0.4,
+        lstm_weight: float = 0.6,
+        cache_path: Optional[str] = None,
+        chunk_days: float = 1.0,
+        history_days: int = 10
+    ):
+        self.store = store
+        self.executor = executor or ModelExecutor(max_workers=0)
+        self.sarima_weight = sarima_weight
+        self.lstm_weight = lstm_weight
+        self.cache_path = Path(cache_path) if cache_path else store.base_path / "backtests"
+        self.chunk = pd.Timedelta(days=chunk_days)
+        self.history = pd.Timedelta(days=history_days)  # Data the pipeline reads before a cut-off
+        self.forecast_steps = SARIMAModelService.FORECAST_STEPS
+        self.horizon = self.forecast_steps * pd.Timedelta(SARIMAModelService.RESOLUTION)
+
+    def load_models(self, device_id: str) -> Optional[BacktestModels]:
+        """The current stored SARIMA and LSTM of a node, or None if either is missing"""
+        sarima = SARIMAModelService(store=self.store, model_name=f"{SARIMAModelService.MODEL_NAME}-{device_id}")
+        lstm = LSTMModelService(store=self.store, model_name=f"{LSTMModelService.MODEL_NAME}-{device_id}")
+        if not (sarima.restore() and lstm.restore()):
+            return None
+
+        metadata = [self.store.load_current(service.model_name)[1] for service in (sarima, lstm)]
+        training_start = min(pd.Timestamp(m['training_start']) for m in metadata)
+        engine, scaler = lstm._serving
+        return BacktestModels(
+            sarima=SarimaSpec(sarima.order, sarima.seasonal_order, np.asarray(sarima.fitted_model.params)),
+            lstm=engine,
+            scaler=scaler,
+            sequence_length=lstm.sequence_length,
+            version="-".join(m['version'] for m in metadata),
+            training_start=training_start.tz_localize('UTC') if training_start.tzinfo is None else training_start,
+        )
+
+    def _cache_file(self, device_id: str, version: str) -> Path:
+        return self.cache_path / device_id / f"{version}.npz"
+
+    def _load_cache(self, device_id: str, version: str) -> pd.DataFrame:
+        try:
+            with np.load(self._cache_file(device_id, version)) as cached:
+                return pd.DataFrame(
+                    {name: cached[name] for name in CACHE_COLUMNS},
+                    index=pd.DatetimeIndex(cached['cutoff'], tz='UTC'),
+                )
+        except (OSError, KeyError, ValueError):
+            return pd.DataFrame(columns=list(CACHE_COLUMNS), index=pd.DatetimeIndex([], tz='UTC'), dtype=float)
+
+    def _save_cache(self, device_id: str, version: str, forecasts: pd.DataFrame) -> None:
+        path = self._cache_file(device_id, version)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            np.savez(f, cutoff=forecasts.index.tz_convert(None).values, **{
+                name: forecasts[name].to_numpy() for name in CACHE_COLUMNS
+            })
+
+    def _chunks(
+        self,
+        temperature: pd.Series,
+        features: pd.DataFrame,
+        cutoffs: pd.DatetimeIndex,
+        models: BacktestModels
+    ) -> List[tuple]:
+        """Arguments of backtest_chunk per chunk of cut-offs, each with the history before it"""
+        chunks = []
+        for start in pd.date_range(cutoffs[0], cutoffs[-1], freq=self.chunk):
+            selected = cutoffs[(cutoffs >= start) & (cutoffs < start + self.chunk)]
+            if selected.empty:
+                continue
+            span = slice(selected[0] - self.history, selected[-1])
+            chunks.append((
+                temperature.loc[span],
+                features.loc[span],
+                selected.tz_convert(None).values.astype('datetime64[ns]'),
+                models.sarima,
+                models.lstm,
+                models.scaler,
+                models.sequence_length,
+                self.forecast_steps,
+            ))
+        return chunks
+
+    async def run(
+        self,
+        device_id: str,
+        sarima_rollups: pd.DataFrame,
+        lstm_rollups: pd.DataFrame,
+        cutoffs: pd.DatetimeIndex
+    ) -> pd.DataFrame:
+        """
+        Backtest one node
+
+        Args:
+            device_id: Node whose stored models are replayed
+            sarima_rollups: 15-minute rollups of the node, from history_days before the
+                first cut-off to the forecast horizon after the last
+            lstm_rollups: 5-minute rollups over the same span (temperature_min gives the outcomes)
+            cutoffs: UTC cut-off times; those without enough history before them are dropped
+
+        Returns:
+            One row per cut-off: sarima/lstm/hybrid probabilities, observed_min (NaN without
+            enough measurements), frost and in_sample (the models were trained on data after it)
+        """
+        models = await asyncio.to_thread(self.load_models, device_id)
+        if models is None:
+            raise ValueError(f"No stored SARIMA and LSTM models for {device_id}")
+
+        temperature = FeatureFrame.from_input(sarima_rollups, SARIMAModelService.RESOLUTION).frame['temperature']
+        features = FeatureFrame.from_input(lstm_rollups, LSTMModelService.RESOLUTION).frame[FEATURE_COLUMNS]
+        first_usable = max(
+            temperature.index[0] + self.history,
+            features.index[0] + models.sequence_length * pd.Timedelta(LSTMModelService.RESOLUTION),
+        )
+        cutoffs = cutoffs[(cutoffs >= first_usable) & (cutoffs <= temperature.index[-1])]
+        if cutoffs.empty:
+            raise ValueError(f"Not enough history for any cut-off of {device_id}")
+
+        cached = await asyncio.to_thread(self._load_cache, device_id, models.version)
+        missing = cutoffs.difference(cached.index)
+        print(f"[BACKTEST] {device_id} (models {models.version}): {len(cutoffs)} cut-offs, "
+              f"{len(cutoffs) - len(missing)} cached")
+
+        if not missing.empty:
+            start = time.time()
+            chunks = self._chunks(temperature, features, missing, models)
+            results = await asyncio.gather(*(self.executor.run(backtest_chunk, *chunk) for chunk in chunks))
+            computed = pd.DataFrame(
+                {
+                    'sarima_min_forecast': np.concatenate([r[0] for r in results]),
+                    'lstm_probability': np.concatenate([r[1] for r in results]),
+                },
+                index=missing,
+            )
+            cached = computed if cached.empty else pd.concat([cached, computed]).sort_index()
+            await asyncio.to_thread(self._save_cache, device_id, models.version, cached)
+            print(f"[BACKTEST] {device_id}: forecast {len(missing)} cut-offs in {len(chunks)} chunks "
+                  f"in {time.time() - start:.1f}s")
+
+        forecasts = cached.loc[cutoffs]
+        results = pd.DataFrame({
+            'device_id': device_id,
+            'sarima_probability': frost_probability(forecasts['sarima_min_forecast'].to_numpy()),
+            'lstm_probability': forecasts['lstm_probability'].to_numpy(),
+        }, index=pd.DatetimeIndex(cutoffs, name='cutoff'))
+        results['hybrid_probability'] = (
+            results['sarima_probability'] * self.sarima_weight + results['lstm_probability'] * self.lstm_weight
+        )
+
+        temperature_min = lstm_rollups.set_index('timestamp')['temperature_min'].sort_index()
+        results['observed_min'] = observed_minimum(temperature_min, cutoffs, self.horizon, LSTMModelService.RESOLUTION)
+        results['frost'] = results['observed_min'] <= FROST_TEMPERATURE
+        results['in_sample'] = results.index >= models.training_start
+        return results
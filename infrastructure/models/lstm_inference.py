@@ -0,0 +1,153 @@
+from pathlib import Path
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    return 1 / (1 + np.exp(-x))
+
+
+ACTIVATIONS = {
+    'linear': lambda x: x,
+    'relu': lambda x: np.maximum(x, 0),
+    'sigmoid': _sigmoid,
+    'tanh': np.tanh,
+}
+
+
+class NumpyLSTM:
+    """
+    TensorFlow-free forward pass of the frost LSTM (stacked LSTM layers, then Dense layers).
+
+    Reproduces Keras inference: LSTM gates in Keras order (input, forget,
+    cell, output) with sigmoid recurrent and tanh cell activations, every
+    LSTM but the last returning sequences, and dropout as identity. Weights
+    are float32 and saved as a single .npz, so API workers can serve
+    predictions without importing TensorFlow.
+    """
+
+    def __init__(
+        self,
+        lstm_layers: Sequence[Tuple[np.ndarray, np.ndarray, np.ndarray]],
+        dense_layers: Sequence[Tuple[np.ndarray, np.ndarray, str]],
+    ):
+        self.lstm_layers = [tuple(np.asarray(w, dtype=np.float32) for w in layer) for layer in lstm_layers]
+        self.dense_layers = [
+            (np.asarray(kernel, dtype=np.float32), np.asarray(bias, dtype=np.float32), activation)
+            for kernel, bias, activation in dense_layers
+        ]
+        for _, _, activation in self.dense_layers:
+            if activation not in ACTIVATIONS:
+                raise ValueError(f"Unsupported dense activation: {activation}")
+
+    @classmethod
+    def from_keras(cls, model) -> "NumpyLSTM":
+        """Export the weights of a trained Keras Sequential model (LSTM, Dropout and Dense layers)"""
+        lstm_layers, dense_layers = [], []
+        for layer in model.layers:
+            kind = type(layer).__name__
+            if kind == 'LSTM':
+                config = layer.get_config()
+                if (config.get('activation'), config.get('recurrent_activation')) != ('tanh', 'sigmoid'):
+                    raise ValueError("Only tanh/sigmoid LSTM layers can be exported")
+                lstm_layers.append(tuple(layer.get_weights()))
+            elif kind == 'Dense':
+                kernel, bias = layer.get_weights()
+                dense_layers.append((kernel, bias, layer.get_config()['activation']))
+            elif kind != 'Dropout':
+                raise ValueError(f"Cannot export layer type {kind}")
+        return cls(lstm_layers, dense_layers)
+
+    @property
+    def input_features(self) -> int:
+        return self.lstm_layers[0][0].shape[0]
+
+    def predict(self, inputs: np.ndarray, batch_size: int = 256) -> np.ndarray:
+        """
+        Forward pass
+
+        Args:
+            inputs: (batch, timesteps, features) windows, or a single (timesteps, features) window
+            batch_size: Windows evaluated together; bounds the working memory
+
+        Returns:
+            (batch, outputs) predictions, like keras Model.predict
+        """
+        inputs = np.asarray(inputs, dtype=np.float32)
+        if inputs.ndim == 2:
+            inputs = inputs[np.newaxis]
+        if inputs.shape[-1] != self.input_features:
+            raise ValueError(f"Expected {self.input_features} features, got {inputs.shape[-1]}")
+
+        outputs = [self._forward(inputs[start:start + batch_size]) for start in range(0, len(inputs), batch_size)]
+        if not outputs:
+            return np.empty((0, self.dense_layers[-1][0].shape[1]), dtype=np.float32)
+        return np.concatenate(outputs)
+
+    def _forward(self, x: np.ndarray) -> np.ndarray:
+        for index, (kernel, recurrent_kernel, bias) in enumerate(self.lstm_layers):
+            x = self._lstm(x, kernel, recurrent_kernel, bias, return_sequences=index < len(self.lstm_layers) - 1)
+        for kernel, bias, activation in self.dense_layers:
+            x = ACTIVATIONS[activation](x @ kernel + bias)
+        return x
+
+    @staticmethod
+    def _lstm(
+        x: np.ndarray,
+        kernel: np.ndarray,
+        recurrent_kernel: np.ndarray,
+        bias: np.ndarray,
+        return_sequences: bool
+    ) -> np.ndarray:
+        batch, timesteps, _ = x.shape
+        units = recurrent_kernel.shape[0]
+
+        # Input projections for every timestep at once; only the recurrence is sequential
+        projected = x @ kernel + bias
+        h = np.zeros((batch, units), dtype=np.float32)
+        c = np.zeros((batch, units), dtype=np.float32)
+        sequence = np.empty((batch, timesteps, units), dtype=np.float32) if return_sequences else None
+
+        for t in range(timesteps):
+            z = projected[:, t] + h @ recurrent_kernel
+            i = _sigmoid(z[:, :units])
+            f = _sigmoid(z[:, units:2 * units])
+            g = np.tanh(z[:, 2 * units:3 * units])
+            o = _sigmoid(z[:, 3 * units:])
+            c = f * c + i * g
+            h = o * np.tanh(c)
+            if return_sequences:
+                sequence[:, t] = h
+
+        return sequence if return_sequences else h
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Write every layer's weights and the dense activations to one .npz file"""
+        arrays = {}
+        for index, (kernel, recurrent_kernel, bias) in enumerate(self.lstm_layers):
+            arrays[f'lstm_{index}_kernel'] = kernel
+            arrays[f'lstm_{index}_recurrent_kernel'] = recurrent_kernel
+            arrays[f'lstm_{index}_bias'] = bias
+        for index, (kernel, bias, _) in enumerate(self.dense_layers):
+            arrays[f'dense_{index}_kernel'] = kernel
+            arrays[f'dense_{index}_bias'] = bias
+        arrays['dense_activations'] = np.array([activation for _, _, activation in self.dense_layers])
+        with open(path, 'wb') as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "NumpyLSTM":
+        with np.load(path) as state:
+            activations = [str(activation) for activation in state['dense_activations']]
+            n_lstm = sum(1 for name in state.files if name.endswith('_recurrent_kernel'))
+            return cls(
+                [
+                    (state[f'lstm_{i}_kernel'], state[f'lstm_{i}_recurrent_kernel'], state[f'lstm_{i}_bias'])
+                    for i in range(n_lstm)
+                ],
+                [
+                    (state[f'dense_{i}_kernel'], state[f'dense_{i}_bias'], activation)
+                    for i, activation in enumerate(activations)
+                ],
+            )
@@ -1,207 +1,330 @@
 import numpy as np
 import pandas as pd
-from typing import List, Tuple
-from sklearn.preprocessing import MinMaxScaler
-import tensorflow as tf
-from tensorflow import keras
-from tensorflow.keras import layers
-from tensorflow.keras.callbacks import Callback
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional, Sequence, Tuple
+from numpy.lib.stride_tricks import sliding_window_view
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import warnings
 warnings.filterwarnings('ignore')
 
+from domain.entities.feature_frame import FEATURE_COLUMNS, FeatureFrame
+from domain.entities.prediction import FORECAST_HORIZONS
+from domain.services.ml_model_service import MLModelService, SensorInput
+from .lstm_inference import NumpyLSTM
+from .model_executor import ModelExecutor
+from .model_store import ModelArtifactStore
+
+if TYPE_CHECKING:
+    from sklearn.preprocessing import MinMaxScaler
+
+STEPS_PER_HOUR = 12  # 5-minute intervals
+# One network output per horizon: the target of output k looks HORIZON_STEPS[k] intervals ahead
+HORIZON_STEPS = tuple(hours * STEPS_PER_HOUR for hours in FORECAST_HORIZONS)
+
+# Fitted MinMaxScaler attributes stored next to the weights
+SCALER_ATTRIBUTES = ('data_min_', 'data_max_', 'data_range_', 'scale_', 'min_', 'n_samples_seen_')
+
+
+def frost_targets(min_temperature: np.ndarray) -> np.ndarray:
+    """Continuous frost-probability target from the minimum temperature over a horizon"""
+    # Below 0°C: high probability (0.7-0.9)
+    # 0-4°C: medium probability (0.3-0.7)
+    # Above 4°C: low probability (0.05-0.3)
+    probability = np.where(
+        min_temperature <= 0,
+        np.clip((2 - min_temperature) / 4, 0.7, 0.9),
+        np.where(
+            min_temperature <= 4,
+            0.3 + (4 - min_temperature) * 0.1,
+            np.maximum(0.05, 0.3 - (min_temperature - 4) * 0.05)
+        )
+    )
+    return np.clip(probability, 0.0, 1.0)
+
+
+def create_sequences(
+    data: np.ndarray,
+    sequence_length: int,
+    horizon_steps: Sequence[int] = HORIZON_STEPS
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Windows of sequence_length rows and the frost-probability targets of the horizons after each
+
+    Window j covers rows j..j+sequence_length-1 and is a read-only strided view
+    of data, so no (N, sequence_length, features) copy is made. Only windows
+    followed by the full longest horizon are returned, so every target sees
+    its whole horizon.
+
+    Returns:
+        (windows, targets) with targets of shape (N, len(horizon_steps))
+    """
+    n_sequences = len(data) - sequence_length - max(horizon_steps) + 1
+    if n_sequences <= 0:
+        return np.empty((0, sequence_length, data.shape[1])), np.empty((0, len(horizon_steps)))
 
-class EpochProgressCallback(Callback):
-    """Custom callback to log epoch progress"""
-    def __init__(self, total_epochs):
-        super().__init__()
-        self.total_epochs = total_epochs
+    windows = sliding_window_view(data, sequence_length, axis=0)[:n_sequences].transpose(0, 2, 1)
 
-    def on_epoch_begin(self, epoch, logs=None):
-        if epoch % 5 == 0:  # Show every 5 epochs to reduce clutter
-            print(f"  [LSTM] Epoch {epoch + 1}/{self.total_epochs}...")
+    # Minimum temperature (column 0) over the next `steps` rows of each horizon; a trailing
+    # rolling minimum of the reversed column, so long horizons need no window copies
+    reversed_temperature = pd.Series(data[::-1, 0])
+    future_min = np.column_stack([
+        reversed_temperature.rolling(steps).min().to_numpy()[::-1][sequence_length:sequence_length + n_sequences]
+        for steps in horizon_steps
+    ])
 
-    def on_epoch_end(self, epoch, logs=None):
-        loss = logs.get('loss', 0)
-        val_loss = logs.get('val_loss', 0)
-        mae = logs.get('mae', 0)
-        val_mae = logs.get('val_mae', 0)
+    return windows, frost_targets(future_min)
 
-        # Show every 5 epochs or if validation is getting worse
-        if epoch % 5 == 0 or epoch == self.total_epochs - 1:
-            print(f"  [LSTM] Epoch {epoch + 1}/{self.total_epochs}: "
-                  f"Loss={loss:.4f}, Val Loss={val_loss:.4f}, "
-                  f"MAE={mae:.4f}, Val MAE={val_mae:.4f}")
 
-from domain.entities.sensor_data import SensorData
-from domain.services.ml_model_service import MLModelService
+def _fit_lstm(*args):
+    """Train in a model worker; TensorFlow is imported there, never in the API process"""
+    from .lstm_training import fit_lstm
+    return fit_lstm(*args)
 
 
 class LSTMModelService(MLModelService):
-    def __init__(self):
+    MODEL_NAME = "lstm"
+    WEIGHTS_FILE = "lstm_weights.npz"  # NumpyLSTM export; older Keras .h5 artifacts are retrained
+    SCALER_FILE = "scaler.npz"
+    VALIDATION_SPLIT = 0.2  # Most recent share of sequences held out from fitting
+    RESOLUTION = "5min"
+
+    def __init__(
+        self,
+        store: Optional[ModelArtifactStore] = None,
+        validation_tolerance: float = 0.1,
+        executor: Optional[ModelExecutor] = None,
+        model_name: Optional[str] = None
+    ):
+        self.model_name = model_name or self.MODEL_NAME  # Artifact namespace, one per sensor node
         self.model = None
-        self.scaler = MinMaxScaler()
+        self.scaler: Optional["MinMaxScaler"] = None
+        self._serving: Optional[Tuple[NumpyLSTM, "MinMaxScaler"]] = None  # Swapped as one unit
         self.sequence_length = 144  # 12 hours of 5-minute intervals
         self.n_features = 3  # temperature, humidity, wind_speed
         self.is_trained = False  # Track if model is already trained
-
-    def _prepare_data(self, sensor_data: List[SensorData]) -> pd.DataFrame:
-        df = pd.DataFrame([
-            {
-                'timestamp': data.timestamp,
-                'temperature': data.temperature,
-                'humidity': data.humidity,
-                'wind_speed': data.wind_speed
-            }
-            for data in sensor_data
-        ])
-        
-        df = df.sort_values('timestamp')
-        df.set_index('timestamp', inplace=True)
-        
-        df = df.resample('5T').mean().interpolate()
-        
-        return df[['temperature', 'humidity', 'wind_speed']]
+        self.trained_at: Optional[datetime] = None
+        self.training_end: Optional[datetime] = None  # Last timestamp of the training data
+        self.store = store  # Persists weights and scaler so restarts skip retraining
+        # Retrained candidates may be at most this much (relative) worse than the serving model
+        self.validation_tolerance = validation_tolerance
+        # Training runs on this pool; without one it runs on a thread in this process
+        self.executor = executor or ModelExecutor(max_workers=0)
+
+    def _prepare_data(self, sensor_data: SensorInput) -> pd.DataFrame:
+        # A FeatureFrame prepared upstream at our resolution is used as it is
+        return FeatureFrame.from_input(sensor_data, self.RESOLUTION).frame[FEATURE_COLUMNS]
 
     def _create_sequences(self, data: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
-        sequences = []
-        targets = []
-
-        for i in range(self.sequence_length, len(data)):
-            sequences.append(data[i-self.sequence_length:i])
-
-            # Look at next 12 intervals (1 hour ahead)
-            future_temps = data[i:min(i+12, len(data)), 0]  # Temperature is column 0
-
-            if len(future_temps) > 0:
-                min_temp = np.min(future_temps)
-
-                # Create continuous probability target based on minimum temperature
-                # Below 0°C: high probability (0.7-0.9)
-                # 0-4°C: medium probability (0.3-0.7)
-                # Above 4°C: low probability (0.05-0.3)
-                if min_temp <= 0:
-                    frost_prob = min(0.9, max(0.7, (2 - min_temp) / 4))
-                elif min_temp <= 4:
-                    frost_prob = 0.3 + (4 - min_temp) * 0.1  # 0.3 to 0.7
-                else:
-                    frost_prob = max(0.05, 0.3 - (min_temp - 4) * 0.05)
-
-                targets.append(np.clip(frost_prob, 0.0, 1.0))
-            else:
-                targets.append(0.5)  # Neutral if no future data
-
-        return np.array(sequences), np.array(targets)
-
-    def _build_model(self) -> keras.Model:
-        model = keras.Sequential([
-            layers.LSTM(50, return_sequences=True, input_shape=(self.sequence_length, self.n_features),
-                       kernel_regularizer=keras.regularizers.l2(0.001)),
-            layers.Dropout(0.3),
-            layers.LSTM(50, return_sequences=False,
-                       kernel_regularizer=keras.regularizers.l2(0.001)),
-            layers.Dropout(0.3),
-            layers.Dense(25, activation='relu',
-                        kernel_regularizer=keras.regularizers.l2(0.001)),
-            layers.Dropout(0.2),
-            layers.Dense(1, activation='sigmoid')
-        ])
-
-        model.compile(
-            optimizer=keras.optimizers.Adam(learning_rate=0.001),
-            loss='mse',  # Mean Squared Error works better for continuous targets
-            metrics=['mae']  # Mean Absolute Error
-        )
+        return create_sequences(data, self.sequence_length)
 
-        return model
+    async def _fit(self, df: pd.DataFrame) -> Tuple[NumpyLSTM, "MinMaxScaler", int, int]:
+        """Train on the model executor, which ships back the exported NumPy network"""
+        return await self.executor.run(
+            _fit_lstm, df.values, self.sequence_length, self.n_features, self.VALIDATION_SPLIT
+        )
 
-    def _train_model_sync(self, sensor_data: List[SensorData]) -> None:
-        """Synchronous training method to run in thread pool"""
+    def _install(self, model: NumpyLSTM, scaler: "MinMaxScaler", training_end: datetime) -> None:
+        """Make a trained network the serving one; predictions in flight keep the pair they already read"""
+        self._serving = (model, scaler)
+        self.model = model
+        self.scaler = scaler
+        self.training_end = training_end
+        self.trained_at = datetime.utcnow()
+        self.is_trained = True
+
+    def _validation_error(self, model: NumpyLSTM, scaler: "MinMaxScaler", df: pd.DataFrame) -> float:
+        """Mean squared error of a network on the most recent VALIDATION_SPLIT of sequences"""
+        windows, y = self._create_sequences(scaler.transform(df.values))
+        holdout = max(1, int(len(y) * self.VALIDATION_SPLIT))
+        predictions = model.predict(windows[-holdout:])
+        return float(np.mean((predictions - y[-holdout:]) ** 2))  # Over every horizon
+
+    def _accept_candidate(
+        self,
+        model: NumpyLSTM,
+        scaler: "MinMaxScaler",
+        df: pd.DataFrame,
+        epochs: int,
+        sequences: int
+    ) -> bool:
+        """
+        Score a candidate and the serving model on the most recent VALIDATION_SPLIT of
+        sequences (held out from the candidate's fit by Keras), and swap the candidate in
+        only if it is not worse by more than validation_tolerance.
+        """
+        candidate_error = self._validation_error(model, scaler, df)
+        current = self._serving
+        current_error = self._validation_error(*current, df) if current is not None else None
+        print(f"[LSTM] Holdout MSE: candidate={candidate_error:.4f}, "
+              f"current={'n/a' if current_error is None else f'{current_error:.4f}'}")
+
+        if not np.isfinite(candidate_error) or (
+            current_error is not None and candidate_error > current_error * (1 + self.validation_tolerance)
+        ):
+            print("[LSTM] ✗ Candidate rejected, keeping the current model")
+            return False
+
+        self._install(model, scaler, df.index[-1].to_pydatetime())
+        print(f"[LSTM] ✓ Candidate swapped in")
+        print("="*60 + "\n")
+
+        self._save_artifact(model, scaler, df, epochs=epochs, sequences=sequences, validation_mse=candidate_error)
+        return True
+
+    async def retrain(self, sensor_data: SensorInput) -> bool:
+        """Train and validate a replacement off the request path; the current model serves meanwhile"""
         print("\n" + "="*60)
-        print("[LSTM] Preparing data for training...")
+        print("[LSTM] Retraining candidate model in the background...")
         print("="*60)
 
-        if len(sensor_data) < self.sequence_length + 50:
-            raise ValueError("Insufficient data for LSTM training")
-
         df = self._prepare_data(sensor_data)
-        print(f"[LSTM] Data prepared: {len(df)} data points")
-
-        scaled_data = self.scaler.fit_transform(df.values)
-        print(f"[LSTM] Data scaled successfully")
-
-        X, y = self._create_sequences(scaled_data)
-        print(f"[LSTM] Created {len(X)} sequences for training")
-
-        if len(X) < 10:
-            raise ValueError("Insufficient sequences for training")
+        if len(df) < self.sequence_length + HORIZON_STEPS[-1] + 50:
+            raise ValueError("Insufficient data for LSTM retraining")
+
+        model, scaler, epochs, sequences = await self._fit(df)
+        return await asyncio.to_thread(self._accept_candidate, model, scaler, df, epochs, sequences)
+
+    def _write_artifact_files(self, directory: Path, model: NumpyLSTM, scaler: "MinMaxScaler") -> None:
+        model.save(directory / self.WEIGHTS_FILE)
+        np.savez(
+            directory / self.SCALER_FILE,
+            feature_range=np.array(scaler.feature_range),
+            **{name: np.asarray(getattr(scaler, name)) for name in SCALER_ATTRIBUTES}
+        )
 
-        self.model = self._build_model()
-        print(f"[LSTM] Model architecture built")
-        print(f"[LSTM] Starting training with 50 epochs")
-        print("-"*60)
+    def _save_artifact(
+        self,
+        model: NumpyLSTM,
+        scaler: "MinMaxScaler",
+        df: pd.DataFrame,
+        epochs: int,
+        sequences: int,
+        validation_mse: Optional[float] = None
+    ) -> None:
+        """Write weights, scaler state and metadata to the artifact store (failures are logged, not raised)"""
+        if self.store is None:
+            return
 
         try:
-            # Add early stopping to prevent overfitting
-            early_stopping = keras.callbacks.EarlyStopping(
-                monitor='val_loss',
-                patience=10,  # Stop if no improvement for 10 epochs
-                restore_best_weights=True,
-                verbose=0
+            self.store.save(
+                self.model_name,
+                lambda directory: self._write_artifact_files(directory, model, scaler),
+                {
+                    "sequence_length": self.sequence_length,
+                    "n_features": self.n_features,
+                    "horizons": list(FORECAST_HORIZONS),
+                    "features": list(df.columns),
+                    "epochs": epochs,
+                    "validation_mse": validation_mse,
+                    "training_sequences": sequences,
+                    "training_points": len(df),
+                    "training_start": df.index[0].isoformat(),
+                    "training_end": df.index[-1].isoformat(),
+                    "engine": "numpy",
+                }
             )
+        except Exception as e:
+            print(f"[LSTM] ✗ Could not save model artifact: {e}")
+
+    @staticmethod
+    def warm_up() -> None:
+        """Import scikit-learn ahead of the first prediction (TensorFlow stays in the model workers)"""
+        import sklearn.preprocessing  # noqa: F401
+
+    def restore(self) -> bool:
+        """Load the current exported network and scaler from the artifact store"""
+        if self.store is None or self.is_trained:
+            return self.is_trained
+
+        current = self.store.load_current(self.model_name)
+        if current is None:
+            print("[LSTM] No stored model found, will train on first prediction")
+            return False
+
+        directory, metadata = current
+        if (metadata.get("sequence_length"), metadata.get("n_features")) != (self.sequence_length, self.n_features):
+            print(f"[LSTM] Ignoring stored model {metadata.get('version')}: input shape changed")
+            return False
+        if metadata.get("horizons", [1]) != list(FORECAST_HORIZONS):
+            print(f"[LSTM] Ignoring stored model {metadata.get('version')}: forecast horizons changed")
+            return False
 
-            epoch_callback = EpochProgressCallback(total_epochs=50)
-
-            print(f"[LSTM] Target statistics:")
-            print(f"[LSTM]   Min target: {y.min():.2f}, Max target: {y.max():.2f}, Mean: {y.mean():.2f}")
-            print(f"[LSTM]   High frost targets (>0.6): {(y > 0.6).sum()}/{len(y)}")
-
-            self.model.fit(
-                X, y,
-                epochs=50, 
-                batch_size=32,
-                validation_split=0.2,
-                callbacks=[epoch_callback, early_stopping],
-                verbose=0
-            )
-            self.is_trained = True
-            print("-"*60)
-            print("[LSTM] ✓ Training completed successfully!")
-            print(f"[LSTM] Training stopped at epoch {len(self.model.history.history['loss'])}")
-            print("="*60 + "\n")
+        try:
+            model = NumpyLSTM.load(Path(directory) / self.WEIGHTS_FILE)
+            if model.input_features != self.n_features:
+                raise ValueError(f"network expects {model.input_features} features")
+
+            from sklearn.preprocessing import MinMaxScaler
+            scaler = MinMaxScaler()
+            with np.load(Path(directory) / self.SCALER_FILE) as state:
+                scaler.feature_range = tuple(state['feature_range'].tolist())
+                for name in SCALER_ATTRIBUTES:
+                    value = state[name]
+                    setattr(scaler, name, value.item() if value.ndim == 0 else value)
+            scaler.n_features_in_ = len(scaler.scale_)
         except Exception as e:
-            print(f"[LSTM] ✗ Error training model: {e}")
-            raise
+            print(f"[LSTM] ✗ Could not load stored model {metadata.get('version')}: {e}")
+            return False
+
+        self._install(model, scaler, datetime.fromisoformat(metadata['training_end']))
+        self.trained_at = datetime.fromisoformat(metadata['saved_at'])
+        print(f"[LSTM] ✓ Loaded stored model {metadata['version']} "
+              f"(trained on {metadata.get('training_start')} → {metadata.get('training_end')})")
+        return True
 
-    async def train_model(self, sensor_data: List[SensorData]) -> None:
-        """Async wrapper that runs training in a thread pool"""
+    async def train_model(self, sensor_data: SensorInput) -> None:
+        """Train on the model executor and install the exported network it ships back"""
         if self.is_trained:
             print("[LSTM] ⚡ Using cached model (already trained, prediction will be instant)")
             return
 
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            await loop.run_in_executor(executor, self._train_model_sync, sensor_data)
+        print("\n" + "="*60)
+        print("[LSTM] Preparing data for training...")
+        print("="*60)
+
+        if len(sensor_data) < self.sequence_length + HORIZON_STEPS[-1] + 50:
+            raise ValueError("Insufficient data for LSTM training")
+
+        df = self._prepare_data(sensor_data)
+        print(f"[LSTM] Data prepared: {len(df)} data points")
+
+        model, scaler, epochs, sequences = await self._fit(df)
+        self._install(model, scaler, df.index[-1].to_pydatetime())
+        print("="*60 + "\n")
+
+        await asyncio.to_thread(self._save_artifact, model, scaler, df, epochs=epochs, sequences=sequences)
+
+    async def predict_frost_horizons(
+        self,
+        sensor_data: SensorInput,
+        horizons: Sequence[int] = FORECAST_HORIZONS
+    ) -> Dict[int, float]:
+        # The network has one output per FORECAST_HORIZONS entry; anything else is a caller error,
+        # not a prediction failure to hide behind a neutral probability
+        unsupported = sorted(set(horizons) - set(FORECAST_HORIZONS))
+        if unsupported:
+            raise ValueError(f"LSTM has no output for horizons {unsupported} h, expected {list(FORECAST_HORIZONS)}")
 
-    async def predict_frost_probability(self, sensor_data: List[SensorData]) -> float:
+        features = FeatureFrame.from_input(sensor_data, self.RESOLUTION)  # Once for training and prediction
         if not self.is_trained:
-            await self.train_model(sensor_data)
+            await self.train_model(features)
         
         try:
-            df = self._prepare_data(sensor_data)
-            scaled_data = self.scaler.transform(df.values)
+            model, scaler = self._serving
+            df = self._prepare_data(features)
+            scaled_data = scaler.transform(df.values)
             
             if len(scaled_data) < self.sequence_length:
-                return 0.5  # Default neutral probability
+                return {hours: 0.5 for hours in horizons}  # Default neutral probability
             
             last_sequence = scaled_data[-self.sequence_length:].reshape(1, self.sequence_length, self.n_features)
             
-            prediction = self.model.predict(last_sequence, verbose=0)
-            probability = float(prediction[0][0])
+            # One NumPy forward pass (a few milliseconds) gives every horizon: one output each
+            prediction = np.clip(model.predict(last_sequence)[0], 0.0, 1.0)
             
-            return np.clip(probability, 0.0, 1.0)
+            return {hours: float(prediction[FORECAST_HORIZONS.index(hours)]) for hours in horizons}
             
         except Exception as e:
             print(f"Error making LSTM prediction: {e}")
-            return 0.5  # Default neutral probability
\ No newline at end of file
+            return {hours: 0.5 for hours in horizons}  # Default neutral probability
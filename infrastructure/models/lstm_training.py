@@ -0,0 +1,158 @@
+"""
+TensorFlow side of the LSTM: network definition and training.
+
+Only model worker processes import this module; the API process serves the
+trained network through NumpyLSTM and never loads TensorFlow.
+"""
+from typing import Tuple
+
+import numpy as np
+from sklearn.preprocessing import MinMaxScaler
+import tensorflow as tf
+from tensorflow import keras
+from tensorflow.keras import layers
+from tensorflow.keras.callbacks import Callback
+import warnings
+warnings.filterwarnings('ignore')
+
+from .lstm_inference import NumpyLSTM
+from .lstm_model import HORIZON_STEPS, create_sequences
+
+BATCH_SIZE = 32
+
+
+class EpochProgressCallback(Callback):
+    """Custom callback to log epoch progress"""
+    def __init__(self, total_epochs):
+        super().__init__()
+        self.total_epochs = total_epochs
+
+    def on_epoch_begin(self, epoch, logs=None):
+        if epoch % 5 == 0:  # Show every 5 epochs to reduce clutter
+            print(f"  [LSTM] Epoch {epoch + 1}/{self.total_epochs}...")
+
+    def on_epoch_end(self, epoch, logs=None):
+        loss = logs.get('loss', 0)
+        val_loss = logs.get('val_loss', 0)
+        mae = logs.get('mae', 0)
+        val_mae = logs.get('val_mae', 0)
+
+        # Show every 5 epochs or if validation is getting worse
+        if epoch % 5 == 0 or epoch == self.total_epochs - 1:
+            print(f"  [LSTM] Epoch {epoch + 1}/{self.total_epochs}: "
+                  f"Loss={loss:.4f}, Val Loss={val_loss:.4f}, "
+                  f"MAE={mae:.4f}, Val MAE={val_mae:.4f}")
+
+
+def sequence_dataset(
+    data: np.ndarray,
+    targets: np.ndarray,
+    sequence_length: int,
+    starts: np.ndarray,
+    shuffle: bool = False
+) -> tf.data.Dataset:
+    """
+    Batches of (window, target) for the windows starting at starts, cut from data on the fly
+
+    Only data and one batch of windows are held in memory, however long the history.
+    """
+    data = tf.constant(data, dtype=tf.float32)
+    targets = tf.constant(targets, dtype=tf.float32)
+    offsets = tf.range(sequence_length, dtype=tf.int64)
+
+    dataset = tf.data.Dataset.from_tensor_slices(np.asarray(starts, dtype=np.int64))
+    if shuffle:
+        dataset = dataset.shuffle(len(starts), reshuffle_each_iteration=True)
+
+    def windows(batch_starts):
+        return tf.gather(data, batch_starts[:, tf.newaxis] + offsets), tf.gather(targets, batch_starts)
+
+    return dataset.batch(BATCH_SIZE).map(windows, num_parallel_calls=tf.data.AUTOTUNE).prefetch(tf.data.AUTOTUNE)
+
+
+def build_lstm_model(sequence_length: int, n_features: int) -> keras.Model:
+    model = keras.Sequential([
+        layers.LSTM(50, return_sequences=True, input_shape=(sequence_length, n_features),
+                   kernel_regularizer=keras.regularizers.l2(0.001)),
+        layers.Dropout(0.3),
+        layers.LSTM(50, return_sequences=False,
+                   kernel_regularizer=keras.regularizers.l2(0.001)),
+        layers.Dropout(0.3),
+        layers.Dense(25, activation='relu',
+                    kernel_regularizer=keras.regularizers.l2(0.001)),
+        layers.Dropout(0.2),
+        layers.Dense(len(HORIZON_STEPS), activation='sigmoid')  # One frost probability per horizon
+    ])
+
+    model.compile(
+        optimizer=keras.optimizers.Adam(learning_rate=0.001),
+        loss='mse',  # Mean Squared Error works better for continuous targets
+        metrics=['mae']  # Mean Absolute Error
+    )
+
+    return model
+
+
+def fit_lstm(
+    values: np.ndarray,
+    sequence_length: int,
+    n_features: int,
+    validation_split: float
+) -> Tuple[NumpyLSTM, MinMaxScaler, int, int]:
+    """
+    Scale, sequence and train a fresh network on prepared feature rows
+
+    Runs in a ModelExecutor worker process. Keras models do not pickle
+    reliably, so the trained weights are exported to a NumpyLSTM, which
+    the API process serves without TensorFlow.
+
+    Returns:
+        (inference engine, fitted scaler, epochs run, number of training sequences)
+    """
+    scaler = MinMaxScaler()
+    scaled_data = scaler.fit_transform(values)
+    print(f"[LSTM] Data scaled successfully")
+
+    _, y = create_sequences(scaled_data, sequence_length)
+    print(f"[LSTM] Created {len(y)} sequences for training")
+
+    if len(y) < 10:
+        raise ValueError("Insufficient sequences for training")
+
+    model = build_lstm_model(sequence_length, n_features)
+    print(f"[LSTM] Model architecture built")
+    print(f"[LSTM] Starting training with 50 epochs")
+    print("-"*60)
+
+    try:
+        # Add early stopping to prevent overfitting
+        early_stopping = keras.callbacks.EarlyStopping(
+            monitor='val_loss',
+            patience=10,  # Stop if no improvement for 10 epochs
+            restore_best_weights=True,
+            verbose=0
+        )
+
+        epoch_callback = EpochProgressCallback(total_epochs=50)
+
+        print(f"[LSTM] Target statistics:")
+        print(f"[LSTM]   Min target: {y.min():.2f}, Max target: {y.max():.2f}, Mean: {y.mean():.2f}")
+        print(f"[LSTM]   High frost targets (>0.6): {(y > 0.6).sum(axis=0).tolist()}/{len(y)} per horizon")
+
+        # Most recent validation_split of sequences validates, like Keras' validation_split
+        split_at = int(len(y) * (1 - validation_split))
+        history = model.fit(
+            sequence_dataset(scaled_data, y, sequence_length, np.arange(split_at), shuffle=True),
+            validation_data=sequence_dataset(scaled_data, y, sequence_length, np.arange(split_at, len(y))),
+            epochs=50,
+            callbacks=[epoch_callback, early_stopping],
+            verbose=0
+        )
+        epochs = len(history.history['loss'])
+        print("-"*60)
+        print("[LSTM] ✓ Training completed successfully!")
+        print(f"[LSTM] Training stopped at epoch {epochs}", flush=True)
+        return NumpyLSTM.from_keras(model), scaler, epochs, len(y)
+    except Exception as e:
+        print(f"[LSTM] ✗ Error training model: {e}")
+        raise
@@ -0,0 +1,48 @@
+import asyncio
+import functools
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+
+class ModelExecutor:
+    """
+    Long-lived worker pool for CPU-bound model fitting.
+
+    SARIMA and LSTM fits hold the GIL for minutes, so they run in worker
+    processes and ship the fitted state back to the API process. Workers are
+    spawned rather than forked (TensorFlow is not fork-safe) on first use and
+    then reused, so each one pays the statsmodels/TensorFlow import only once.
+    With max_workers=0 work runs on a single thread in this process instead.
+
+    Functions submitted to run() must be module-level and take and return
+    picklable values.
+    """
+
+    def __init__(self, max_workers: int = 2):
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.max_workers > 0:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                print(f"[MODEL EXECUTOR] Started {self.max_workers} model worker processes")
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="model-worker")
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run a CPU-bound model call on the pool and await its result"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), functools.partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop accepting work and wait for in-flight fits"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
+            print("[MODEL EXECUTOR] Model workers stopped")
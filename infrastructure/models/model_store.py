@@ -0,0 +1,115 @@
+import json
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Bump when the on-disk layout of an artifact changes; older artifacts are then ignored
+ARTIFACT_FORMAT_VERSION = 1
+
+CURRENT_POINTER = "CURRENT"
+METADATA_FILE = "metadata.json"
+
+
+class ModelArtifactStore:
+    """
+    Versioned, on-disk store for trained model artifacts.
+
+    Layout under base_path:
+        <model_name>/v0001/...          files written by the model service
+        <model_name>/v0001/metadata.json
+        <model_name>/CURRENT            name of the version to load on boot
+
+    A version is written into a temporary directory and renamed into place,
+    then CURRENT is swapped with os.replace, so a crash mid-save never leaves
+    a half-written artifact behind the pointer.
+    """
+
+    def __init__(self, base_path: str, versions_kept: int = 3):
+        self.base_path = Path(base_path)
+        self.versions_kept = versions_kept
+
+    def save(self, model_name: str, write_files: Callable[[Path], None], metadata: Dict[str, Any]) -> str:
+        """
+        Write a new version of a model and make it current
+
+        Args:
+            model_name: Artifact namespace, e.g. "sarima"
+            write_files: Callback that writes the model files into the given directory
+            metadata: JSON-serializable description (training data range, parameters, ...)
+
+        Returns:
+            The new version name (e.g. "v0003")
+        """
+        model_dir = self.base_path / model_name
+        model_dir.mkdir(parents=True, exist_ok=True)
+
+        staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=model_dir))
+        try:
+            write_files(staging)
+            version = self._next_version(model_dir)
+            metadata = {
+                **metadata,
+                "model": model_name,
+                "version": version,
+                "format_version": ARTIFACT_FORMAT_VERSION,
+                "saved_at": datetime.utcnow().isoformat(),
+            }
+            (staging / METADATA_FILE).write_text(json.dumps(metadata, indent=2, default=str))
+            os.rename(staging, model_dir / version)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+        self._write_pointer(model_dir, version)
+        self._prune(model_dir, keep=version)
+        print(f"[MODEL STORE] Saved {model_name} {version} to {model_dir / version}")
+        return version
+
+    def load_current(self, model_name: str) -> Optional[Tuple[Path, Dict[str, Any]]]:
+        """
+        Locate the current version of a model
+
+        Returns:
+            (directory, metadata) of the current version, or None if nothing usable is stored
+        """
+        model_dir = self.base_path / model_name
+        try:
+            version = (model_dir / CURRENT_POINTER).read_text().strip()
+            metadata = json.loads((model_dir / version / METADATA_FILE).read_text())
+        except (OSError, ValueError):
+            return None
+
+        if metadata.get("format_version") != ARTIFACT_FORMAT_VERSION:
+            print(f"[MODEL STORE] Ignoring {model_name} {version}: artifact format {metadata.get('format_version')}")
+            return None
+        return model_dir / version, metadata
+
+    def list_versions(self, model_name: str) -> List[str]:
+        """Stored versions of a model, oldest first"""
+        model_dir = self.base_path / model_name
+        if not model_dir.is_dir():
+            return []
+        return sorted(p.name for p in model_dir.iterdir() if p.is_dir() and p.name.startswith("v"))
+
+    def _next_version(self, model_dir: Path) -> str:
+        versions = [int(name[1:]) for name in self.list_versions(model_dir.name) if name[1:].isdigit()]
+        return f"v{(max(versions) if versions else 0) + 1:04d}"
+
+    @staticmethod
+    def _write_pointer(model_dir: Path, version: str) -> None:
+        fd, tmp_path = tempfile.mkstemp(prefix=".current-", dir=model_dir)
+        with os.fdopen(fd, "w") as f:
+            f.write(version)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, model_dir / CURRENT_POINTER)
+
+    def _prune(self, model_dir: Path, keep: str) -> None:
+        """Remove the oldest versions beyond versions_kept (never the current one)"""
+        versions = self.list_versions(model_dir.name)
+        for version in versions[:max(0, len(versions) - self.versions_kept)]:
+            if version != keep:
+                shutil.rmtree(model_dir / version, ignore_errors=True)
@@ -1,115 +1,571 @@
 import numpy as np
 import pandas as pd
-from typing import List
-from statsmodels.tsa.statespace.sarimax import SARIMAX
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import signal
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
-from domain.entities.sensor_data import SensorData
-from domain.services.ml_model_service import MLModelService
+from domain.entities.feature_frame import FeatureFrame
+from domain.entities.prediction import FORECAST_HORIZONS
+from domain.services.ml_model_service import MLModelService, SensorInput
+from .model_executor import ModelExecutor
+from .model_store import ModelArtifactStore
 
+# Default configuration, used until an order search (SARIMA_ORDER_SEARCH) selects another
+SARIMA_ORDER = (0, 0, 1)
+SARIMA_SEASONAL_ORDER = (0, 1, 1, 24)  # 24 * 15min = 6 hours
 
-class SARIMAModelService(MLModelService):
-    def __init__(self):
-        self.model = None
-        self.fitted_model = None
-        self.is_trained = False  # Track if model is already trained
+# Candidates of the order search; the seasonal period stays at 6 hours
+SARIMA_ORDER_GRID = [
+    ((p, 0, q), (P, 1, 1, 24))
+    for p in (0, 1, 2) for q in (0, 1) for P in (0, 1)
+    if (p, q) != (0, 0)
+]
+ORDER_SEARCH_HOLDOUT = 96  # Candidates forecast the last day (96 * 15min) in 3-hour steps
 
-    def _prepare_data(self, sensor_data: List[SensorData]) -> pd.Series:
-        df = pd.DataFrame([
-            {
-                'timestamp': data.timestamp,
-                'temperature': data.temperature
-            }
-            for data in sensor_data
-        ])
 
-        df = df.sort_values('timestamp')
-        df.set_index('timestamp', inplace=True)
+def frost_probability(min_forecast_temperature: np.ndarray) -> np.ndarray:
+    """Frost probability from the minimum forecast temperature over a horizon (3 hours by default)"""
+    # At or below 0°C: 0.1-0.9 rising as it gets colder; above: (4 - t) / 8, at least 0.05
+    probability = np.where(
+        min_forecast_temperature <= 0,
+        np.clip((2 - min_forecast_temperature) / 4, 0.1, 0.9),
+        np.maximum(0.05, (4 - min_forecast_temperature) / 8)
+    )
+    return np.clip(probability, 0.0, 1.0)
 
-        # Resample to 15-minute intervals instead of 5-minute to reduce memory usage
-        # This reduces data points by 3x while maintaining pattern accuracy
-        df = df.resample('15T').mean().interpolate()
 
-        return df['temperature']
+def forecast_paths(results, states: np.ndarray, steps: int) -> np.ndarray:
+    """
+    Point forecasts of the next `steps` buckets from one or more predicted states
 
-    def _train_model_sync(self, sensor_data: List[SensorData]) -> None:
-        """Synchronous training method to run in thread pool"""
-        import time
+    Runs the state-space recursion directly on the system matrices, which are
+    time-invariant without exogenous regressors. Same values as
+    results.forecast(), without its per-call model extension, and for many
+    states at once.
 
-        print("\n" + "="*60)
-        print("[SARIMA] Preparing temperature data for training...")
-        print("="*60)
+    Args:
+        results: SARIMAX results supplying the system matrices
+        states: Predicted state(s), shape (k_states,) or (k_states, n), e.g.
+            results.predicted_state[:, -1] for the step after the last observation
+        steps: Buckets ahead
 
-        if len(sensor_data) < 50:  # At least ~3 hours of data
-            raise ValueError("Insufficient data for SARIMA training")
+    Returns:
+        Forecasts of shape (steps,) or (steps, n)
+    """
+    ssm = results.model.ssm
+    k = ssm.k_states
+    transition = np.reshape(ssm['transition'], (k, k))
+    design = np.reshape(ssm['design'], k)
+    state_intercept = np.reshape(ssm['state_intercept'], k)
+    obs_intercept = float(np.reshape(ssm['obs_intercept'], -1)[0])
 
-        start_time = time.time()
-        temperature_series = self._prepare_data(sensor_data)
-        print(f"[SARIMA] Temperature series prepared: {len(temperature_series)} data points")
-        print(f"[SARIMA] Data preparation took {time.time() - start_time:.2f} seconds")
+    state = np.asarray(states, dtype=float)
+    intercept = state_intercept if state.ndim == 1 else state_intercept[:, np.newaxis]
+    forecasts = np.empty((steps,) + state.shape[1:])
+    for step in range(steps):
+        forecasts[step] = obs_intercept + design @ state
+        state = transition @ state + intercept
+    return forecasts
 
-        try:
-            print(f"[SARIMA] Building SARIMAX model with order=(0,0,1) seasonal=(0,1,1,24)...")
+
+class FitTimeout(Exception):
+    """A fit ran past its time limit and was abandoned"""
+
+
+class _FitDeadline:
+    """
+    Wall-clock limit on a fit, raising FitTimeout once time_limit seconds have passed
+
+    Used as a context manager around the whole fit. On the main thread, which
+    is where ModelExecutor worker processes run their jobs, a SIGALRM timer
+    interrupts the fit wherever it is, including a slow likelihood evaluation
+    or the start_params estimation. Signals cannot reach other threads, so on
+    the in-process thread (ModelExecutor(max_workers=0)) the limit is only
+    checked between optimizer iterations, through the callback.
+    """
+
+    def __init__(self, label: str, time_limit: Optional[float]):
+        self.label = label
+        self.time_limit = time_limit
+        self.start = time.time()
+        self._previous_handler = None
+
+    def __enter__(self) -> "_FitDeadline":
+        self.start = time.time()
+        if self.time_limit is not None and threading.current_thread() is threading.main_thread():
+            self._previous_handler = signal.signal(signal.SIGALRM, self._expire)
+            signal.setitimer(signal.ITIMER_REAL, self.time_limit)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._previous_handler is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler)
+            self._previous_handler = None
+
+    def _expire(self, signum, frame) -> None:
+        raise FitTimeout(f"{self.label} fit exceeded {self.time_limit:g}s")
+
+    def __call__(self, params=None) -> None:
+        """Optimizer callback; also raises if the timer fired while the fit swallowed the error"""
+        if self.time_limit is not None and time.time() - self.start > self.time_limit:
+            self._expire(None, None)
+
+
+def fit_sarima(
+    temperature_series: pd.Series,
+    order: Tuple[int, int, int] = SARIMA_ORDER,
+    seasonal_order: Tuple[int, int, int, int] = SARIMA_SEASONAL_ORDER,
+    start_params: Optional[np.ndarray] = None,
+    time_limit: Optional[float] = None
+):
+    """
+    Fit SARIMAX on a prepared 15-minute series
+
+    Module-level so it can run in a ModelExecutor worker process; the fitted
+    results are pickled back to the caller.
+
+    Args:
+        temperature_series: Prepared 15-minute series
+        order, seasonal_order: SARIMAX configuration
+        start_params: Parameters to start the optimizer from, e.g. those of the
+            previous fit of the same configuration, which converges in fewer iterations
+        time_limit: Wall-clock seconds after which the fit is abandoned with FitTimeout
+            (see _FitDeadline; between optimizer iterations only when run on a thread)
+
+    Returns:
+        (fitted results, fit time in seconds)
+    """
+    from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+    deadline = _FitDeadline(f"SARIMA{order}{seasonal_order}", time_limit)
+    try:
+        with deadline:
+            print(f"[SARIMA] Building SARIMAX model with order={order} seasonal={seasonal_order}...")
             model_start = time.time()
 
             # Optimized for production: 15-min intervals, 24 periods = 6 hours
-            # Simplified seasonal order (0,1,1) instead of (0,1,2) to reduce complexity
-            self.model = SARIMAX(
+            model = SARIMAX(
                 temperature_series,
-                order=(0, 0, 1),
-                seasonal_order=(0, 1, 1, 24),  # 24 * 15min = 6 hours
+                order=order,
+                seasonal_order=seasonal_order,
                 enforce_stationarity=False,
                 enforce_invertibility=False
             )
             print(f"[SARIMA] Model structure created in {time.time() - model_start:.2f} seconds")
-            print(f"[SARIMA] Starting model fitting (this will take 5-10 minutes on first run)...")
+            print(f"[SARIMA] Starting model fitting{' (warm start)' if start_params is not None else ''}...")
             print("-"*60)
 
             fit_start = time.time()
-            self.fitted_model = self.model.fit(disp=False)
+            fitted_model = model.fit(disp=False, start_params=start_params, callback=deadline)
+            deadline()
             fit_time = time.time() - fit_start
+
+        print("-"*60)
+        print(f"[SARIMA] ✓ Model fitting completed in {fit_time:.2f} seconds!", flush=True)
+        return fitted_model, fit_time
+
+    except FitTimeout:
+        raise
+    except Exception as e:
+        print(f"[SARIMA] ✗ Error training model: {e}")
+        import traceback
+        traceback.print_exc()
+        raise
+
+
+def score_sarima_order(
+    temperature_series: pd.Series,
+    order: Tuple[int, int, int],
+    seasonal_order: Tuple[int, int, int, int],
+    forecast_steps: int,
+    time_limit: Optional[float]
+) -> Tuple[float, float, float, np.ndarray]:
+    """
+    Fit one order-search candidate on all but the last ORDER_SEARCH_HOLDOUT points
+    and score its forecasts over them
+
+    The holdout is forecast forecast_steps at a time, filtering the observed points
+    in between, like the serving model does between predictions. Module-level so
+    candidates run in parallel on the ModelExecutor.
+
+    Returns:
+        (AIC, holdout MAE in °C, fit time in seconds, fitted parameters)
+    """
+    train = temperature_series.iloc[:-ORDER_SEARCH_HOLDOUT]
+    holdout = temperature_series.iloc[-ORDER_SEARCH_HOLDOUT:].to_numpy()
+    fitted, fit_time = fit_sarima(train, order, seasonal_order, time_limit=time_limit)
+
+    errors = []
+    results = fitted
+    for origin in range(0, len(holdout) - forecast_steps + 1, forecast_steps):
+        actual = holdout[origin:origin + forecast_steps]
+        errors.append(np.abs(np.asarray(results.forecast(steps=forecast_steps)) - actual))
+        results = results.extend(actual)
+    return float(fitted.aic), float(np.mean(errors)), fit_time, np.asarray(fitted.params)
+
+
+class SARIMAModelService(MLModelService):
+    MODEL_NAME = "sarima"
+    RESULTS_FILE = "sarimax_results.pkl"
+    FORECAST_STEPS = 12  # 12 * 15min = 3 hours
+    HEADLINE_HORIZON = 3  # FORECAST_STEPS in hours
+    DRIFT_WINDOW = 24  # One-step errors (6 hours) compared against the training residuals
+    RESOLUTION = "15min"  # 15-minute rather than 5-minute buckets: 3x fewer points, same daily pattern
+    updates_incrementally = True
+
+    def __init__(
+        self,
+        store: Optional[ModelArtifactStore] = None,
+        validation_tolerance: float = 0.1,
+        executor: Optional[ModelExecutor] = None,
+        drift_threshold: float = 2.0,
+        model_name: Optional[str] = None,
+        order_search: bool = False,
+        order_search_timeout: float = 300.0,
+        order_search_interval: timedelta = timedelta(days=7)
+    ):
+        self.model_name = model_name or self.MODEL_NAME  # Artifact namespace, one per sensor node
+        self.model = None
+        self.fitted_model = None
+        # Serving results and the last 15-min bucket filtered into them, swapped as one unit
+        self._serving: Optional[Tuple[object, pd.Timestamp]] = None
+        self._serving_lock = threading.Lock()
+        self.is_trained = False  # Track if model is already trained
+        self.trained_at: Optional[datetime] = None
+        self.training_end: Optional[datetime] = None  # Last timestamp of the training series
+        self.store = store  # Persists fitted results so restarts skip refitting
+        # Retrained candidates may be at most this much (relative) worse than the serving model
+        self.validation_tolerance = validation_tolerance
+        # Fits run on this pool; without one they run on a thread in this process
+        self.executor = executor or ModelExecutor(max_workers=0)
+        # Drift: recent one-step errors above this multiple of the in-sample error
+        self.drift_threshold = drift_threshold
+        self.baseline_error: Optional[float] = None
+        self._recent_errors = deque(maxlen=self.DRIFT_WINDOW)
+        self.drift_detected = False
+        # Configuration of the next fit; an order search during retraining may replace it
+        self.order = SARIMA_ORDER
+        self.seasonal_order = SARIMA_SEASONAL_ORDER
+        self.order_search = order_search
+        self.order_search_timeout = order_search_timeout  # Seconds per candidate fit
+        self.order_search_interval = order_search_interval
+        self.order_searched_at: Optional[datetime] = None
+
+    def _prepare_data(self, sensor_data: SensorInput) -> pd.Series:
+        # A FeatureFrame prepared upstream at our resolution is used as it is
+        return FeatureFrame.from_input(sensor_data, self.RESOLUTION).frame['temperature']
+
+    def _install(self, fitted_model, training_end: datetime) -> None:
+        """Make a fitted model the serving one; predictions in flight keep the results they already read"""
+        residuals = np.asarray(fitted_model.resid)[fitted_model.loglikelihood_burn:]
+        with self._serving_lock:
+            self._serving = (fitted_model, pd.Timestamp(training_end))
+            self.fitted_model = fitted_model
+            self.model = fitted_model.model
+            self.training_end = training_end
+            self.trained_at = datetime.utcnow()
             self.is_trained = True
+            self.baseline_error = float(np.mean(np.abs(residuals))) if len(residuals) else None
+            self._recent_errors.clear()
+            self.drift_detected = False
 
-            print("-"*60)
-            print(f"[SARIMA] ✓ Model fitting completed in {fit_time:.2f} seconds!")
-            print(f"[SARIMA] Total training time: {time.time() - start_time:.2f} seconds")
-            print("="*60 + "\n")
+    def _update_state(self, temperature_series: pd.Series):
+        """
+        Filter buckets newer than the serving state through it, keeping the fitted parameters
+
+        Every new bucket but the newest is committed to the serving state. The newest
+        may still be filling, so it only enters the returned results used for this
+        forecast. Costs milliseconds, against minutes for a refit.
+
+        Returns:
+            Results whose state ends at the newest bucket of temperature_series
+        """
+        with self._serving_lock:
+            fitted_model, state_end = self._serving
+            start = temperature_series.index.searchsorted(state_end, side='right')
+            new = temperature_series.iloc[start:]
+            if new.empty:
+                return fitted_model
+
+            complete = new.iloc[:-1]
+            if not complete.empty:
+                if complete.index[0] - state_end == temperature_series.index.freq:
+                    fitted_model = fitted_model.extend(complete)
+                    self._record_errors(fitted_model.forecasts_error[0])
+                else:
+                    # Gap since the serving state (e.g. a long outage): re-filter the
+                    # whole series with the fitted parameters instead
+                    fitted_model = fitted_model.apply(temperature_series.iloc[:-1], refit=False)
+                self._serving = (fitted_model, complete.index[-1])
+                self.fitted_model = fitted_model
+
+        return fitted_model.extend(new.iloc[-1:])
+
+    def _record_errors(self, errors: np.ndarray) -> None:
+        """Track recent one-step-ahead errors and flag drift when they outgrow the in-sample error"""
+        self._recent_errors.extend(np.abs(errors[np.isfinite(errors)]))
+        if self.baseline_error is None or len(self._recent_errors) < self.DRIFT_WINDOW:
+            return
+
+        recent_error = float(np.mean(self._recent_errors))
+        drifted = recent_error > self.drift_threshold * self.baseline_error
+        if drifted and not self.drift_detected:
+            print(f"[SARIMA] ⚠ Forecast drift: recent one-step MAE {recent_error:.3f}°C vs "
+                  f"{self.baseline_error:.3f}°C in-sample, model will be refitted")
+        self.drift_detected = drifted
 
+    def _forecast_error(self, fitted_model, train: pd.Series, holdout: pd.Series) -> float:
+        """Mean absolute error of a model's forecast over holdout, after filtering it through train"""
+        forecast = fitted_model.apply(train, refit=False).forecast(steps=len(holdout))
+        return float(np.mean(np.abs(np.asarray(forecast) - holdout.to_numpy())))
+
+    def _accept_candidate(self, candidate, fit_time: float, temperature_series: pd.Series) -> bool:
+        """
+        Score a candidate fitted on all but the last FORECAST_STEPS points against the
+        serving model on them, and swap it in only if it is not worse by more than
+        validation_tolerance.
+        """
+        train = temperature_series.iloc[:-self.FORECAST_STEPS]
+        holdout = temperature_series.iloc[-self.FORECAST_STEPS:]
+
+        candidate_error = self._forecast_error(candidate, train, holdout)
+        current = self._serving[0] if self._serving is not None else None
+        current_error = self._forecast_error(current, train, holdout) if current is not None else None
+        print(f"[SARIMA] Holdout MAE: candidate={candidate_error:.3f}°C, "
+              f"current={'n/a' if current_error is None else f'{current_error:.3f}°C'}")
+
+        if not np.isfinite(candidate_error) or (
+            current_error is not None and candidate_error > current_error * (1 + self.validation_tolerance)
+        ):
+            print("[SARIMA] ✗ Candidate rejected, keeping the current model")
+            return False
+
+        # Extend the candidate's state through the holdout without refitting
+        candidate = candidate.append(holdout)
+        self._install(candidate, temperature_series.index[-1].to_pydatetime())
+        print(f"[SARIMA] ✓ Candidate swapped in")
+        print("="*60 + "\n")
+
+        self._save_artifact(candidate, temperature_series, fit_time, validation_mae=candidate_error)
+        return True
+
+    def _start_params(self) -> Optional[np.ndarray]:
+        """Parameters of the serving model if it has the configuration of the next fit"""
+        current = self._serving[0] if self._serving is not None else None
+        if current is None or (current.model.order, current.model.seasonal_order) != (self.order, self.seasonal_order):
+            return None
+        return np.asarray(current.params)
+
+    def _order_search_due(self) -> bool:
+        return self.order_search and (
+            self.order_searched_at is None
+            or datetime.utcnow() - self.order_searched_at >= self.order_search_interval
+        )
+
+    async def _search_order(
+        self,
+        temperature_series: pd.Series,
+        candidates: Sequence[Tuple[Tuple[int, int, int], Tuple[int, int, int, int]]] = SARIMA_ORDER_GRID
+    ) -> Optional[np.ndarray]:
+        """
+        Fit every candidate configuration in parallel on the model executor and make the one
+        forecasting the held-out last day best (lowest MAE, then AIC) the configuration of
+        the next fits
+
+        Candidates that fail or exceed order_search_timeout are dropped.
+
+        Returns:
+            The winner's parameters, to start its final fit from, or None if no candidate finished
+        """
+        print(f"[SARIMA] Searching {len(candidates)} orders in parallel "
+              f"(holdout {ORDER_SEARCH_HOLDOUT} points, {self.order_search_timeout:.0f}s limit each)...")
+        search_start = time.time()
+        results = await asyncio.gather(*(
+            self.executor.run(
+                score_sarima_order, temperature_series, order, seasonal_order,
+                self.FORECAST_STEPS, self.order_search_timeout
+            )
+            for order, seasonal_order in candidates
+        ), return_exceptions=True)
+
+        scored = []
+        for (order, seasonal_order), result in zip(candidates, results):
+            if isinstance(result, BaseException):
+                print(f"[SARIMA]   {order}{seasonal_order}: ✗ {result}")
+                continue
+            aic, mae, fit_time, params = result
+            print(f"[SARIMA]   {order}{seasonal_order}: holdout MAE {mae:.3f}°C, AIC {aic:.1f}, fit {fit_time:.1f}s")
+            if np.isfinite(mae):
+                scored.append((round(mae, 3), aic, order, seasonal_order, params))
+
+        self.order_searched_at = datetime.utcnow()
+        if not scored:
+            print(f"[SARIMA] ✗ No order candidate finished, keeping {self.order}{self.seasonal_order}")
+            return None
+
+        mae, aic, self.order, self.seasonal_order, params = min(scored, key=lambda s: (s[0], s[1]))
+        print(f"[SARIMA] ✓ Selected {self.order}{self.seasonal_order} (holdout MAE {mae:.3f}°C) "
+              f"in {time.time() - search_start:.1f}s")
+        return params
+
+    async def retrain(self, sensor_data: SensorInput) -> bool:
+        """Fit and validate a replacement off the request path; the current model serves meanwhile"""
+        print("\n" + "="*60)
+        print("[SARIMA] Retraining candidate model in the background...")
+        print("="*60)
+
+        temperature_series = self._prepare_data(sensor_data)
+        if len(temperature_series) < 2 * self.seasonal_order[3] + self.FORECAST_STEPS:
+            raise ValueError("Insufficient data for SARIMA retraining")
+
+        # Start from the serving model's parameters, or from the order search winner's
+        start_params = self._start_params()
+        if self._order_search_due():
+            if len(temperature_series) >= 2 * self.seasonal_order[3] + ORDER_SEARCH_HOLDOUT:
+                start_params = await self._search_order(temperature_series)
+                start_params = self._start_params() if start_params is None else start_params
+            else:
+                print("[SARIMA] Not enough data for an order search yet")
+
+        candidate, fit_time = await self.executor.run(
+            fit_sarima, temperature_series.iloc[:-self.FORECAST_STEPS],
+            self.order, self.seasonal_order, start_params
+        )
+        return await asyncio.to_thread(self._accept_candidate, candidate, fit_time, temperature_series)
+
+    def _save_artifact(
+        self,
+        fitted_model,
+        temperature_series: pd.Series,
+        fit_time: float,
+        validation_mae: Optional[float] = None
+    ) -> None:
+        """Write the fitted results to the artifact store (failures are logged, not raised)"""
+        if self.store is None:
+            return
+
+        try:
+            self.store.save(
+                self.model_name,
+                lambda directory: fitted_model.save(str(directory / self.RESULTS_FILE)),
+                {
+                    "order": fitted_model.model.order,
+                    "seasonal_order": fitted_model.model.seasonal_order,
+                    "order_searched_at": self.order_searched_at.isoformat() if self.order_searched_at else None,
+                    "fit_seconds": round(fit_time, 2),
+                    "validation_mae": validation_mae,
+                    "training_points": len(temperature_series),
+                    "training_start": temperature_series.index[0].isoformat(),
+                    "training_end": temperature_series.index[-1].isoformat(),
+                }
+            )
         except Exception as e:
-            print(f"[SARIMA] ✗ Error training model after {time.time() - start_time:.2f} seconds: {e}")
-            import traceback
-            traceback.print_exc()
-            raise
+            print(f"[SARIMA] ✗ Could not save model artifact: {e}")
 
-    async def train_model(self, sensor_data: List[SensorData]) -> None:
-        """Async wrapper that runs training in a thread pool"""
+    @staticmethod
+    def warm_up() -> None:
+        """Import statsmodels (about a second) ahead of the first forecast"""
+        import statsmodels.tsa.statespace.sarimax  # noqa: F401
+
+    def restore(self) -> bool:
+        """Load the current fitted model from the artifact store"""
+        if self.store is None or self.is_trained:
+            return self.is_trained
+
+        current = self.store.load_current(self.model_name)
+        if current is None:
+            print("[SARIMA] No stored model found, will train on first prediction")
+            return False
+
+        directory, metadata = current
+        try:
+            from statsmodels.iolib.smpickle import load_pickle
+            fitted_model = load_pickle(str(Path(directory) / self.RESULTS_FILE))
+        except Exception as e:
+            print(f"[SARIMA] ✗ Could not load stored model {metadata.get('version')}: {e}")
+            return False
+
+        self._install(fitted_model, datetime.fromisoformat(metadata['training_end']))
+        self.trained_at = datetime.fromisoformat(metadata['saved_at'])
+        # Keep fitting the stored configuration, from its parameters
+        self.order, self.seasonal_order = fitted_model.model.order, fitted_model.model.seasonal_order
+        if metadata.get('order_searched_at'):
+            self.order_searched_at = datetime.fromisoformat(metadata['order_searched_at'])
+        print(f"[SARIMA] ✓ Loaded stored model {metadata['version']} "
+              f"(trained on {metadata.get('training_start')} → {metadata.get('training_end')})")
+        return True
+
+    async def train_model(self, sensor_data: SensorInput) -> None:
+        """Fit on the model executor and install the fitted results shipped back from it"""
         if self.is_trained:
             print("[SARIMA] ⚡ Using cached model (already trained, prediction will be instant)")
             return
 
-        loop = asyncio.get_event_loop()
-        with ThreadPoolExecutor() as executor:
-            await loop.run_in_executor(executor, self._train_model_sync, sensor_data)
+        print("\n" + "="*60)
+        print("[SARIMA] Preparing temperature data for training...")
+        print("="*60)
+
+        if len(sensor_data) < 50:  # At least ~3 hours of data
+            raise ValueError("Insufficient data for SARIMA training")
+
+        start_time = time.time()
+        temperature_series = self._prepare_data(sensor_data)
+        print(f"[SARIMA] Temperature series prepared: {len(temperature_series)} data points")
+        print(f"[SARIMA] Data preparation took {time.time() - start_time:.2f} seconds")
+
+        fitted_model, fit_time = await self.executor.run(
+            fit_sarima, temperature_series, self.order, self.seasonal_order
+        )
+        self._install(fitted_model, temperature_series.index[-1].to_pydatetime())
+        print(f"[SARIMA] Total training time: {time.time() - start_time:.2f} seconds")
+        print("="*60 + "\n")
+
+        await asyncio.to_thread(self._save_artifact, fitted_model, temperature_series, fit_time)
 
-    async def predict_frost_probability(self, sensor_data: List[SensorData]) -> float:
+    def _covered_horizons(self, horizons: Sequence[int], seasonal_periods: int) -> List[int]:
+        """
+        Horizons within one seasonal period, plus the headline horizon
+
+        Past one period (24 * 15min = 6 hours) the seasonal differencing only
+        repeats the previous period's pattern, so longer horizons are left to
+        the LSTM.
+        """
+        max_steps = max(seasonal_periods, self.FORECAST_STEPS)
+        steps_per_hour = pd.Timedelta(hours=1) // pd.Timedelta(self.RESOLUTION)
+        return [hours for hours in horizons if hours * steps_per_hour <= max_steps or hours == self.HEADLINE_HORIZON]
+
+    async def predict_frost_horizons(
+        self,
+        sensor_data: SensorInput,
+        horizons: Sequence[int] = FORECAST_HORIZONS
+    ) -> Dict[int, float]:
+        features = FeatureFrame.from_input(sensor_data, self.RESOLUTION)  # Once for training and prediction
         if not self.is_trained:
-            await self.train_model(sensor_data)
+            await self.train_model(features)
         
         try:
-            forecast = self.fitted_model.forecast(steps=12)  # Next 12 intervals (1 hour)
-            
-            min_forecast_temp = forecast.min()
+            # Bring the serving state up to the latest readings, then forecast the longest horizon once
+            current = self._update_state(self._prepare_data(features))
+            covered = self._covered_horizons(horizons, current.model.seasonal_periods)
+            steps_per_hour = pd.Timedelta(hours=1) // pd.Timedelta(self.RESOLUTION)
+            forecast = forecast_paths(current, current.predicted_state[:, -1], max(covered) * steps_per_hour)
             
-            if min_forecast_temp <= 0:  # Freezing point
-                probability = min(0.9, max(0.1, (2 - min_forecast_temp) / 4))
-            else:
-                probability = max(0.05, (4 - min_forecast_temp) / 8)
-            
-            return float(np.clip(probability, 0.0, 1.0))
+            # Each horizon's probability comes from the lowest forecast temperature up to it
+            running_min = np.minimum.accumulate(forecast)
+            return {
+                hours: float(frost_probability(running_min[hours * steps_per_hour - 1]))
+                for hours in covered
+            }
             
         except Exception as e:
             print(f"Error making SARIMA prediction: {e}")
-            return 0.5  # Default neutral probability
\ No newline at end of file
+            covered = self._covered_horizons(horizons, self.seasonal_order[3])
+            return {hours: 0.5 for hours in covered}  # Default neutral probability
@@ -1,20 +1,39 @@
-from typing import List, Optional
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Optional, Tuple
+
+import pandas as pd
 
 from domain.entities.sensor_data import SensorData
+from domain.entities.sensor_data_batch import SensorDataBatch
 from domain.repositories.sensor_data_repository import SensorDataRepository
 from domain.value_objects.time_range import TimeRange
+from infrastructure.cache.sensor_time_series_cache import SensorTimeSeriesCache
+from infrastructure.database.database_executor import DatabaseExecutor
 from infrastructure.database.postgres_database import PostgresSensorDatabase
 
 
 class DatabaseSensorDataRepository(SensorDataRepository):
     """Repository that stores and retrieves sensor data from PostgreSQL database"""
 
-    def __init__(self, database: PostgresSensorDatabase):
+    def __init__(
+        self,
+        database: PostgresSensorDatabase,
+        executor: Optional[DatabaseExecutor] = None,
+        cache: Optional[SensorTimeSeriesCache] = None,
+        cache_lateness: timedelta = timedelta(hours=1)
+    ):
         self.database = database
+        # Blocking psycopg2 calls run here, never on the event loop
+        self.executor = executor or DatabaseExecutor(max_workers=2)
+        # Optional sliding window of recent rollups; ranges inside it cost a delta query
+        self.cache = cache
+        self.cache_lateness = cache_lateness  # Overlap re-read by delta queries for late writes
+        self._cache_lock = asyncio.Lock()
 
     async def get_sensor_data_in_range(self, time_range: TimeRange) -> List[SensorData]:
         """
-        Retrieve sensor data from database within the specified time range
+        Retrieve sensor data within the specified time range
 
         Args:
             time_range: Time range to query
@@ -23,30 +42,178 @@ class DatabaseSensorDataRepository(SensorDataRepository):
             List of SensorData objects from all configured nodes (1, 6, and 7)
         """
         # Get data from all nodes instead of filtering for just node 7
-        return self.database.get_sensor_data_in_range(
+        return await self.executor.run(
+            self.database.get_sensor_data_in_range,
             start_time=time_range.start,
             end_time=time_range.end,
             device_id=None  # Get data from all nodes
         )
 
-    def get_all_sensor_data(self, device_id: Optional[str] = None, limit: Optional[int] = None) -> List[SensorData]:
+    async def get_sensor_frame_in_range(self, time_range: TimeRange) -> pd.DataFrame:
         """
-        Retrieve all sensor data from the database
+        Retrieve sensor data within the specified time range as a columnar DataFrame
 
         Args:
+            time_range: Time range to query
+
+        Returns:
+            DataFrame with timestamp, device_id, temperature, humidity and wind_speed columns
+        """
+        return await self.executor.run(
+            self.database.get_sensor_frame_in_range,
+            start_time=time_range.start,
+            end_time=time_range.end,
+            device_id=None  # Get data from all nodes
+        )
+
+    async def get_rollup_frame(
+        self,
+        time_range: TimeRange,
+        resolution: str,
+        device_id: Optional[str] = None,
+        combine_devices: bool = False
+    ) -> pd.DataFrame:
+        """
+        Retrieve pre-bucketed sensor data from the rollup table
+
+        Served from the time-series cache when the range lies inside its
+        window, so repeat predictions and retraining only query new buckets.
+
+        Args:
+            time_range: Time range to query
+            resolution: Bucket width ("5min", "15min" or "1h")
             device_id: Optional device ID to filter by
-            limit: Optional limit on number of records
+            combine_devices: Merge all devices into one count-weighted series
+
+        Returns:
+            DataFrame with one row per bucket (and device, unless combined)
+        """
+        if not combine_devices and await self._sync_cache(time_range, resolution):
+            return self.cache.get_frame(resolution, time_range.start, time_range.end, device_id)
+
+        return await self.executor.run(
+            self.database.get_rollup_frame,
+            start_time=time_range.start,
+            end_time=time_range.end,
+            resolution=resolution,
+            device_id=device_id,
+            combine_devices=combine_devices
+        )
+
+    async def _sync_cache(self, time_range: TimeRange, resolution: str) -> bool:
+        """
+        Bring the cache's resolution up to date if it can serve time_range
+
+        The first call per resolution seeds the whole window; later calls only
+        fetch buckets from the watermark (minus cache_lateness, for late writes
+        from other workers or imports) on.
 
         Returns:
-            List of all SensorData objects
+            True if time_range can be served from the cache
         """
-        return self.database.get_all_sensor_data(device_id=device_id, limit=limit)
+        if self.cache is None or not self.cache.can_serve(resolution, time_range.start):
+            if self.cache is not None:
+                self.cache.misses += 1
+            return False
+
+        async with self._cache_lock:
+            now = datetime.now(timezone.utc)
+            if not self.cache.is_seeded(resolution):
+                covered_from = now - self.cache.retention
+                frame = await self.executor.run(
+                    self.database.get_rollup_frame, start_time=covered_from, end_time=now, resolution=resolution
+                )
+                self.cache.seed(resolution, frame, covered_from=covered_from, synced_at=now)
+                print(f"[CACHE] Seeded {resolution} rollup cache with {len(frame)} buckets")
+            else:
+                since = self.cache.watermark(resolution) - self.cache_lateness
+                frame = await self.executor.run(
+                    self.database.get_rollup_frame, start_time=since, end_time=now, resolution=resolution
+                )
+                self.cache.merge(resolution, frame, since=since, synced_at=now)
+            self.cache.evict(now)
 
-    def save_sensor_data(self, sensor_data: SensorData) -> None:
+        self.cache.hits += 1
+        return True
+
+    async def get_sensor_batch_in_range(self, time_range: TimeRange) -> SensorDataBatch:
+        """
+        Retrieve sensor data within the specified time range as a SensorDataBatch
+
+        Args:
+            time_range: Time range to query
+
+        Returns:
+            Batch of every node's readings, ordered by timestamp
+        """
+        return await self.executor.run(
+            self.database.get_sensor_batch_in_range,
+            start_time=time_range.start,
+            end_time=time_range.end,
+            device_id=None
+        )
+
+    async def get_latest_per_device(self) -> List[SensorData]:
+        """
+        Retrieve the most recent reading of every device
+
+        Returns:
+            One SensorData object per device
+        """
+        return await self.executor.run(self.database.get_latest_sensor_data_per_device)
+
+    async def get_sensor_data_page(
+        self,
+        limit: int,
+        after: Optional[Tuple[datetime, str]] = None,
+        device_id: Optional[str] = None
+    ) -> List[SensorData]:
+        """
+        Retrieve one keyset-paginated page of sensor data, newest first
+
+        Args:
+            limit: Maximum number of records
+            after: (timestamp, id) of the last record of the previous page
+            device_id: Optional device ID to filter by
+
+        Returns:
+            List of SensorData objects
+        """
+        return await self.executor.run(self.database.get_sensor_data_page, limit=limit, after=after, device_id=device_id)
+
+    def iter_sensor_data(self, device_id: Optional[str] = None) -> Iterator[tuple]:
+        """
+        Stream all sensor data with constant memory (blocking iterator)
+
+        Args:
+            device_id: Optional device ID to filter by
+
+        Returns:
+            Iterator of raw (id, device_id, temperature, humidity, wind_speed, timestamp) rows
+        """
+        return self.database.iter_sensor_data(device_id=device_id)
+
+    async def save_sensor_data(self, sensor_data: SensorData) -> None:
         """
         Save sensor data to the database
 
         Args:
             sensor_data: SensorData object to save
         """
-        self.database.save_sensor_data(sensor_data)
+        await self.executor.run(self.database.save_sensor_data, sensor_data)
+
+    async def save_sensor_data_batch(self, sensor_data_list: List[SensorData]) -> int:
+        """
+        Bulk save sensor data to the database
+
+        Args:
+            sensor_data_list: SensorData objects to save
+
+        Returns:
+            Number of rows inserted or updated
+        """
+        return await self.executor.run(self.database.save_sensor_data_batch, sensor_data_list)
+
+    async def ensure_future_partitions(self) -> None:
+        """Create monthly partitions for the current and upcoming months"""
+        await self.executor.run(self.database.ensure_future_partitions)
@@ -1,6 +1,9 @@
 from typing import List
 
+import pandas as pd
+
 from domain.entities.sensor_data import SensorData
+from domain.entities.sensor_data_batch import SensorDataBatch
 from domain.repositories.sensor_data_repository import SensorDataRepository
 from domain.value_objects.time_range import TimeRange
 from ..external.tts_client import TTSClient
@@ -11,4 +14,11 @@ class TTSSensorDataRepository(SensorDataRepository):
         self.tts_client = tts_client
 
     async def get_sensor_data_in_range(self, time_range: TimeRange) -> List[SensorData]:
-        return await self.tts_client.get_sensor_data_in_range(time_range)
\ No newline at end of file
+        return await self.tts_client.get_sensor_data_in_range(time_range)
+
+    async def get_sensor_batch_in_range(self, time_range: TimeRange) -> SensorDataBatch:
+        return await self.tts_client.get_sensor_batch_in_range(time_range)
+
+    async def get_sensor_frame_in_range(self, time_range: TimeRange) -> pd.DataFrame:
+        batch = await self.get_sensor_batch_in_range(time_range)
+        return batch.sorted_by_time().to_frame()
@@ -1,11 +1,12 @@
 from fastapi import APIRouter, HTTPException, Depends, Body, Query
-from typing import Optional, List
+from fastapi.responses import StreamingResponse
+from typing import Optional, List, Literal
 from pydantic import BaseModel
 
 from application.services.prediction_service import PredictionService
-from application.services.sensor_data_service import SensorDataService
+from application.services.sensor_data_service import SensorDataService, InvalidCursorError
 from application.dtos.prediction_dto import PredictionDTO
-from application.dtos.sensor_data_dto import LatestSensorDataResponse, AllSensorDataResponse
+from application.dtos.sensor_data_dto import LatestSensorDataResponse, AllSensorDataResponse, SensorRollupResponse
 
 
 # Removed SendAlertRequest - endpoint no longer accepts phone numbers from frontend
@@ -41,6 +42,12 @@ class PredictionController:
             methods=["GET"],
             response_model=AllSensorDataResponse
         )
+        self.router.add_api_route(
+            "/sensor-data/rollups",
+            self.get_sensor_data_rollups,
+            methods=["GET"],
+            response_model=SensorRollupResponse
+        )
 
     async def generate_prediction(self) -> PredictionDTO:
         try:
@@ -94,8 +101,8 @@ class PredictionController:
         """
         Get the latest sensor data (temperature, humidity, wind speed).
 
-        This endpoint returns cached sensor data that is updated periodically
-        by a background job. No parameters required.
+        Returns the most recent reading overall plus one per device. Served
+        from memory and updated as webhook readings arrive. No parameters required.
         """
         try:
             if self.sensor_data_service is None:
@@ -112,20 +119,25 @@ class PredictionController:
             print(f"Error retrieving sensor data: {e}")
             raise HTTPException(status_code=500, detail="Failed to retrieve sensor data")
 
-    def get_all_sensor_data(
+    async def get_all_sensor_data(
         self,
         device_id: Optional[str] = Query(None, description="Filter by device ID"),
-        limit: Optional[int] = Query(None, description="Limit number of records returned")
-    ) -> AllSensorDataResponse:
+        limit: Optional[int] = Query(None, ge=1, description="Page size (default 1000, max 10000)"),
+        cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+        format: Literal["json", "ndjson"] = Query("json", description="'ndjson' streams every record")
+    ):
         """
-        Get all sensor data from Supabase database.
+        Get sensor data from Supabase database, newest first.
 
-        This endpoint retrieves all historical sensor data directly from the database.
-        You can optionally filter by device_id and limit the number of records.
+        JSON responses are paginated by (timestamp, id): follow `next_cursor`
+        until it is null to walk the whole history. `format=ndjson` instead
+        streams every record as newline-delimited JSON with constant memory.
 
         Query Parameters:
         - device_id: Optional device ID to filter results
-        - limit: Optional limit on number of records to return (returns most recent records)
+        - limit: Optional page size (JSON format only)
+        - cursor: Optional cursor returned as next_cursor by the previous page
+        - format: 'json' (default, paginated) or 'ndjson' (full streaming export)
         """
         try:
             if self.sensor_data_service is None:
@@ -134,10 +146,49 @@ class PredictionController:
                     detail="Sensor data service not configured"
                 )
 
-            return self.sensor_data_service.get_all_sensor_data(device_id=device_id, limit=limit)
+            if format == "ndjson":
+                return StreamingResponse(
+                    self.sensor_data_service.stream_sensor_data_ndjson(device_id=device_id),
+                    media_type="application/x-ndjson"
+                )
+
+            return await self.sensor_data_service.get_all_sensor_data(device_id=device_id, limit=limit, cursor=cursor)
 
+        except HTTPException:
+            raise
+        except InvalidCursorError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         except ValueError as e:
             raise HTTPException(status_code=404, detail=str(e))
         except Exception as e:
             print(f"Error retrieving all sensor data: {e}")
-            raise HTTPException(status_code=500, detail="Failed to retrieve all sensor data")
\ No newline at end of file
+            raise HTTPException(status_code=500, detail="Failed to retrieve all sensor data")
+
+    async def get_sensor_data_rollups(
+        self,
+        resolution: Literal["5min", "15min", "1h"] = Query("15min", description="Bucket width"),
+        hours: int = Query(24, ge=1, le=24 * 90, description="Hours of history to return"),
+        device_id: Optional[str] = Query(None, description="Filter by device ID")
+    ) -> SensorRollupResponse:
+        """
+        Get pre-bucketed sensor data for charts.
+
+        Returns min/max/mean/count of temperature, humidity and wind speed per
+        device and bucket, maintained as readings are ingested.
+        """
+        try:
+            if self.sensor_data_service is None:
+                raise HTTPException(
+                    status_code=500,
+                    detail="Sensor data service not configured"
+                )
+
+            return await self.sensor_data_service.get_sensor_data_rollups(
+                resolution=resolution, hours=hours, device_id=device_id
+            )
+
+        except HTTPException:
+            raise
+        except Exception as e:
+            print(f"Error retrieving sensor data rollups: {e}")
+            raise HTTPException(status_code=500, detail="Failed to retrieve sensor data rollups")
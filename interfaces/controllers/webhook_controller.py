@@ -4,12 +4,12 @@ from typing import Dict, Any, Optional
 
 from ..schemas.webhook_schemas import TTSWebhookPayload, WebhookResponse
 from domain.entities.sensor_data import SensorData
-from infrastructure.repositories.database_sensor_data_repository import DatabaseSensorDataRepository
+from application.services.sensor_ingestion_service import SensorIngestionService, IngestionQueueFullError
 
 
 class WebhookController:
-    def __init__(self, sensor_repository: Optional[DatabaseSensorDataRepository] = None):
-        self.sensor_repository = sensor_repository
+    def __init__(self, ingestion_service: Optional[SensorIngestionService] = None):
+        self.ingestion_service = ingestion_service
         self.router = APIRouter()
         self.router.add_api_route(
             "/webhook",
@@ -19,6 +19,7 @@ class WebhookController:
         )
 
     async def handle_tts_webhook(self, payload: Dict[Any, Any]) -> WebhookResponse:
+        device_id = "unknown"
         try:
             # Extract device ID
             device_id = payload.get("end_device_ids", {}).get("device_id", "unknown")
@@ -37,46 +38,51 @@ class WebhookController:
             uplink_message = payload.get("uplink_message", {})
             decoded_payload = uplink_message.get("decoded_payload", {})
             received_at = payload.get("received_at", datetime.utcnow().isoformat())
+            f_cnt = uplink_message.get("f_cnt")
 
             # Extract sensor values (handle both Spanish and English field names)
-            temperature = decoded_payload.get('temperatura_c', decoded_payload.get('temperature', 0.0))
-            humidity = decoded_payload.get('humedad_pct', decoded_payload.get('humidity', 0.0))
-            wind_speed = decoded_payload.get('viento_ms', decoded_payload.get('wind_speed', 0.0))
+            temperature = float(decoded_payload.get('temperatura_c', decoded_payload.get('temperature', 0.0)))
+            humidity = float(decoded_payload.get('humedad_pct', decoded_payload.get('humidity', 0.0)))
+            wind_speed = float(decoded_payload.get('viento_ms', decoded_payload.get('wind_speed', 0.0)))
 
             # Parse timestamp
             timestamp = datetime.fromisoformat(received_at.replace("Z", "+00:00"))
 
-            # Create SensorData entity
+            # Create SensorData entity; its id is derived from the uplink, so TTS retries are idempotent
             sensor_data = SensorData(
                 temperature=temperature,
                 humidity=humidity,
                 wind_speed=wind_speed,
                 timestamp=timestamp,
-                device_id=device_id
+                device_id=device_id,
+                f_cnt=int(f_cnt) if f_cnt is not None else None
             )
 
-            # Save to database
-            if self.sensor_repository:
-                self.sensor_repository.save_sensor_data(sensor_data)
-                print(f"\n{'='*60}")
-                print(f"✓ {device_id.upper()} DATA SAVED TO DATABASE at {received_at}")
-                print(f"{'='*60}")
-                print(f"Temperature: {temperature}°C")
-                print(f"Humidity: {humidity}%")
-                print(f"Wind Speed: {wind_speed} m/s")
-                print(f"Battery: {decoded_payload.get('bateria_pct', decoded_payload.get('battery_percent'))}%")
-                print(f"Packet Number: {decoded_payload.get('paquete_total', decoded_payload.get('packet_number'))}")
-                print(f"Counter: {decoded_payload.get('contador', decoded_payload.get('counter'))}")
-                print(f"{'='*60}\n")
-            else:
-                print(f"⚠️  Warning: Database repository not configured, data not saved!")
+            if self.ingestion_service is None:
+                print(f"⚠️  Warning: Ingestion service not configured, data not saved!")
+                return WebhookResponse(
+                    status="ignored",
+                    message="Sensor data storage not configured",
+                    timestamp=datetime.utcnow().isoformat()
+                )
+
+            # Buffer the reading; the background flusher writes it to the database in batches
+            self.ingestion_service.enqueue(sensor_data)
+            print(f"[WEBHOOK] Queued {device_id} reading at {received_at}: "
+                  f"{temperature}°C, {humidity}%, {wind_speed} m/s")
 
             return WebhookResponse(
                 status="success",
-                message=f"{device_id} data received and processed successfully",
+                message=f"{device_id} data received and queued for storage",
                 timestamp=datetime.utcnow().isoformat()
             )
 
+        except IngestionQueueFullError as e:
+            print(f"[WEBHOOK] ✗ Rejecting reading from {device_id}: {e}")
+            raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
+        except (ValueError, TypeError, AttributeError) as e:
+            print(f"Invalid webhook payload: {e}")
+            raise HTTPException(status_code=400, detail=f"Invalid webhook payload: {e}")
         except Exception as e:
             print(f"Error processing webhook: {e}")
             raise HTTPException(status_code=500, detail="Internal server error")
\ No newline at end of file
@@ -3,29 +3,64 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from dependencies import dependencies
+from infrastructure.config.settings import settings
 from scheduler import FrostPredictionScheduler
 from interfaces.middleware.logging_middleware import LoggingMiddleware
 
 
+async def apply_schema_migrations():
+    """Run pending schema migrations off the event loop"""
+    try:
+        await dependencies.database_executor.run(dependencies.schema_migrator.migrate)
+    except Exception as e:
+        print(f"[STARTUP] Warning: Schema migrations failed, will retry on first database operation: {e}")
+
+
+async def warm_up_models():
+    """
+    Import the ML libraries and load the last trained models from disk after the
+    app is serving, so the first prediction neither pays the imports nor retrains
+    """
+    if settings.startup_warm_up:
+        try:
+            await asyncio.to_thread(dependencies.warm_up)
+        except Exception as e:
+            print(f"[STARTUP] Warning: Model warm-up failed: {e}")
+
+    # Per-node models of every node that reported recently
+    try:
+        latest = await dependencies.sensor_data_repository.get_latest_per_device()
+        await asyncio.to_thread(dependencies.model_registry.load, [data.device_id for data in latest])
+    except Exception as e:
+        print(f"[STARTUP] Warning: Could not restore trained models: {e}")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     print("[STARTUP] Initializing application...")
 
-    # Database will initialize lazily on first request to avoid startup timeout
-    print("[STARTUP] Database will initialize on first request")
+    # Migrations run in the background so a slow database cannot cause a startup timeout
+    print("[STARTUP] Applying database migrations in the background")
+    asyncio.create_task(apply_schema_migrations())
+    asyncio.create_task(warm_up_models())
 
     scheduler = FrostPredictionScheduler(
         dependencies.prediction_service,
-        dependencies.sensor_data_service
+        dependencies.sensor_data_repository
     )
     scheduler.start()
+    await dependencies.sensor_ingestion_service.start()
     print("[STARTUP] Application ready!")
 
     yield
 
     # Shutdown
     scheduler.stop()
+    await dependencies.sensor_ingestion_service.stop()  # Flush buffered webhook readings
+    dependencies.model_executor.shutdown(wait=False)  # Abandon in-flight fits rather than block exit
+    dependencies.database_executor.shutdown()
+    dependencies.database_pool.close()
 
 
 app = FastAPI(
@@ -54,6 +89,22 @@ async def health_check():
     return {"status": "healthy", "service": "frost-prediction-api"}
 
 
+@app.get("/health/database")
+async def database_health_check():
+    return {"status": "healthy", "pool": dependencies.database_pool.stats()}
+
+
+@app.get("/health/ingestion")
+async def ingestion_health_check():
+    return {"status": "healthy", "ingestion": dependencies.sensor_ingestion_service.stats()}
+
+
+@app.get("/health/cache")
+async def cache_health_check():
+    cache = dependencies.sensor_cache
+    return {"status": "healthy" if cache else "disabled", "cache": cache.stats() if cache else None}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
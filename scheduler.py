@@ -4,13 +4,16 @@ from datetime import datetime
 import pytz
 
 from application.services.prediction_service import PredictionService
-from application.services.sensor_data_service import SensorDataService
 
 
 class FrostPredictionScheduler:
-    def __init__(self, prediction_service: PredictionService, sensor_data_service: SensorDataService = None):
+    def __init__(
+        self,
+        prediction_service: PredictionService,
+        sensor_data_repository=None
+    ):
         self.prediction_service = prediction_service
-        self.sensor_data_service = sensor_data_service
+        self.sensor_data_repository = sensor_data_repository  # Used for partition maintenance
         # Set timezone to Colombia (UTC-5)
         self.colombia_tz = pytz.timezone('America/Bogota')
         self.scheduler = AsyncIOScheduler(timezone=self.colombia_tz)
@@ -45,13 +48,19 @@ class FrostPredictionScheduler:
         except Exception as e:
             print(f"Error sending daily alert: {e}")
 
-    async def update_sensor_data_job(self):
-        """Update cached sensor data from TTS"""
+    async def retrain_models_job(self):
+        """Retrain models that are due, off the request path; current models keep serving"""
         try:
-            if self.sensor_data_service:
-                await self.sensor_data_service.update_cached_sensor_data()
+            await self.prediction_service.retrain_models()
         except Exception as e:
-            print(f"Error updating sensor data: {e}")
+            print(f"Error retraining models: {e}")
+
+    async def ensure_partitions_job(self):
+        """Create upcoming monthly sensor_data partitions before data arrives for them"""
+        try:
+            await self.sensor_data_repository.ensure_future_partitions()
+        except Exception as e:
+            print(f"Error ensuring sensor data partitions: {e}")
 
     def start(self):
         # Schedule prediction jobs at 3:00 AM, 12:00 PM, and 4:00 PM (Colombia time)
@@ -88,14 +97,24 @@ class FrostPredictionScheduler:
             coalesce=True
         )
 
-        # Schedule sensor data updates every 5 minutes
-        if self.sensor_data_service:
+        # Check hourly whether the models are due for retraining (between prediction runs)
+        self.scheduler.add_job(
+            self.retrain_models_job,
+            CronTrigger(minute=45),
+            id="retrain_models",
+            misfire_grace_time=600,
+            coalesce=True,
+            max_instances=1  # Never run two retrains at once
+        )
+
+        # Create next months' sensor_data partitions (daily, so a missed run is harmless)
+        if self.sensor_data_repository:
             self.scheduler.add_job(
-                self.update_sensor_data_job,
-                CronTrigger(minute="*/5"),  # Every 5 minutes
-                id="sensor_data_update",
-                misfire_grace_time=60,  # Allow up to 60 seconds delay for sensor updates
-                coalesce=True  # If multiple executions are missed, only run once
+                self.ensure_partitions_job,
+                CronTrigger(hour=0, minute=30),
+                id="ensure_partitions",
+                misfire_grace_time=3600,
+                coalesce=True
             )
 
         self.scheduler.start()
@@ -109,9 +128,11 @@ class FrostPredictionScheduler:
         print("   • 04:00 PM - Afternoon prediction")
         print("\n📱 Alert Job:")
         print("   • 05:00 PM - Daily WhatsApp alert")
-        if self.sensor_data_service:
-            print("\n🌡️  Sensor Data Updates:")
-            print("   • Every 5 minutes - Fetch latest sensor data from TTS")
+        print("\n🧠 Model Maintenance:")
+        print("   • Every hour at :45 - Retrain models when due (validated hot swap)")
+        if self.sensor_data_repository:
+            print("\n🗄️  Database Maintenance:")
+            print("   • 00:30 AM - Create upcoming monthly sensor_data partitions")
         print("="*70 + "\n")
 
     def stop(self):
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Backtest the stored per-node frost models on historical sensor data.
+
+Replays the stored sensor rollups through each node's current SARIMA and
+LSTM at regular cut-off times (FrostBacktester) and scores the frost
+probabilities against the lowest temperature measured in the 3 hours
+after each cut-off:
+  - Brier score of SARIMA, LSTM and the hybrid blend (lower is better)
+  - hit rate: sub-zero minima the hybrid rated at least possible frost
+  - false alarm rate: frost-free cut-offs the hybrid rated at least possible frost
+  - hybrid Brier score for SARIMA weights from 0 to 1
+
+Cut-offs the models were trained on are left out of the scores unless
+--include-in-sample is given. Forecasts are cached per model version under
+MODEL_DATA_PATH/backtests, so re-runs only forecast new cut-offs.
+
+Usage:
+    python scripts/backtest_frost_model.py [--start 2025-05-01] [--end 2025-09-30]
+                                           [--step-minutes 60] [--devices node-1,node-2]
+                                           [--output results.csv] [--include-in-sample]
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from dependencies import dependencies
+from domain.value_objects.time_range import TimeRange
+from infrastructure.models.backtesting import score, weight_sweep
+from infrastructure.models.sarima_model import SARIMAModelService
+
+
+def stored_devices() -> list:
+    """Nodes with a stored SARIMA model"""
+    prefix = f"{SARIMAModelService.MODEL_NAME}-"
+    base_path = dependencies.model_store.base_path
+    if not base_path.is_dir():
+        return []
+    return sorted(p.name[len(prefix):] for p in base_path.iterdir() if p.is_dir() and p.name.startswith(prefix))
+
+
+def print_scores(label: str, scores: dict) -> None:
+    print(f"  {label:24s} cut-offs {scores['cutoffs']:6d}  frost {scores['frost_events']:5d}  "
+          f"Brier SARIMA {scores['brier_sarima']:.4f}  LSTM {scores['brier_lstm']:.4f}  "
+          f"hybrid {scores['brier_hybrid']:.4f}  hit rate {scores['hit_rate']:.0%}  "
+          f"false alarms {scores['false_alarm_rate']:.0%}")
+
+
+async def backtest(args) -> pd.DataFrame:
+    backtester = dependencies.frost_backtester
+    repository = dependencies.sensor_data_repository
+    cutoffs = pd.date_range(args.start, args.end, freq=f"{args.step_minutes}min", tz="UTC")
+    # History before the first cut-off and outcomes after the last one
+    time_range = TimeRange(
+        start=(cutoffs[0] - backtester.history).to_pydatetime().replace(tzinfo=None),
+        end=(cutoffs[-1] + backtester.horizon).to_pydatetime().replace(tzinfo=None),
+    )
+
+    devices = args.devices.split(",") if args.devices else stored_devices()
+    if not devices:
+        raise SystemExit("No stored models to backtest; train the models first")
+
+    async def run(device_id: str) -> pd.DataFrame:
+        sarima_rollups, lstm_rollups = await asyncio.gather(
+            repository.get_rollup_frame(time_range, "15min", device_id=device_id),
+            repository.get_rollup_frame(time_range, "5min", device_id=device_id),
+        )
+        if sarima_rollups.empty or lstm_rollups.empty:
+            raise ValueError(f"No sensor data for {device_id} in the backtest period")
+        return await backtester.run(device_id, sarima_rollups, lstm_rollups, cutoffs)
+
+    # Every node's cut-off chunks share the model executor's worker processes
+    results = await asyncio.gather(*(run(device_id) for device_id in devices), return_exceptions=True)
+    frames = []
+    for device_id, result in zip(devices, results):
+        if isinstance(result, Exception):
+            print(f"[BACKTEST] ✗ {device_id}: {result}")
+        else:
+            frames.append(result)
+    if not frames:
+        raise SystemExit("No node could be backtested")
+    return pd.concat(frames)
+
+
+def main():
+    today = pd.Timestamp.utcnow().normalize().tz_localize(None)
+    parser = argparse.ArgumentParser(description="Backtest the hybrid frost model on stored sensor data")
+    parser.add_argument("--start", default=str((today - timedelta(days=120)).date()), help="First cut-off (UTC)")
+    parser.add_argument("--end", default=str((today - timedelta(days=1)).date()), help="Last cut-off (UTC)")
+    parser.add_argument("--step-minutes", type=int, default=60, help="Minutes between cut-offs")
+    parser.add_argument("--devices", help="Comma-separated device IDs (default: every node with stored models)")
+    parser.add_argument("--output", help="Write the per-cut-off results to this CSV file")
+    parser.add_argument("--include-in-sample", action="store_true", help="Score cut-offs the models were trained on")
+    args = parser.parse_args()
+
+    start = time.time()
+    try:
+        results = asyncio.run(backtest(args))
+    finally:
+        dependencies.model_executor.shutdown()
+        dependencies.database_executor.shutdown()
+        dependencies.database_pool.close()
+
+    if args.output:
+        results.to_csv(args.output)
+        print(f"[BACKTEST] Per-cut-off results written to {args.output}")
+
+    scored = results if args.include_in_sample else results[~results['in_sample']]
+    print("="*70)
+    print(f"FROST MODEL BACKTEST {args.start} → {args.end}, every {args.step_minutes} min "
+          f"({time.time() - start:.0f}s)")
+    print("="*70)
+    for device_id, device_results in scored.groupby('device_id'):
+        print_scores(device_id, score(device_results))
+    print_scores("all nodes", score(scored))
+
+    sweep = weight_sweep(scored)
+    backtester = dependencies.frost_backtester
+    print(f"\nHybrid Brier score by SARIMA weight (current {backtester.sarima_weight}):")
+    for weight, brier in sweep.items():
+        marker = "  <- best" if weight == sweep.idxmin() else ""
+        print(f"  {weight:4.1f}  {brier:.4f}{marker}")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Benchmark the prediction pipeline as history grows and nodes are added.
+
+Every scale ("<days>d-<nodes>n") runs in a fresh interpreter against a
+synthetic rollup history ending now, served by an in-memory repository
+that answers time-range queries the way the rollup index does. Stages:
+  - data_prep:         FeatureStore.prepare of the 10-day window at 15 and 5 minutes,
+                       cold and again on unchanged data (memoized)
+  - data_prep_history: the same preparation over the whole history
+  - sequences:         scaling and create_sequences for every node's LSTM window
+  - sarima_fit:        fit_sarima on --fit-samples nodes; projected_total_s spreads all nodes
+                       onto MODEL_WORKER_PROCESSES workers
+  - sarima_forecast:   incremental state update and 12-hour (all horizons) forecast for every node
+  - lstm_fit:          fit_lstm on one node (skipped without TensorFlow)
+  - lstm_predict:      NumPy forward pass of every node's last window and of a
+                       retrain holdout batch
+  - end_to_end:        GenerateFrostPredictionUseCase.execute with trained models,
+                       cold and on unchanged data, split into fetch / features / models
+
+statsmodels and scikit-learn are imported before the first stage, as the
+app's startup warm-up does. Each stage reports wall time and the process's
+peak RSS after it. Results
+are written as JSON (with commit and library versions) so two runs can be
+compared with --compare.
+
+Usage:
+    python scripts/benchmark_pipeline.py [--scales 10d-3n,90d-10n,365d-50n] [--output results.json]
+                                         [--fit-samples 1] [--skip-fit]
+    python scripts/benchmark_pipeline.py --compare baseline.json candidate.json
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).parent.parent
+
+# Add parent directory to path
+sys.path.insert(0, str(ROOT))
+
+from application.services.device_model_registry import DeviceModelRegistry
+from application.services.feature_store import FeatureStore
+from application.use_cases.generate_frost_prediction import GenerateFrostPredictionUseCase
+from domain.entities.feature_frame import FeatureFrame
+from domain.entities.sensor_data import SensorData
+from domain.repositories.sensor_data_repository import SensorDataRepository
+from domain.value_objects.time_range import TimeRange
+from infrastructure.config.settings import settings
+from infrastructure.models.lstm_inference import NumpyLSTM
+from infrastructure.models.lstm_model import HORIZON_STEPS, LSTMModelService, create_sequences
+from infrastructure.models.model_executor import ModelExecutor
+from infrastructure.models.sarima_model import SARIMAModelService, fit_sarima
+
+DEFAULT_SCALES = "10d-3n,90d-10n,365d-50n"
+WINDOW_DAYS = 10  # History the prediction use case reads
+READINGS_PER_BUCKET = {"5min": 5, "15min": 15}  # One uplink per minute
+
+
+def parse_scale(scale: str):
+    days, nodes = scale.lower().split("-")
+    return int(days.rstrip("d")), int(nodes.rstrip("n"))
+
+
+def generate_rollups(days: int, nodes: int, resolution: str, end: pd.Timestamp) -> pd.DataFrame:
+    """
+    Synthetic per-node rollups like sensor_data_rollups, sorted by bucket start
+
+    Daily temperature cycle with a per-node offset (some nodes dip below 0°C),
+    a slow seasonal drift and noise; humidity and wind speed are noise.
+    """
+    rng = np.random.default_rng(42)
+    grid = pd.date_range(end=end, periods=days * 86400 // pd.Timedelta(resolution).seconds, freq=resolution)
+    hours = (grid.asi8 - grid.asi8[0]) / 3.6e12
+
+    size = len(grid) * nodes
+    node_offset = np.linspace(-6, 4, nodes)
+    temperature = (
+        8 + 6 * np.sin(2 * np.pi * hours / 24)[:, np.newaxis]
+        + 3 * np.sin(2 * np.pi * hours / (24 * 365))[:, np.newaxis]
+        + node_offset[np.newaxis, :]
+    ).reshape(-1) + rng.normal(0, 0.5, size)
+
+    return pd.DataFrame({
+        'timestamp': np.repeat(grid, nodes),
+        'device_id': pd.Categorical.from_codes(
+            np.tile(np.arange(nodes), len(grid)), [f"nodo-lora-ud-{n + 1}" for n in range(nodes)]
+        ),
+        'reading_count': READINGS_PER_BUCKET[resolution],
+        'temperature': temperature,
+        'humidity': rng.uniform(60, 95, size),
+        'wind_speed': rng.uniform(0, 6, size),
+    })
+
+
+class SyntheticRollupRepository(SensorDataRepository):
+    """Serves the synthetic rollups by binary search on bucket start, like the rollup index"""
+
+    def __init__(self, rollups: Dict[str, pd.DataFrame]):
+        self.rollups = rollups
+        self.fetch_seconds = 0.0
+
+    async def get_sensor_data_in_range(self, time_range: TimeRange) -> List[SensorData]:
+        raise NotImplementedError("The benchmark repository only serves rollups")
+
+    async def get_rollup_frame(
+        self,
+        time_range: TimeRange,
+        resolution: str,
+        device_id: Optional[str] = None,
+        combine_devices: bool = False
+    ) -> pd.DataFrame:
+        start = time.perf_counter()
+        frame = self.rollups[resolution]
+        timestamps = frame['timestamp'].values
+        lo, hi = np.searchsorted(
+            timestamps, [np.datetime64(time_range.start), np.datetime64(time_range.end)], side='left'
+        )
+        window = frame.iloc[lo:hi]
+        if device_id:
+            window = window[window['device_id'] == device_id]
+        self.fetch_seconds += time.perf_counter() - start
+        return window.reset_index(drop=True)
+
+
+class TimedFeatureStore(FeatureStore):
+    def __init__(self):
+        super().__init__()
+        self.prepare_seconds = 0.0
+
+    def prepare(self, data: pd.DataFrame, resolution: str) -> Dict[str, FeatureFrame]:
+        start = time.perf_counter()
+        try:
+            return super().prepare(data, resolution)
+        finally:
+            self.prepare_seconds += time.perf_counter() - start
+
+
+def random_lstm(rng: np.random.Generator, n_features: int) -> NumpyLSTM:
+    """Engine with the production architecture (build_lstm_model) and random weights"""
+    def lstm(inputs, units):
+        return (rng.normal(0, 0.2, (inputs, 4 * units)), rng.normal(0, 0.2, (units, 4 * units)), np.zeros(4 * units))
+    outputs = len(HORIZON_STEPS)
+    return NumpyLSTM(
+        [lstm(n_features, 50), lstm(50, 50)],
+        [(rng.normal(0, 0.2, (50, 25)), np.zeros(25), 'relu'), (rng.normal(0, 0.2, (25, outputs)), np.zeros(outputs), 'sigmoid')],
+    )
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+class StageTimer:
+    def __init__(self):
+        self.stages: Dict[str, dict] = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """Time a stage; the pipeline's own progress prints are swallowed"""
+        result = {}
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield result
+        result.setdefault('wall_s', round(time.perf_counter() - start, 4))
+        result['peak_rss_mb'] = round(peak_rss_mb(), 1)
+        self.stages[name] = result
+        wall = "skipped" if result['wall_s'] is None else f"{result['wall_s']:.3f}s"
+        print(f"    {name:20s} {wall:>10s}  peak RSS {result['peak_rss_mb']:8.1f} MB", file=sys.stderr)
+
+
+async def run_scale(days: int, nodes: int, fit_samples: int, skip_fit: bool) -> dict:
+    SARIMAModelService.warm_up()
+    LSTMModelService.warm_up()
+    from sklearn.preprocessing import MinMaxScaler
+
+    timer = StageTimer()
+    rng = np.random.default_rng(0)
+    end = pd.Timestamp.utcnow().tz_localize(None).floor("15min")
+
+    with timer.stage("generate") as result:
+        rollups = {resolution: generate_rollups(days, nodes, resolution, end) for resolution in READINGS_PER_BUCKET}
+        result['rows'] = {resolution: len(frame) for resolution, frame in rollups.items()}
+    for frame in rollups.values():
+        frame['timestamp'] = frame['timestamp'].dt.tz_localize('UTC')
+
+    repository = SyntheticRollupRepository(rollups)
+    time_range = TimeRange.last_n_days(WINDOW_DAYS)
+    window = {resolution: await repository.get_rollup_frame(time_range, resolution) for resolution in rollups}
+
+    with timer.stage("data_prep") as result:
+        store = FeatureStore()
+        start = time.perf_counter()
+        features = {resolution: store.prepare(frame, resolution) for resolution, frame in window.items()}
+        result['cold_s'] = round(time.perf_counter() - start, 4)
+        start = time.perf_counter()
+        for resolution, frame in window.items():
+            store.prepare(frame, resolution)
+        result['memoized_s'] = round(time.perf_counter() - start, 4)
+
+    with timer.stage("data_prep_history") as result:
+        FeatureStore().prepare(rollups["5min"], "5min")
+        FeatureStore().prepare(rollups["15min"], "15min")
+
+    lstm = LSTMModelService()
+    scalers = {}
+    with timer.stage("sequences") as result:
+        count = 0
+        for device_id, frame in features["5min"].items():
+            scalers[device_id] = MinMaxScaler().fit(frame.frame.values)
+            _, targets = create_sequences(scalers[device_id].transform(frame.frame.values), lstm.sequence_length)
+            count += len(targets)
+        result['sequences'] = count
+
+    sample_series = features["15min"][next(iter(features["15min"]))].frame['temperature']
+    sarima_results = None
+    fits = []
+    if not skip_fit:
+        with timer.stage("sarima_fit") as result:
+            for device_id in list(features["15min"])[:fit_samples]:
+                sarima_results, fit_time = fit_sarima(features["15min"][device_id].frame['temperature'])
+                fits.append(fit_time)
+            workers = max(1, settings.model_worker_processes)
+            result['per_node_s'] = round(float(np.mean(fits)), 3)
+            result['nodes_fitted'] = len(fits)
+            result['projected_total_s'] = round(result['per_node_s'] * -(-nodes // workers), 2)
+            result['workers'] = workers
+    else:
+        with timer.stage("sarima_fit") as result:
+            # Cheapest fit that yields a usable state for the forecast stages
+            sarima_results, _ = fit_sarima(sample_series.iloc[-96 * 2:])
+            result['skipped'] = "--skip-fit: fitted on 2 days of one node for the forecast stages only"
+
+    def sarima_service(device_id: str, executor: ModelExecutor) -> SARIMAModelService:
+        service = SARIMAModelService(executor=executor, model_name=f"sarima-{device_id}")
+        service._install(sarima_results, sample_series.index[-1].to_pydatetime())
+        return service
+
+    executor = ModelExecutor(max_workers=0)
+    with timer.stage("sarima_forecast") as result:
+        for device_id, frame in features["15min"].items():
+            await sarima_service(device_id, executor).predict_frost_horizons(frame)
+
+    engine = random_lstm(rng, lstm.n_features)
+    try:
+        import tensorflow  # noqa: F401
+        has_tensorflow = True
+    except ImportError:
+        has_tensorflow = False
+
+    with timer.stage("lstm_fit") as result:
+        if has_tensorflow:
+            from infrastructure.models.lstm_training import fit_lstm
+            frame = next(iter(features["5min"].values())).frame
+            engine, _, epochs, sequences = fit_lstm(
+                frame.values, lstm.sequence_length, lstm.n_features, LSTMModelService.VALIDATION_SPLIT
+            )
+            result.update(epochs=epochs, sequences=sequences)
+        else:
+            result['skipped'] = "tensorflow not installed"
+            result['wall_s'] = None
+
+    with timer.stage("lstm_predict") as result:
+        start = time.perf_counter()
+        for device_id, frame in features["5min"].items():
+            last = scalers[device_id].transform(frame.frame.values[-lstm.sequence_length:])
+            engine.predict(last)
+        result['last_window_all_nodes_s'] = round(time.perf_counter() - start, 4)
+
+        frame = next(iter(features["5min"].values())).frame
+        windows, targets = create_sequences(scalers[next(iter(scalers))].transform(frame.values), lstm.sequence_length)
+        holdout = max(1, int(len(targets) * LSTMModelService.VALIDATION_SPLIT))
+        start = time.perf_counter()
+        engine.predict(windows[-holdout:])
+        result['holdout_batch_s'] = round(time.perf_counter() - start, 4)
+        result['holdout_windows'] = holdout
+
+    def lstm_service(device_id: str) -> LSTMModelService:
+        service = LSTMModelService(executor=executor, model_name=f"lstm-{device_id}")
+        scaler = scalers.get(device_id) or next(iter(scalers.values()))
+        service._install(engine, scaler, sample_series.index[-1].to_pydatetime())
+        return service
+
+    from infrastructure.repositories.memory_prediction_repository import MemoryPredictionRepository
+    registry = DeviceModelRegistry(lambda device_id: sarima_service(device_id, executor), lstm_service)
+    feature_store = TimedFeatureStore()
+    use_case = GenerateFrostPredictionUseCase(repository, MemoryPredictionRepository(), registry, feature_store)
+
+    for name in ("end_to_end", "end_to_end_memoized"):
+        repository.fetch_seconds = feature_store.prepare_seconds = 0.0
+        with timer.stage(name) as result:
+            start = time.perf_counter()
+            prediction = await use_case.execute()
+            total = time.perf_counter() - start
+            result.update(
+                fetch_s=round(repository.fetch_seconds, 4),
+                features_s=round(feature_store.prepare_seconds, 4),
+                models_s=round(total - repository.fetch_seconds - feature_store.prepare_seconds, 4),
+                nodes_predicted=len(prediction.device_predictions),
+            )
+
+    return {
+        'scale': f"{days}d-{nodes}n",
+        'days': days,
+        'nodes': nodes,
+        'peak_rss_mb': round(peak_rss_mb(), 1),
+        'stages': timer.stages,
+    }
+
+
+def environment() -> dict:
+    def version(module: str) -> Optional[str]:
+        try:
+            return __import__(module).__version__
+        except ImportError:
+            return None
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'commit': commit,
+        'created_at': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'model_worker_processes': settings.model_worker_processes,
+        'versions': {module: version(module) for module in ("numpy", "pandas", "statsmodels", "sklearn", "tensorflow")},
+    }
+
+
+def compare(baseline_path: str, candidate_path: str) -> None:
+    """Print the wall time of every stage in two result files side by side"""
+    baseline = json.loads(Path(baseline_path).read_text())
+    candidate = json.loads(Path(candidate_path).read_text())
+    print(f"{'scale':12s} {'stage':22s} {baseline['environment']['commit'] or 'baseline':>12s} "
+          f"{candidate['environment']['commit'] or 'candidate':>12s} {'change':>8s}")
+    before_scales = {result['scale']: result for result in baseline['results']}
+    for result in candidate['results']:
+        before = before_scales.get(result['scale'])
+        if before is None:
+            continue
+        for stage, values in result['stages'].items():
+            old, new = before['stages'].get(stage, {}).get('wall_s'), values.get('wall_s')
+            if old is None or new is None:
+                continue
+            change = f"{(new - old) / old:+.0%}" if old else "n/a"
+            print(f"{result['scale']:12s} {stage:22s} {old:11.3f}s {new:11.3f}s {change:>8s}")
+        old, new = before['peak_rss_mb'], result['peak_rss_mb']
+        print(f"{result['scale']:12s} {'peak RSS (MB)':22s} {old:12.1f} {new:12.1f} {(new - old) / old:+8.0%}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the frost prediction pipeline at several data scales")
+    parser.add_argument("--scales", default=DEFAULT_SCALES, help="Comma-separated <days>d-<nodes>n")
+    parser.add_argument("--output", help="Write the JSON results here (default: stdout)")
+    parser.add_argument("--fit-samples", type=int, default=1, help="Nodes to fit SARIMA on per scale")
+    parser.add_argument("--skip-fit", action="store_true", help="Skip the full SARIMA fits")
+    parser.add_argument("--compare", nargs=2, metavar=("BASELINE", "CANDIDATE"))
+    parser.add_argument("--run-scale", help=argparse.SUPPRESS)  # Child process: one scale, JSON on stdout
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    if args.run_scale:
+        days, nodes = parse_scale(args.run_scale)
+        result = asyncio.run(run_scale(days, nodes, args.fit_samples, args.skip_fit))
+        print(json.dumps(result))
+        return
+
+    results = []
+    for scale in args.scales.split(","):
+        days, nodes = parse_scale(scale)
+        print(f"[BENCHMARK] {days} days x {nodes} nodes", file=sys.stderr)
+        command = [sys.executable, __file__, "--run-scale", scale, "--fit-samples", str(args.fit_samples)]
+        if args.skip_fit:
+            command.append("--skip-fit")
+        child = subprocess.run(command, cwd=ROOT, stdout=subprocess.PIPE, text=True, check=True)
+        results.append(json.loads(child.stdout.strip().splitlines()[-1]))
+
+    report = json.dumps({'environment': environment(), 'results': results}, indent=2)
+    if args.output:
+        Path(args.output).write_text(report + "\n")
+        print(f"[BENCHMARK] Results written to {args.output}", file=sys.stderr)
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
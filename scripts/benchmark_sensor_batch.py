@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Compare memory and throughput of List[SensorData] against SensorDataBatch.
+
+Generates a synthetic pull (default: 10 days, 3 nodes, one reading per
+minute) and measures, for both representations:
+  - memory held after construction (tracemalloc)
+  - time to build it
+  - time to turn it into the resampled 15-minute temperature series the
+    SARIMA model trains on
+
+Usage:
+    python scripts/benchmark_sensor_batch.py [--days 10] [--devices 3] [--interval-seconds 60]
+"""
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from domain.entities.sensor_data import SensorData
+from domain.entities.sensor_data_batch import SensorDataBatch
+
+
+def generate_columns(days: int, devices: int, interval_seconds: int):
+    """Synthetic readings as plain Python columns, like a parsed TTS export"""
+    rng = np.random.default_rng(42)
+    start = datetime(2025, 10, 1, tzinfo=timezone.utc)
+    per_device = days * 86400 // interval_seconds
+
+    timestamps, device_ids = [], []
+    for device in range(devices):
+        offset = timedelta(seconds=device * 7)
+        timestamps.extend(start + offset + timedelta(seconds=i * interval_seconds) for i in range(per_device))
+        device_ids.extend([f"nodo-lora-ud-{device + 1}"] * per_device)
+
+    size = len(timestamps)
+    temperature = (10 + 5 * np.sin(np.arange(size) / 240) + rng.normal(0, 0.5, size)).tolist()
+    humidity = rng.uniform(60, 95, size).tolist()
+    wind_speed = rng.uniform(0, 6, size).tolist()
+    return timestamps, device_ids, temperature, humidity, wind_speed
+
+
+def measure(label: str, build):
+    """Build a representation and report the memory it holds and the build time"""
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    value = build()
+    elapsed = time.perf_counter() - start
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:28s} {held / 1024 / 1024:8.2f} MiB   built in {elapsed:6.3f}s")
+    return value
+
+
+def temperature_series(frame: pd.DataFrame) -> pd.Series:
+    """Same preparation as SARIMAModelService._prepare_data"""
+    df = frame[['timestamp', 'temperature']].sort_values('timestamp').set_index('timestamp')
+    return df.resample('15min').mean().interpolate()['temperature']
+
+
+def frame_from_readings(readings) -> pd.DataFrame:
+    """How the models built a frame from entities before SensorDataBatch"""
+    return pd.DataFrame([
+        {'timestamp': data.timestamp, 'temperature': data.temperature}
+        for data in readings
+    ])
+
+
+def time_it(label: str, func, repeat: int = 3) -> float:
+    best = min(_timed(func) for _ in range(repeat))
+    print(f"  {label:28s} {best:6.3f}s")
+    return best
+
+
+def _timed(func) -> float:
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SensorData lists against SensorDataBatch")
+    parser.add_argument("--days", type=int, default=10)
+    parser.add_argument("--devices", type=int, default=3)
+    parser.add_argument("--interval-seconds", type=int, default=60)
+    args = parser.parse_args()
+
+    columns = generate_columns(args.days, args.devices, args.interval_seconds)
+    size = len(columns[0])
+
+    print("="*70)
+    print(f"SENSOR DATA REPRESENTATION BENCHMARK ({size:,} readings)")
+    print("="*70)
+
+    print("\nMemory held after construction:")
+    readings = measure("List[SensorData]", lambda: [
+        SensorData(temperature=t, humidity=h, wind_speed=w, timestamp=ts, device_id=d)
+        for ts, d, t, h, w in zip(*columns)
+    ])
+    batch = measure("SensorDataBatch", lambda: SensorDataBatch.from_columns(*columns))
+    print(f"  {'(batch column arrays)':28s} {batch.nbytes / 1024 / 1024:8.2f} MiB")
+
+    print("\nReadings -> 15-min temperature series (best of 3):")
+    list_time = time_it("List[SensorData]", lambda: temperature_series(frame_from_readings(readings)))
+    batch_time = time_it("SensorDataBatch", lambda: temperature_series(batch.to_frame()))
+    print(f"  Speedup: {list_time / batch_time:.1f}x")
+
+    print("\nOther batch operations (best of 3):")
+    time_it("sorted_by_time", batch.sorted_by_time)
+    time_it("for_device", lambda: batch.for_device("nodo-lora-ud-1"))
+    time_it("to_readings (materialize)", batch.to_readings, repeat=1)
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Measure how quickly the API starts serving.
+
+Each measurement runs in a fresh interpreter, best of --repeat:
+  - lazy import:   `import main` as uvicorn does it (components built on first use)
+  - eager boot:    `import main`, then every component built and the ML
+                   libraries imported up front, as the app used to boot
+  - first /health: uvicorn started on a free port until GET /health answers
+
+Usage:
+    python scripts/benchmark_startup.py [--repeat 3] [--skip-server]
+"""
+import argparse
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+LAZY_IMPORT = """
+import time
+start = time.perf_counter()
+import main
+print(time.perf_counter() - start)
+"""
+
+EAGER_BOOT = """
+import time
+start = time.perf_counter()
+import main
+main.dependencies.build_all()
+main.dependencies.warm_up()
+try:
+    import tensorflow  # Imported by the LSTM service before it served through NumPy
+except ImportError:
+    pass
+print(time.perf_counter() - start)
+"""
+
+
+def run_snippet(code: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_health(timeout: float = 60.0) -> float:
+    """Seconds from launching uvicorn until /health returns 200"""
+    port = free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        while time.perf_counter() - start < timeout:
+            if server.poll() is not None:
+                raise RuntimeError("uvicorn exited during startup")
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return time.perf_counter() - start
+            except OSError:
+                time.sleep(0.02)
+        raise TimeoutError(f"/health did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+def best(label: str, measure, repeat: int) -> float:
+    value = min(measure() for _ in range(repeat))
+    print(f"  {label:28s} {value:7.2f}s")
+    return value
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark API startup time")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--skip-server", action="store_true", help="Skip the uvicorn /health measurement")
+    args = parser.parse_args()
+
+    print("="*60)
+    print(f"STARTUP BENCHMARK (best of {args.repeat})")
+    print("="*60)
+
+    lazy = best("import main (lazy)", lambda: run_snippet(LAZY_IMPORT), args.repeat)
+    eager = best("eager boot (previous)", lambda: run_snippet(EAGER_BOOT), args.repeat)
+    print(f"  Lazy import takes {lazy / eager:.0%} of the eager boot")
+
+    if not args.skip_server:
+        health = best("uvicorn -> first /health", time_to_health, args.repeat)
+        print(f"  First /health after {health / eager:.0%} of the eager boot time")
+    print("="*60)
+
+
+if __name__ == "__main__":
+    main()
@@ -35,6 +35,7 @@ def parse_tts_message(message: dict) -> SensorData:
     device_id = message["end_device_ids"]["device_id"]
     received_at = message["received_at"]
     decoded_payload = message["uplink_message"]["decoded_payload"]
+    f_cnt = message["uplink_message"].get("f_cnt")
 
     # Extract sensor readings from decoded payload
     temperature = decoded_payload["temperatura_c"]
@@ -49,7 +50,8 @@ def parse_tts_message(message: dict) -> SensorData:
         humidity=float(humidity),
         wind_speed=float(wind_speed),
         timestamp=timestamp,
-        device_id=device_id
+        device_id=device_id,
+        f_cnt=int(f_cnt) if f_cnt is not None else None
     )
 
 
@@ -64,40 +66,13 @@ def load_json_file(file_path: str) -> list:
 
 def import_data_batch(database: PostgresSensorDatabase, sensor_data_list: list):
     """
-    Import a batch of sensor data using a single connection.
+    Import a batch of sensor data with a single bulk COPY.
 
     Args:
         database: PostgreSQL database instance
         sensor_data_list: List of SensorData objects to insert
     """
-    import psycopg2
-
-    conn = psycopg2.connect(database.database_url, connect_timeout=30)
-    try:
-        with conn.cursor() as cursor:
-            # Insert all records in a single transaction
-            for sensor_data in sensor_data_list:
-                cursor.execute("""
-                    INSERT INTO sensor_data
-                    (id, device_id, temperature, humidity, wind_speed, timestamp, created_at)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (id) DO NOTHING
-                """, (
-                    str(sensor_data.id),
-                    sensor_data.device_id,
-                    sensor_data.temperature,
-                    sensor_data.humidity,
-                    sensor_data.wind_speed,
-                    sensor_data.timestamp,
-                    datetime.utcnow()
-                ))
-        conn.commit()
-        return len(sensor_data_list)
-    except Exception as e:
-        conn.rollback()
-        raise e
-    finally:
-        conn.close()
+    return database.save_sensor_data_batch(sensor_data_list)
 
 
 def import_data_from_files(database: PostgresSensorDatabase, file_paths: list):
@@ -5,6 +5,7 @@ Import TTS webhook messages from JSON file to PostgreSQL database
 import sys
 import os
 import json
+import time
 from pathlib import Path
 from datetime import datetime
 
@@ -21,6 +22,7 @@ def parse_tts_message(message: dict) -> SensorData:
     device_id = message.get("end_device_ids", {}).get("device_id", "unknown")
     received_at = message.get("received_at")
     decoded_payload = message.get("uplink_message", {}).get("decoded_payload", {})
+    f_cnt = message.get("uplink_message", {}).get("f_cnt")
 
     # Parse timestamp
     timestamp = datetime.fromisoformat(received_at.replace('Z', '+00:00'))
@@ -35,7 +37,8 @@ def parse_tts_message(message: dict) -> SensorData:
         humidity=float(humidity),
         wind_speed=float(wind_speed),
         timestamp=timestamp,
-        device_id=device_id
+        device_id=device_id,
+        f_cnt=int(f_cnt) if f_cnt is not None else None
     )
 
 
@@ -82,28 +85,25 @@ def import_json_file(json_file_path: str, database_url: str):
     db = PostgresSensorDatabase(database_url=database_url)
     print("✓ Connected")
 
-    # Parse and import messages
+    # Parse messages, then import them with a single bulk COPY
     print(f"\n[3/4] Importing {len(filtered_messages)} messages...")
     imported_count = 0
     error_count = 0
     skipped_count = 0
+    sensor_data_list = []
 
     for i, message in enumerate(filtered_messages, 1):
         try:
-            sensor_data = parse_tts_message(message)
-            db.save_sensor_data(sensor_data)
-            imported_count += 1
-
-            # Show progress every 50 messages
-            if i % 50 == 0 or i == len(filtered_messages):
-                print(f"  Progress: {i}/{len(filtered_messages)} ({(i/len(filtered_messages))*100:.1f}%)")
+            sensor_data_list.append(parse_tts_message(message))
         except Exception as e:
-            # Check if it's a duplicate (already exists)
-            if "duplicate key" in str(e).lower():
-                skipped_count += 1
-            else:
-                error_count += 1
-                print(f"  ✗ Error on message {i}: {e}")
+            error_count += 1
+            print(f"  ✗ Error parsing message {i}: {e}")
+
+    if sensor_data_list:
+        import_start = time.time()
+        imported_count = db.save_sensor_data_batch(sensor_data_list)
+        skipped_count = len(sensor_data_list) - imported_count
+        print(f"  Bulk import of {len(sensor_data_list)} readings took {time.time() - import_start:.2f}s")
 
     # Summary
     print("\n[4/4] Import complete!")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Apply versioned schema migrations and manage sensor_data partitions.
+
+Usage:
+    python scripts/migrate_database.py                       # apply pending migrations
+    python scripts/migrate_database.py --drop-before 2025-01 # also drop partitions older than Jan 2025
+    python scripts/migrate_database.py --refresh-rollups     # recompute all rollups from raw readings
+"""
+import argparse
+import os
+import sys
+from datetime import date
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.database.connection_pool import PostgresConnectionPool
+from infrastructure.database.migrations import MIGRATIONS, SchemaMigrator
+from infrastructure.database.partitions import list_month_partitions, partition_name
+from infrastructure.database.postgres_database import PostgresSensorDatabase
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Apply schema migrations and manage partitions")
+    parser.add_argument("--drop-before", metavar="YYYY-MM",
+                        help="Drop sensor_data partitions for months before this one")
+    parser.add_argument("--refresh-rollups", action="store_true",
+                        help="Recompute every sensor_data_rollups bucket from raw readings")
+    args = parser.parse_args()
+
+    database_url = os.getenv("DATABASE_URL")
+    if not database_url:
+        print("\n❌ ERROR: DATABASE_URL environment variable not set!")
+        print("Please set it to your PostgreSQL connection string.")
+        sys.exit(1)
+
+    pool = PostgresConnectionPool(database_url, min_size=0, max_size=2)
+    migrator = SchemaMigrator(pool)
+
+    print("="*70)
+    print("DATABASE MIGRATIONS")
+    print("="*70)
+    print(f"Current schema version: {migrator.current_version()}")
+    print(f"Latest schema version:  {MIGRATIONS[-1].version}\n")
+
+    applied = migrator.migrate()
+    if applied:
+        print(f"✓ Applied migrations: {', '.join(str(v) for v in applied)}")
+    else:
+        print("✓ Schema already up to date")
+
+    database = PostgresSensorDatabase(database_url, pool=pool, migrator=migrator)
+
+    if args.refresh_rollups:
+        written = database.refresh_rollups()
+        print(f"✓ Refreshed {written} rollup buckets")
+
+    if args.drop_before:
+        year, month = args.drop_before.split("-")
+        cutoff = date(int(year), int(month), 1)
+        dropped = database.drop_partitions_before(cutoff)
+        for name in dropped:
+            print(f"  ✗ Dropped {name}")
+
+    with pool.connection() as conn:
+        with conn.cursor() as cursor:
+            months = list_month_partitions(cursor)
+
+    print(f"\nsensor_data partitions ({len(months)}):")
+    for month in months:
+        print(f"  {partition_name(month)}")
+
+    pool.close()
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
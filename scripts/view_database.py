@@ -69,25 +69,24 @@ def view_database():
                   f"Temp: {data.temperature:5.1f}°C | "
                   f"Humidity: {data.humidity:5.1f}% | Wind: {data.wind_speed:5.1f} m/s")
 
-    # Get data from last 7 days
+    # Last 7 days from the hourly rollups instead of every raw reading
     start_time_week = end_time - timedelta(days=7)
-    week_data = db.get_sensor_data_in_range(start_time_week, end_time)
+    week_rollups = db.get_rollup_frame(start_time_week, end_time, resolution="1h")
+    week_count = int(week_rollups['reading_count'].sum()) if not week_rollups.empty else 0
 
     print(f"\n" + "-"*80)
-    print(f"Last 7 days: {len(week_data)} data points")
+    print(f"Last 7 days: {week_count} data points")
     print("-"*80)
 
-    if week_data:
-        print(f"  First: {week_data[0].timestamp}")
-        print(f"  Last:  {week_data[-1].timestamp}")
-
-        # Calculate some stats
-        temps = [d.temperature for d in week_data]
-        if temps:
-            print(f"\nTemperature Statistics (Last 7 days):")
-            print(f"  Min:     {min(temps):.1f}°C")
-            print(f"  Max:     {max(temps):.1f}°C")
-            print(f"  Average: {sum(temps)/len(temps):.1f}°C")
+    if week_count:
+        print(f"  First bucket: {week_rollups['timestamp'].min()}")
+        print(f"  Last bucket:  {week_rollups['timestamp'].max()}")
+
+        weighted_sum = (week_rollups['temperature'] * week_rollups['reading_count']).sum()
+        print(f"\nTemperature Statistics (Last 7 days):")
+        print(f"  Min:     {week_rollups['temperature_min'].min():.1f}°C")
+        print(f"  Max:     {week_rollups['temperature_max'].max():.1f}°C")
+        print(f"  Average: {weighted_sum / week_count:.1f}°C")
 
     print("\n" + "="*80 + "\n")
 
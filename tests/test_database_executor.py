@@ -0,0 +1,44 @@
+import asyncio
+import time
+
+from infrastructure.database.database_executor import DatabaseExecutor
+
+
+class SlowRepository:
+    """Repository whose blocking database call takes half a second"""
+
+    def __init__(self, executor: DatabaseExecutor):
+        self.executor = executor
+
+    def _query(self) -> str:
+        time.sleep(0.5)
+        return "rows"
+
+    async def get(self) -> str:
+        return await self.executor.run(self._query)
+
+
+async def _max_tick_latency(repository: SlowRepository) -> float:
+    """Run the slow query alongside a 10 ms ticker and return the ticker's worst lateness"""
+    latencies = []
+
+    async def ticker():
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(0.01)
+            latencies.append(time.perf_counter() - start - 0.01)
+
+    task = asyncio.create_task(ticker())
+    assert await repository.get() == "rows"
+    task.cancel()
+    return max(latencies)
+
+
+def test_blocking_query_does_not_stall_event_loop():
+    executor = DatabaseExecutor(max_workers=2)
+    try:
+        latency = asyncio.run(_max_tick_latency(SlowRepository(executor)))
+    finally:
+        executor.shutdown()
+
+    assert latency < 0.1
@@ -0,0 +1,12 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from infrastructure.models.lstm_model import LSTMModelService
+
+
+def test_unsupported_horizon_raises_instead_of_a_neutral_probability():
+    service = LSTMModelService()
+    with pytest.raises(ValueError, match=r"\[2\]"):
+        asyncio.run(service.predict_frost_horizons(pd.DataFrame(), horizons=(1, 2)))
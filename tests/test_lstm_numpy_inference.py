@@ -0,0 +1,148 @@
+"""
+The NumPy LSTM inference engine must reproduce the Keras network it was exported from
+
+fixtures/lstm_keras_reference.npz holds the layer weights and configuration of the
+production network (build_lstm_model) with random weights, random input windows and
+the Keras predictions for them, so the export and forward pass are checked without
+TensorFlow. Regenerate it with TensorFlow installed:
+
+    python tests/test_lstm_numpy_inference.py
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from infrastructure.models.lstm_inference import NumpyLSTM
+from infrastructure.models.lstm_model import LSTMModelService
+
+FIXTURE = Path(__file__).parent / "fixtures" / "lstm_keras_reference.npz"
+TOLERANCE = 1e-5
+
+
+# Stand-ins for the Keras layer classes; NumpyLSTM.from_keras dispatches on the class name
+class _Layer:
+    def __init__(self, weights, config):
+        self._weights = weights
+        self._config = config
+
+    def get_weights(self):
+        return self._weights
+
+    def get_config(self):
+        return self._config
+
+
+class LSTM(_Layer):
+    pass
+
+
+class Dense(_Layer):
+    pass
+
+
+class Dropout(_Layer):
+    pass
+
+
+class _Sequential:
+    def __init__(self, layers):
+        self.layers = layers
+
+
+def _random_keras_model(rng: np.random.Generator):
+    from infrastructure.models.lstm_training import build_lstm_model
+
+    service = LSTMModelService()
+    model = build_lstm_model(service.sequence_length, service.n_features)
+    # Random weights on the scale of a trained network; both sides compute in float32
+    model.set_weights([rng.normal(0, 0.2, w.shape).astype(np.float32) for w in model.get_weights()])
+    return model
+
+
+def _random_windows(rng: np.random.Generator, count: int) -> np.ndarray:
+    service = LSTMModelService()
+    return rng.uniform(0, 1, (count, service.sequence_length, service.n_features)).astype(np.float32)
+
+
+def _load_reference():
+    """Keras-like model rebuilt from the fixture, its input windows and the Keras predictions"""
+    layer_types = {"LSTM": LSTM, "Dense": Dense, "Dropout": Dropout}
+    with np.load(FIXTURE) as reference:
+        layers = []
+        for index, kind in enumerate(reference["layer_kinds"]):
+            kind = str(kind)
+            weights = [reference[f"layer_{index}_weight_{i}"] for i in range(int(reference[f"layer_{index}_weights"]))]
+            config = {
+                key: str(reference[f"layer_{index}_{key}"])
+                for key in ("activation", "recurrent_activation")
+                if f"layer_{index}_{key}" in reference.files
+            }
+            layers.append(layer_types[kind](weights, config))
+        return _Sequential(layers), reference["windows"], reference["expected"]
+
+
+def _assert_matches(engine: NumpyLSTM, windows: np.ndarray, expected: np.ndarray) -> None:
+    actual = engine.predict(windows)
+    assert actual.shape == expected.shape
+    np.testing.assert_allclose(actual, expected, atol=TOLERANCE)
+    np.testing.assert_allclose(engine.predict(windows[0]), expected[:1], atol=TOLERANCE)
+
+
+def test_numpy_inference_matches_keras_reference(tmp_path):
+    model, windows, expected = _load_reference()
+
+    # Export and round-trip through the .npz file, exactly as after training
+    path = tmp_path / LSTMModelService.WEIGHTS_FILE
+    NumpyLSTM.from_keras(model).save(path)
+
+    _assert_matches(NumpyLSTM.load(path), windows, expected)
+
+
+def test_numpy_inference_matches_keras(tmp_path):
+    pytest.importorskip("tensorflow")
+    rng = np.random.default_rng(42)
+    model = _random_keras_model(rng)
+
+    path = tmp_path / LSTMModelService.WEIGHTS_FILE
+    NumpyLSTM.from_keras(model).save(path)
+
+    windows = _random_windows(rng, 256)
+    _assert_matches(NumpyLSTM.load(path), windows, model.predict(windows, verbose=0))
+
+
+def write_reference(path: Path = FIXTURE, windows: int = 8, seed: int = 7) -> None:
+    """Record a random production network and its Keras predictions (needs TensorFlow)"""
+    import tensorflow as tf
+
+    rng = np.random.default_rng(seed)
+    model = _random_keras_model(rng)
+    inputs = _random_windows(rng, windows)
+
+    arrays = {
+        "layer_kinds": np.array([type(layer).__name__ for layer in model.layers]),
+        "windows": inputs,
+        "expected": model.predict(inputs, verbose=0),
+        "tensorflow_version": np.array(tf.__version__),
+    }
+    for index, layer in enumerate(model.layers):
+        weights = layer.get_weights()
+        arrays[f"layer_{index}_weights"] = np.array(len(weights))
+        for i, weight in enumerate(weights):
+            arrays[f"layer_{index}_weight_{i}"] = weight
+        config = layer.get_config()
+        for key in ("activation", "recurrent_activation"):
+            if key in config:
+                arrays[f"layer_{index}_{key}"] = np.array(config[key])
+
+    path.parent.mkdir(exist_ok=True)
+    with open(path, "wb") as f:
+        np.savez_compressed(f, **arrays)
+    print(f"Wrote {path} ({path.stat().st_size / 1024:.1f} KiB, TensorFlow {tf.__version__})")
+
+
+if __name__ == "__main__":
+    write_reference()
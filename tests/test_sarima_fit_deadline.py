@@ -0,0 +1,53 @@
+import signal
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from statsmodels.tsa.statespace.sarimax import SARIMAX
+
+from infrastructure.models.sarima_model import FitTimeout, fit_sarima
+
+
+def _series() -> pd.Series:
+    index = pd.date_range("2026-07-01", periods=4 * 24 * 4, freq="15min")
+    rng = np.random.default_rng(0)
+    return pd.Series(5 + 5 * np.sin(np.arange(len(index)) / 96 * 2 * np.pi) + rng.normal(0, 0.3, len(index)), index)
+
+
+@pytest.fixture
+def slow_likelihood(monkeypatch):
+    """Every likelihood evaluation takes 2 seconds"""
+    loglike = SARIMAX.loglike
+
+    def slow(self, *args, **kwargs):
+        time.sleep(2)
+        return loglike(self, *args, **kwargs)
+
+    monkeypatch.setattr(SARIMAX, "loglike", slow)
+
+
+def test_time_limit_interrupts_a_slow_likelihood_evaluation(slow_likelihood):
+    start = time.time()
+    with pytest.raises(FitTimeout):
+        fit_sarima(_series(), time_limit=0.5)
+    assert time.time() - start < 1.5  # Interrupted inside the first evaluation
+
+
+def test_time_limit_on_a_thread_falls_back_to_iteration_checks():
+    # No signals off the main thread: the limit is checked between optimizer iterations
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        with pytest.raises(FitTimeout):
+            executor.submit(fit_sarima, _series(), time_limit=0.0).result()
+
+
+def test_fit_within_limit_restores_the_alarm_handler():
+    handler = signal.getsignal(signal.SIGALRM)
+    fitted, _ = fit_sarima(_series(), time_limit=60)
+    assert np.isfinite(fitted.aic)
+    assert signal.getsignal(signal.SIGALRM) is handler
+    assert signal.getitimer(signal.ITIMER_REAL) == (0.0, 0.0)
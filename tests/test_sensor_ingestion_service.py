@@ -0,0 +1,57 @@
+import asyncio
+from datetime import datetime
+
+from application.services.sensor_ingestion_service import SensorIngestionService
+from domain.entities.sensor_data import SensorData
+
+
+class SlowRepository:
+    """Saves batches after a delay, failing the first fail_times attempts"""
+
+    def __init__(self, fail_times: int = 0):
+        self.fail_times = fail_times
+        self.saved = []
+
+    async def save_sensor_data_batch(self, batch):
+        await asyncio.sleep(0.1)
+        if self.fail_times:
+            self.fail_times -= 1
+            raise ConnectionError("database unavailable")
+        self.saved.extend(batch)
+        return len(batch)
+
+
+def _reading(minute: int) -> SensorData:
+    return SensorData(
+        temperature=1.0, humidity=80.0, wind_speed=2.0,
+        timestamp=datetime(2026, 7, 1, 3, minute), device_id="nodo-lora-ud-1", f_cnt=minute
+    )
+
+
+async def _stop_during_flush(repository: SlowRepository):
+    notified = []
+    service = SensorIngestionService(repository, batch_size=3, flush_interval=0.01, on_reading=notified.append)
+    await service.start()
+    for minute in range(3):
+        service.enqueue(_reading(minute))
+    await asyncio.sleep(0.05)  # The batch is now being written
+    assert service.stats()["pending"] == 3 and not notified
+    await service.stop()
+    return service.stats(), notified
+
+
+def test_stop_waits_for_the_batch_in_flight():
+    repository = SlowRepository()
+    stats, notified = asyncio.run(_stop_during_flush(repository))
+
+    assert len(repository.saved) == 3
+    assert stats["flushed"] == 3 and stats["dropped"] == 0 and stats["pending"] == 0
+    assert [reading.f_cnt for reading in notified] == [0, 1, 2]  # Only after the save
+
+
+def test_failed_batch_in_flight_is_retried_on_stop():
+    repository = SlowRepository(fail_times=1)
+    stats, notified = asyncio.run(_stop_during_flush(repository))
+
+    assert len(repository.saved) == 3
+    assert stats["flushed"] == 3 and stats["failed_flushes"] == 1 and stats["pending"] == 0
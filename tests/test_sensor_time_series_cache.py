@@ -0,0 +1,95 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+from application.services.device_model_registry import DeviceModelRegistry
+from application.services.feature_store import FeatureStore
+from application.use_cases.generate_frost_prediction import GenerateFrostPredictionUseCase
+from domain.entities.prediction import FORECAST_HORIZONS
+from domain.services.ml_model_service import MLModelService
+from infrastructure.cache.sensor_time_series_cache import SensorTimeSeriesCache
+from infrastructure.database.database_executor import DatabaseExecutor
+from infrastructure.repositories.database_sensor_data_repository import DatabaseSensorDataRepository
+from infrastructure.repositories.memory_prediction_repository import MemoryPredictionRepository
+
+DEVICES = ("nodo-lora-ud-1", "nodo-lora-ud-6")
+MEASUREMENTS = ("temperature", "humidity", "wind_speed")
+
+
+class FakeRollupDatabase:
+    """Answers get_rollup_frame with synthetic buckets and records every query"""
+
+    def __init__(self):
+        self.queries = []
+
+    def get_rollup_frame(self, start_time, end_time, resolution="15min", device_id=None, combine_devices=False):
+        self.queries.append((resolution, start_time, end_time))
+        buckets = pd.date_range(
+            pd.Timestamp(start_time).tz_convert("UTC").floor(resolution), pd.Timestamp(end_time).tz_convert("UTC"),
+            freq=resolution
+        )
+        devices = [device_id] if device_id else list(DEVICES)
+        timestamps = np.repeat(buckets, len(devices))
+        temperature = (5 + 5 * np.sin(timestamps.asi8 / 3.6e9 / 24 * 2 * np.pi)).astype(np.float32)
+        frame = pd.DataFrame({
+            "timestamp": timestamps,
+            "device_id": pd.Categorical(np.tile(devices, len(buckets))),
+            "reading_count": np.full(len(timestamps), 3, dtype=np.int32),
+        })
+        for m, values in zip(MEASUREMENTS, (temperature, np.float32(70), np.float32(2))):
+            frame[f"{m}_min"] = frame[f"{m}_max"] = frame[m] = np.broadcast_to(values, len(frame)).astype(np.float32)
+        return frame
+
+
+class StubModel(MLModelService):
+    is_trained = True
+
+    async def predict_frost_horizons(self, sensor_data, horizons: Sequence[int] = FORECAST_HORIZONS) -> Dict[int, float]:
+        return {hours: 0.2 for hours in horizons}
+
+    async def train_model(self, sensor_data) -> None:
+        pass
+
+    async def retrain(self, sensor_data) -> bool:
+        return False
+
+
+def test_repeat_prediction_queries_only_new_buckets():
+    database = FakeRollupDatabase()
+    executor = DatabaseExecutor(max_workers=1)
+    lateness = timedelta(hours=1)
+    repository = DatabaseSensorDataRepository(
+        database, executor, cache=SensorTimeSeriesCache(retention=timedelta(days=11)), cache_lateness=lateness
+    )
+    use_case = GenerateFrostPredictionUseCase(
+        repository,
+        MemoryPredictionRepository(),
+        DeviceModelRegistry(lambda device: StubModel(), lambda device: StubModel()),
+        FeatureStore(),
+    )
+
+    try:
+        first_run = datetime.now(timezone.utc)
+        asyncio.run(use_case.execute())
+        seeds = list(database.queries)
+        database.queries.clear()
+        asyncio.run(use_case.execute())
+        deltas = list(database.queries)
+    finally:
+        executor.shutdown()
+
+    # The first run loads each resolution's window once, the second only what changed since
+    assert sorted(resolution for resolution, _, _ in seeds) == ["15min", "5min"]
+    assert all(end - start >= timedelta(days=10) for _, start, end in seeds)
+    assert sorted(resolution for resolution, _, _ in deltas) == ["15min", "5min"]
+    assert all(start >= first_run - lateness for _, start, _ in deltas)
+
+    # Cached frames match what the database returns for the same range
+    now = datetime.utcnow()
+    start = now - timedelta(days=10)
+    cached = repository.cache.get_frame("15min", start, now)
+    expected = database.get_rollup_frame(start.replace(tzinfo=timezone.utc), now.replace(tzinfo=timezone.utc))
+    pd.testing.assert_frame_equal(cached, expected.iloc[:len(cached)], check_categorical=False)